@@ -13,6 +13,17 @@ class UBIO_AddonPreferences(bpy.types.AddonPreferences):
         subtype='DIR_PATH',
         default='D:\\UE5Projects\\TargetProject\\'
     )
+    enable_cprofile: bpy.props.BoolProperty(
+        name=msgid("pref.enable_cprofile.name"),
+        description=msgid("pref.enable_cprofile.desc"),
+        default=False,
+    )
+    profile_dir: bpy.props.StringProperty(
+        name=msgid("pref.profile_dir.name"),
+        description=msgid("pref.profile_dir.desc"),
+        subtype='DIR_PATH',
+        default='',
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -20,6 +31,9 @@ class UBIO_AddonPreferences(bpy.types.AddonPreferences):
 
         layout.operator(UBIO_OT_CopyAssets.bl_idname)
         layout.separator()
+        layout.prop(self, "enable_cprofile")
+        layout.prop(self, "profile_dir")
+        layout.separator()
         box = layout.box()
         box.label(text=msgid("pref.guide.title"))
         box.label(text=msgid("pref.guide.step1"))
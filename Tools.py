@@ -1,13 +1,14 @@
 import bpy
 import blf
-from mathutils import Vector
+import numpy as np
 from bpy.props import EnumProperty
 from .util import (
     Const,
     find_level_asset_coll,
     set_proxy_pivot_properties,
-    get_transform_from_obj,
-    set_actor_transform,
+    blender_to_ue_transform_array,
+    read_obj_transform_array,
+    set_actor_transforms,
 )
 from .i18n import msgid, tr
 
@@ -165,45 +166,20 @@ class UBIO_OT_MirrorCopyActors(bpy.types.Operator):
         else:
             self.report({'ERROR'}, tr("report.tools.unknown_mirror_axis", axis=axis))
             return
+        # 批量计算镜像后的transform：位置按轴心镜像，缩放按轴取反，UE旋转对另外两个轴取反
+        mirror = np.array(mirror_vec, dtype=np.float64)
+        pivot_location = np.array(self.proxy_pivot.location, dtype=np.float64)
+        blender_values = read_obj_transform_array(self.selected_objs)
+        ue_rotations = blender_to_ue_transform_array(blender_values)[:, 3:6]
+        blender_values[:, 0:3] = pivot_location + (blender_values[:, 0:3] - pivot_location) * mirror
+        blender_values[:, 6:9] *= mirror
+        mirrored_values = blender_to_ue_transform_array(blender_values)
+        mirrored_values[:, 3:6] = ue_rotations * -mirror
         self.mirrored_objs = []
         for obj in self.selected_objs:
-            rel_loc = obj.location - self.proxy_pivot.location
-            mirrored_loc = self.proxy_pivot.location + Vector((
-                rel_loc.x * mirror_vec[0],
-                rel_loc.y * mirror_vec[1],
-                rel_loc.z * mirror_vec[2],
-            ))
             new_obj = obj.copy()
             if obj.data:
                 new_obj.data = obj.data.copy()
-            orig_transform = get_transform_from_obj(obj)
-            mirrored_transform = {
-                "location": {
-                    "x": mirrored_loc.x * 100,
-                    "y": -mirrored_loc.y * 100,
-                    "z": mirrored_loc.z * 100
-                },
-                "rotation": {
-                    "x": orig_transform["rotation"]["x"],
-                    "y": orig_transform["rotation"]["y"],
-                    "z": orig_transform["rotation"]["z"]
-                },
-                "scale": {
-                    "x": obj.scale.x * mirror_vec[0],
-                    "y": obj.scale.y * mirror_vec[1],
-                    "z": obj.scale.z * mirror_vec[2]
-                }
-            }
-            if axis == 'X':
-                mirrored_transform["rotation"]["y"] = -mirrored_transform["rotation"]["y"]
-                mirrored_transform["rotation"]["z"] = -mirrored_transform["rotation"]["z"]
-            elif axis == 'Y':
-                mirrored_transform["rotation"]["x"] = -mirrored_transform["rotation"]["x"]
-                mirrored_transform["rotation"]["z"] = -mirrored_transform["rotation"]["z"]
-            elif axis == 'Z':
-                mirrored_transform["rotation"]["x"] = -mirrored_transform["rotation"]["x"]
-                mirrored_transform["rotation"]["y"] = -mirrored_transform["rotation"]["y"]
-            set_actor_transform(new_obj, mirrored_transform)
             for key in obj.keys():
                 if key not in {'_RNA_UI'}:
                     value = obj[key]
@@ -211,6 +187,7 @@ class UBIO_OT_MirrorCopyActors(bpy.types.Operator):
                         new_obj[key] = value
             self.level_asset_coll.objects.link(new_obj)
             self.mirrored_objs.append(new_obj)
+        set_actor_transforms(self.mirrored_objs, mirrored_values)
         for o in self.mirrored_objs:
             o.select_set(True)
         for obj in self.selected_objs:
@@ -1,16 +1,19 @@
 import bpy
 import os
 from bpy.props import (
-    # BoolProperty,
-    # EnumProperty,
-    # FloatProperty,
-    # FloatVectorProperty,
-    # IntProperty,
+    BoolProperty,
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty,
+    IntVectorProperty,
     StringProperty,
 )
 from bpy.types import PropertyGroup
 from .util import Const
 from .i18n import msgid
+from .live_sync import get_live_sync_session
+from .export_watcher import update_watch_exports
 
 
 
@@ -33,6 +36,102 @@ class UBIO_PG_Params(PropertyGroup):
         
 )
 
+    ubio_import_mode: EnumProperty(
+        name=msgid("prop.import_mode.name"),
+        description=msgid("prop.import_mode.desc"),
+        items=[
+            (Const.IMPORT_MODE_FULL, msgid("prop.import_mode.full.name"), msgid("prop.import_mode.full.desc")),
+            (Const.IMPORT_MODE_PROXY, msgid("prop.import_mode.proxy.name"), msgid("prop.import_mode.proxy.desc")),
+            (Const.IMPORT_MODE_POINTS, msgid("prop.import_mode.points.name"), msgid("prop.import_mode.points.desc")),
+        ],
+        default=Const.IMPORT_MODE_FULL,
+    )
+
+    ubio_level_format: EnumProperty(
+        name=msgid("prop.level_format.name"),
+        description=msgid("prop.level_format.desc"),
+        items=[
+            (Const.LEVEL_FORMAT_FBX, msgid("prop.level_format.fbx.name"), msgid("prop.level_format.fbx.desc")),
+            (Const.LEVEL_FORMAT_USD, msgid("prop.level_format.usd.name"), msgid("prop.level_format.usd.desc")),
+        ],
+        default=Const.LEVEL_FORMAT_FBX,
+    )
+
+    ubio_region_mode: EnumProperty(
+        name=msgid("prop.region_mode.name"),
+        description=msgid("prop.region_mode.desc"),
+        items=[
+            (Const.REGION_MODE_NONE, msgid("prop.region_mode.none.name"), msgid("prop.region_mode.none.desc")),
+            (Const.REGION_MODE_BOX, msgid("prop.region_mode.box.name"), msgid("prop.region_mode.box.desc")),
+            (Const.REGION_MODE_GRID, msgid("prop.region_mode.grid.name"), msgid("prop.region_mode.grid.desc")),
+        ],
+        default=Const.REGION_MODE_NONE,
+    )
+
+    ubio_region_min: FloatVectorProperty(
+        name=msgid("prop.region_min.name"),
+        description=msgid("prop.region_min.desc"),
+        size=3,
+        subtype="TRANSLATION",
+        default=(-100.0, -100.0, -100.0),
+    )
+
+    ubio_region_max: FloatVectorProperty(
+        name=msgid("prop.region_max.name"),
+        description=msgid("prop.region_max.desc"),
+        size=3,
+        subtype="TRANSLATION",
+        default=(100.0, 100.0, 100.0),
+    )
+
+    ubio_region_cell_size: FloatProperty(
+        name=msgid("prop.region_cell_size.name"),
+        description=msgid("prop.region_cell_size.desc"),
+        default=256.0,
+        min=1.0,
+        subtype="DISTANCE",
+    )
+
+    ubio_region_cell: IntVectorProperty(
+        name=msgid("prop.region_cell.name"),
+        description=msgid("prop.region_cell.desc"),
+        size=2,
+        default=(0, 0),
+    )
+
+    ubio_share_blueprint_instances: BoolProperty(
+        name=msgid("prop.share_blueprint_instances.name"),
+        description=msgid("prop.share_blueprint_instances.desc"),
+        default=False,
+    )
+
+    ubio_dedup_meshes: BoolProperty(
+        name=msgid("prop.dedup_meshes.name"),
+        description=msgid("prop.dedup_meshes.desc"),
+        default=False,
+    )
+
+    ubio_incremental_import: BoolProperty(
+        name=msgid("prop.incremental_import.name"),
+        description=msgid("prop.incremental_import.desc"),
+        default=False,
+    )
+
+    ubio_watch_exports: BoolProperty(
+        name=msgid("prop.watch_exports.name"),
+        description=msgid("prop.watch_exports.desc"),
+        default=False,
+        update=update_watch_exports,
+    )
+
+    ubio_live_sync_port: IntProperty(
+        name=msgid("prop.live_sync_port.name"),
+        description=msgid("prop.live_sync_port.desc"),
+        default=Const.LIVE_SYNC_PORT,
+        min=1024,
+        max=65535,
+    )
+
     ubio_ue_project_path: StringProperty(
         name=msgid("prop.ue_project_path.name"),
         description=msgid("prop.ue_project_path.desc"),
@@ -70,7 +169,34 @@ class UBIO_PT_ToolPanel(bpy.types.Panel):
         
         box_column.operator("ubio.import_latest_unreal_scene", icon="IMPORT")
         box_column.operator("ubio.import_unreal_scene", icon="IMPORT")
+        box_column.prop(parameters, "ubio_watch_exports")
+        box_column.prop(parameters, "ubio_import_mode")
+        box_column.prop(parameters, "ubio_level_format")
+        box_column.operator("ubio.expand_proxy_actors", icon="MESH_CUBE")
+        point_row = box_column.row(align=True)
+        point_row.operator("ubio.collapse_point_instances", icon="PARTICLE_POINT")
+        point_row.operator("ubio.expand_point_instances", icon="OUTLINER_OB_POINTCLOUD")
+        box_column.prop(parameters, "ubio_share_blueprint_instances")
+        box_column.prop(parameters, "ubio_dedup_meshes")
+        box_column.prop(parameters, "ubio_region_mode")
+        if parameters.ubio_region_mode == Const.REGION_MODE_BOX:
+            box_column.prop(parameters, "ubio_region_min")
+            box_column.prop(parameters, "ubio_region_max")
+            box_column.operator("ubio.set_import_region_from_selection", icon="SELECT_SET")
+        elif parameters.ubio_region_mode == Const.REGION_MODE_GRID:
+            box_column.prop(parameters, "ubio_region_cell_size")
+            box_column.prop(parameters, "ubio_region_cell")
+        box_column.prop(parameters, "ubio_incremental_import")
         box_column.operator("ubio.export_unreal_scene_json", icon="EXPORT")
+        is_live_syncing = get_live_sync_session() is not None
+        live_sync_row = box_column.row(align=True)
+        live_sync_row.operator(
+            "ubio.toggle_live_sync",
+            text=msgid("panel.live_sync_stop") if is_live_syncing else msgid("panel.live_sync_start"),
+            icon="LINKED" if is_live_syncing else "UNLINKED",
+            depress=is_live_syncing,
+        )
+        live_sync_row.prop(parameters, "ubio_live_sync_port", text="")
         box_column.operator("ubio.clean_tempfiles", icon="FILE_REFRESH")
 
         static_mesh_box = layout.box()
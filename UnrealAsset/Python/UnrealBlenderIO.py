@@ -1,7 +1,15 @@
 import unreal
 import os
+import sys
+import mmap
 import json
+import math
+import socket
+import struct
+import time
 import traceback
+from array import array
+from contextlib import contextmanager
 from datetime import datetime
 #constants
 DEFAULT_IO_TEMP_DIR = r"C:\Temp\UBIO"
@@ -20,6 +28,42 @@ STATIC_MESH_LOG_PREFIX = "[UBIO StaticMesh]"
 BL_FLAG = "Blender"
 BL_NEW = "NewActor"
 BL_DEL = "Removed"
+BL_MOD = "Modified"
+# Blender按修改导出时设置：没有BL_FLAG的actor未被改动，导入时直接跳过
+BL_DELTA_KEY = "ubio_delta"
+# 场景JSON中float保留的小数位数，与Blender插件 Const.JSON_FLOAT_PRECISION 一致
+JSON_FLOAT_PRECISION = 4
+# 二进制列式场景sidecar，格式与Blender插件 scene_binary.py 一致，修改时需两边同步
+SCENE_BINARY_SIDECAR_ENABLED = True
+SCENE_BINARY_EXT = ".ubioscene"
+SCENE_BINARY_MAGIC = b"UBIOSCN1"
+SCENE_BINARY_VERSION = 1
+SCENE_BINARY_STRING_COLUMNS = ("name", "fname", "fguid", "class", "actor_type")
+SCENE_BINARY_FLAGS = {"": 0, BL_NEW: 1, BL_DEL: 2, BL_MOD: 3}
+SCENE_BINARY_HEADER = struct.Struct("<8sIIII")
+SCENE_BINARY_SECTION = struct.Struct("<24sQQ")
+SCENE_BINARY_TRANSFORM_AXES = (("location", 0.0), ("rotation", 0.0), ("scale", 1.0))
+SCENE_BINARY_BOUNDS_KEYS = ("origin", "extent")
+# 交换目录清单，与Blender插件 util.Const.MANIFEST_* 一致
+MANIFEST_FILE = "ubio_manifest.jsonl"
+MANIFEST_TYPE_SCENE = "scene"
+MANIFEST_TYPE_SESSION = "static_mesh_session"
+MANIFEST_PRIMARY_PATH_KEYS = {MANIFEST_TYPE_SCENE: "json", MANIFEST_TYPE_SESSION: "session_file"}
+MANIFEST_TAIL_BYTES = 64 * 1024
+MANIFEST_COMPACT_BYTES = 1024 * 1024
+MANIFEST_LOCK_FILE = "ubio_manifest.lock"
+MANIFEST_LOCK_WAIT_SECONDS = 2.0
+MANIFEST_LOCK_POLL_SECONDS = 0.05
+MANIFEST_LOCK_STALE_SECONDS = 30.0
+SCENE_STATUS_EXPORTED_FROM_UE = "EXPORTED_FROM_UE"
+
+# 实时同步服务端口与协议版本，与Blender插件 Const.LIVE_SYNC_* 一致
+LIVE_SYNC_HOST = "127.0.0.1"
+LIVE_SYNC_PORT = 27941
+LIVE_SYNC_PROTOCOL = 1
+# 同时导出USD关卡（需启用USD Importer插件），Blender端在关卡格式选择USD时使用
+USD_LEVEL_EXPORT_ENABLED = False
+USD_LEVEL_EXT = ".usdc"
 
 editor_subsys= unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
 level_subsys = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
@@ -66,9 +110,40 @@ def get_static_mesh_edited_fbx_path(session_dir):
     return os.path.join(session_dir, STATIC_MESH_EDITED_FBX)
 
 
-def write_json_file(file_path, data):
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+@contextmanager
+def open_atomic(file_path, mode="w"):
+    """
+    原子写文件：先写同目录临时文件再os.replace，与Blender插件 util.open_atomic 一致，
+    轮询共享目录的另一端不会读到写了一半的文件
+    """
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    encoding = None if "b" in mode else "utf-8"
+    try:
+        with open(temp_path, mode, encoding=encoding) as f:
+            yield f
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def round_json_floats(value, precision=None):
+    """递归地把JSON数据中的float按精度取整，precision为None时原样返回"""
+    if precision is None:
+        return value
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, dict):
+        return {key: round_json_floats(item, precision) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_json_floats(item, precision) for item in value]
+    return value
+
+
+def write_json_file(file_path, data, precision=None):
+    """以紧凑格式原子写入JSON文件，precision为float保留的小数位数"""
+    with open_atomic(file_path) as f:
+        json.dump(round_json_floats(data, precision), f, ensure_ascii=False, separators=(",", ":"))
 
 
 def read_json_file(file_path):
@@ -76,7 +151,340 @@ def read_json_file(file_path):
         return json.load(f)
 
 
+def get_scene_binary_path(json_path):
+    return os.path.splitext(json_path)[0] + SCENE_BINARY_EXT
+
+
+def is_scene_binary_current(json_path):
+    """二进制sidecar存在且不旧于JSON时返回True"""
+    try:
+        binary_mtime = os.stat(get_scene_binary_path(json_path)).st_mtime
+    except OSError:
+        return False
+    try:
+        return binary_mtime >= os.stat(json_path).st_mtime
+    except OSError:
+        return True
+
+
+def _to_little_endian_bytes(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_scene_binary(file_path, header, actors):
+    """
+    写出二进制列式场景文件：transform为float64列，name/fname/fguid/class/actor_type为字符串表
+    Args:
+        file_path (str): 输出路径
+        header (dict): 场景顶层字段（不含actors）
+        actors (list[dict]): actor信息
+    """
+    transforms = array("d")
+    bounds_values = array("d")
+    has_bounds = False
+    flags = array("B")
+    columns = {column: ({}, [], array("I")) for column in SCENE_BINARY_STRING_COLUMNS}
+    extras = {}
+    core_keys = set(SCENE_BINARY_STRING_COLUMNS) | {"transform", "bounds", BL_FLAG}
+    for actor_index, actor in enumerate(actors):
+        for column in SCENE_BINARY_STRING_COLUMNS:
+            lookup, strings, indices = columns[column]
+            value = str(actor.get(column, ""))
+            if value not in lookup:
+                lookup[value] = len(strings)
+                strings.append(value)
+            indices.append(lookup[value])
+        transform = actor.get("transform", {})
+        for key, default in SCENE_BINARY_TRANSFORM_AXES:
+            part = transform.get(key, {})
+            transforms.extend(float(part.get(axis, default)) for axis in ("x", "y", "z"))
+        extra = {key: value for key, value in actor.items() if key not in core_keys}
+        bounds = actor.get("bounds", None)
+        try:
+            values = [float(bounds[key][axis]) for key in SCENE_BINARY_BOUNDS_KEYS for axis in ("x", "y", "z")]
+            has_bounds = True
+        except (KeyError, TypeError, ValueError):
+            values = [math.nan] * 6
+            if bounds is not None:
+                extra["bounds"] = bounds
+        bounds_values.extend(values)
+        flag = actor.get(BL_FLAG, "") or ""
+        if flag in SCENE_BINARY_FLAGS:
+            flags.append(SCENE_BINARY_FLAGS[flag])
+        else:
+            flags.append(0)
+            extra[BL_FLAG] = flag
+        if extra:
+            extras[str(actor_index)] = extra
+
+    sections = [
+        ("meta", json.dumps(header, ensure_ascii=False).encode("utf-8")),
+        ("transform", _to_little_endian_bytes(transforms)),
+        ("flags", flags.tobytes()),
+    ]
+    if has_bounds:
+        sections.append(("bounds", _to_little_endian_bytes(bounds_values)))
+    for column in SCENE_BINARY_STRING_COLUMNS:
+        _lookup, strings, indices = columns[column]
+        blob = bytearray()
+        offsets = array("I", [0])
+        for value in strings:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        sections.append((f"str.{column}.idx", _to_little_endian_bytes(indices)))
+        sections.append((f"str.{column}.off", _to_little_endian_bytes(offsets)))
+        sections.append((f"str.{column}.dat", bytes(blob)))
+    if extras:
+        sections.append(("extra", json.dumps(extras, ensure_ascii=False).encode("utf-8")))
+
+    def align8(value):
+        return (value + 7) & ~7
+
+    offset = align8(SCENE_BINARY_HEADER.size + SCENE_BINARY_SECTION.size * len(sections))
+    directory = []
+    for name, payload in sections:
+        directory.append((name, offset, len(payload)))
+        offset = align8(offset + len(payload))
+
+    with open_atomic(file_path, "wb") as f:
+        f.write(SCENE_BINARY_HEADER.pack(SCENE_BINARY_MAGIC, SCENE_BINARY_VERSION, len(flags), len(sections), 0))
+        for name, section_offset, size in directory:
+            f.write(SCENE_BINARY_SECTION.pack(name.encode("ascii"), section_offset, size))
+        for (_name, payload), (_dir_name, section_offset, _size) in zip(sections, directory):
+            f.write(b"\0" * (section_offset - f.tell()))
+            f.write(payload)
+    return file_path
+
+
+def read_scene_binary(file_path):
+    """
+    通过mmap读取二进制场景文件，transform列直接按float64映射，不经过文本解析
+    Args:
+        file_path (str): 二进制场景文件路径
+    Returns:
+        dict: 与场景JSON结构相同的数据（包含actors列表）
+    """
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        magic, version, actor_count, section_count, _reserved = SCENE_BINARY_HEADER.unpack_from(mapped, 0)
+        if magic != SCENE_BINARY_MAGIC or version > SCENE_BINARY_VERSION:
+            raise RuntimeError(f"unsupported_scene_binary: {file_path}")
+        sections = {}
+        for idx in range(section_count):
+            name, offset, size = SCENE_BINARY_SECTION.unpack_from(
+                mapped, SCENE_BINARY_HEADER.size + idx * SCENE_BINARY_SECTION.size
+            )
+            sections[name.rstrip(b"\0").decode("ascii")] = (offset, size)
+
+        def section_bytes(name):
+            offset, size = sections.get(name, (0, 0))
+            return mapped[offset:offset + size]
+
+        def section_array(name, typecode):
+            values = array(typecode)
+            values.frombytes(section_bytes(name))
+            if sys.byteorder != "little":
+                values.byteswap()
+            return values
+
+        header = json.loads(section_bytes("meta").decode("utf-8"))
+        transforms = section_array("transform", "d")
+        bounds_values = section_array("bounds", "d") if "bounds" in sections else None
+        flags = section_bytes("flags")
+        extra_bytes = section_bytes("extra")
+        extras = json.loads(extra_bytes.decode("utf-8")) if extra_bytes else {}
+        column_values = {}
+        for column in SCENE_BINARY_STRING_COLUMNS:
+            offsets = section_array(f"str.{column}.off", "I")
+            blob = section_bytes(f"str.{column}.dat")
+            strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+            column_values[column] = [strings[i] for i in section_array(f"str.{column}.idx", "I")]
+
+    flag_names = {code: flag for flag, code in SCENE_BINARY_FLAGS.items()}
+    actors = []
+    for actor_index in range(actor_count):
+        values = transforms[actor_index * 9:actor_index * 9 + 9]
+        actor = {column: column_values[column][actor_index] for column in SCENE_BINARY_STRING_COLUMNS}
+        actor["transform"] = {
+            key: {"x": values[idx * 3], "y": values[idx * 3 + 1], "z": values[idx * 3 + 2]}
+            for idx, (key, _default) in enumerate(SCENE_BINARY_TRANSFORM_AXES)
+        }
+        if bounds_values is not None and not math.isnan(bounds_values[actor_index * 6]):
+            values = bounds_values[actor_index * 6:actor_index * 6 + 6]
+            actor["bounds"] = {
+                key: {"x": values[idx * 3], "y": values[idx * 3 + 1], "z": values[idx * 3 + 2]}
+                for idx, key in enumerate(SCENE_BINARY_BOUNDS_KEYS)
+            }
+        flag = flag_names.get(flags[actor_index], "")
+        if flag:
+            actor[BL_FLAG] = flag
+        actor.update(extras.get(str(actor_index), {}))
+        actors.append(actor)
+    header["actors"] = actors
+    return header
+
+
+# =====================
+# 交换目录清单（格式见Blender插件 util.py）
+# =====================
+def get_manifest_path():
+    return os.path.join(DEFAULT_IO_TEMP_DIR, MANIFEST_FILE)
+
+
+def get_manifest_lock_path():
+    return os.path.join(DEFAULT_IO_TEMP_DIR, MANIFEST_LOCK_FILE)
+
+
+def get_manifest_primary_path(record):
+    return record.get("paths", {}).get(MANIFEST_PRIMARY_PATH_KEYS.get(record.get("type"), ""), "")
+
+
+def parse_manifest_lines(data, skip_first_line=False):
+    """把清单内容解析为记录，skip_first_line为True时丢弃可能不完整的第一行"""
+    lines = data.split(b"\n")
+    if skip_first_line:
+        lines = lines[1:]
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line.decode("utf-8")))
+        except ValueError:
+            continue
+    return records
+
+
+def read_manifest_records(tail_bytes=None):
+    """读取清单记录，tail_bytes不为None时只读取文件末尾（丢弃可能不完整的第一行）"""
+    try:
+        with open(get_manifest_path(), "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - tail_bytes) if tail_bytes else 0
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return []
+    return parse_manifest_lines(data, start > 0)
+
+
+def fold_manifest_records(records):
+    """按id合并记录，后写入的字段覆盖之前的字段"""
+    folded = {}
+    for record in records:
+        record_id = record.get("id")
+        if not record_id:
+            continue
+        merged = folded.pop(record_id, {})
+        for key in ("paths", "timestamps"):
+            if key in merged:
+                record = dict(record, **{key: dict(merged[key], **record.get(key, {}))})
+        merged.update(record)
+        folded[record_id] = merged
+    return folded
+
+
+def acquire_manifest_lock(wait_seconds=0.0):
+    """
+    创建清单锁文件（O_EXCL，与Blender插件互斥），最多等待wait_seconds；
+    超过MANIFEST_LOCK_STALE_SECONDS的锁视为残留并接管
+    """
+    lock_path = get_manifest_lock_path()
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) >= MANIFEST_LOCK_STALE_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(MANIFEST_LOCK_POLL_SECONDS)
+
+
+def release_manifest_lock():
+    try:
+        os.remove(get_manifest_lock_path())
+    except OSError:
+        pass
+
+
+def compact_manifest():
+    """合并重写清单（调用方需持有清单锁），替换前把读取之后追加的完整行接在合并结果后面"""
+    manifest_path = get_manifest_path()
+    with open(manifest_path, "rb") as f:
+        data = f.read()
+    data = data[: data.rfind(b"\n") + 1]
+    folded = fold_manifest_records(parse_manifest_lines(data))
+    with open_atomic(manifest_path) as f:
+        for record in folded.values():
+            if os.path.exists(get_manifest_primary_path(record)):
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        with open(manifest_path, "rb") as src:
+            src.seek(len(data))
+            tail = src.read()
+        f.write(tail[: tail.rfind(b"\n") + 1].decode("utf-8"))
+
+
+def append_manifest_record(record_type, record_id, status, paths, timestamps=None):
+    """在清单锁内向清单追加一条记录，文件超过MANIFEST_COMPACT_BYTES时先合并重写；等锁超时时只追加"""
+    manifest_path = get_manifest_path()
+    record = {
+        "id": record_id,
+        "type": record_type,
+        "status": status,
+        "source": "UE",
+        "timestamp": get_iso_timestamp(),
+        "paths": paths,
+    }
+    if timestamps:
+        record["timestamps"] = timestamps
+    ensure_directory(os.path.dirname(manifest_path))
+    is_locked = acquire_manifest_lock(MANIFEST_LOCK_WAIT_SECONDS)
+    try:
+        if is_locked:
+            try:
+                if os.path.getsize(manifest_path) > MANIFEST_COMPACT_BYTES:
+                    compact_manifest()
+            except OSError:
+                pass
+        with open(manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    finally:
+        if is_locked:
+            release_manifest_lock()
+
+
+def find_latest_manifest_path(record_type):
+    """先读清单末尾、再读整个清单，返回某类最新且文件仍存在的记录主文件路径"""
+    for tail_bytes in (MANIFEST_TAIL_BYTES, None):
+        for record in reversed(read_manifest_records(tail_bytes)):
+            if record.get("type") != record_type:
+                continue
+            primary_path = get_manifest_primary_path(record)
+            if primary_path and os.path.isfile(primary_path):
+                return primary_path
+    return None
+
+
 def list_static_mesh_session_files():
+    if os.path.exists(get_manifest_path()):
+        session_files = [
+            get_manifest_primary_path(record)
+            for record in reversed(list(fold_manifest_records(read_manifest_records()).values()))
+            if record.get("type") == MANIFEST_TYPE_SESSION
+        ]
+        session_files = [session_file for session_file in session_files if session_file and os.path.isfile(session_file)]
+        if session_files:
+            return session_files
+
     if not os.path.isdir(STATIC_MESH_SESSION_DIR):
         return []
 
@@ -93,6 +501,9 @@ def list_static_mesh_session_files():
 
 
 def find_latest_static_mesh_session_file():
+    latest_session_file = find_latest_manifest_path(MANIFEST_TYPE_SESSION)
+    if latest_session_file is not None:
+        return latest_session_file
     session_files = list_static_mesh_session_files()
     if not session_files:
         return None
@@ -108,6 +519,7 @@ def load_static_mesh_session(session_file):
     session_data["paths"].setdefault("source_fbx", get_static_mesh_source_fbx_path(session_dir))
     session_data["paths"].setdefault("edited_fbx", get_static_mesh_edited_fbx_path(session_dir))
     session_data.setdefault("timestamps", {})
+    session_data["assets"] = get_static_mesh_session_assets(session_data)
     return session_data
 
 
@@ -121,6 +533,13 @@ def save_static_mesh_session(session_file, session_data):
         "edited_fbx", get_static_mesh_edited_fbx_path(session_dir)
     )
     write_json_file(session_file, session_data)
+    append_manifest_record(
+        MANIFEST_TYPE_SESSION,
+        str(session_data.get("session_id") or os.path.basename(session_dir)),
+        session_data.get("status", ""),
+        dict(session_data["paths"], session_file=session_file),
+        session_data.get("timestamps", {}),
+    )
 
 
 def update_static_mesh_session_status(session_data, status, timestamp_key):
@@ -150,59 +569,65 @@ def get_static_mesh_from_actor(actor):
     return static_mesh
 
 
-def get_selected_static_mesh_source():
+def get_selected_static_mesh_sources():
+    """
+    收集所有选中的StaticMesh：优先取关卡中选中的actor（同一mesh只导出一次），没有时取内容浏览器中选中的资产
+    返回：
+        list[dict]: {"selection_source", "actor", "static_mesh"}，按选择顺序
+    """
     selected_actors = actor_subsys.get_selected_level_actors()
     log_static_mesh_info(f"Selected level actors: {len(selected_actors)}")
-    if len(selected_actors) == 1:
-        actor = selected_actors[0]
+    sources = []
+    seen_mesh_paths = set()
+    for actor in selected_actors:
         static_mesh = get_static_mesh_from_actor(actor)
-        if static_mesh is not None:
+        if static_mesh is None:
             log_static_mesh_info(
-                f"Resolved level actor selection: actor={actor.get_actor_label()} mesh={static_mesh.get_path_name()}"
+                f"Selected actor has no StaticMeshComponent/static mesh: {actor.get_actor_label()}"
             )
-            return {
-                "selection_source": "level_actor",
-                "actor": actor,
-                "static_mesh": static_mesh,
-            }
+            continue
+        mesh_path = static_mesh.get_path_name()
+        if mesh_path in seen_mesh_paths:
+            continue
+        seen_mesh_paths.add(mesh_path)
         log_static_mesh_info(
-            f"Selected actor has no StaticMeshComponent/static mesh: {actor.get_actor_label()}"
+            f"Resolved level actor selection: actor={actor.get_actor_label()} mesh={mesh_path}"
         )
-    elif len(selected_actors) > 1:
-        actor_names = [actor.get_actor_label() for actor in selected_actors]
-        log_static_mesh_info(f"Multiple level actors selected: {actor_names}")
+        sources.append({"selection_source": "level_actor", "actor": actor, "static_mesh": static_mesh})
+    if sources:
+        return sources
 
     selected_assets = editor_util.get_selected_assets()
     log_static_mesh_info(f"Selected content browser assets: {len(selected_assets)}")
-    static_mesh_assets = []
     for asset in selected_assets:
         asset_class = asset.get_class().get_name() if asset else "None"
         asset_path = asset.get_path_name() if asset else "None"
         log_static_mesh_info(f"Content Browser selection: class={asset_class} path={asset_path}")
-        if asset and asset_class == "StaticMesh":
-            static_mesh_assets.append(asset)
-
-    if len(static_mesh_assets) == 1:
-        static_mesh = static_mesh_assets[0]
-        log_static_mesh_info(
-            f"Resolved content browser selection: mesh={static_mesh.get_path_name()}"
-        )
-        return {
-            "selection_source": "content_browser_asset",
-            "actor": None,
-            "static_mesh": static_mesh,
-        }
-
-    if len(static_mesh_assets) > 1:
-        raise RuntimeError("multiple_static_mesh_assets_selected")
-
-    if len(selected_actors) != 1:
-        raise RuntimeError("expected_single_selected_actor")
-
-    raise RuntimeError("selected_source_has_no_static_mesh")
+        if asset and asset_class == "StaticMesh" and asset_path not in seen_mesh_paths:
+            seen_mesh_paths.add(asset_path)
+            sources.append({"selection_source": "content_browser_asset", "actor": None, "static_mesh": asset})
+    if sources:
+        return sources
+
+    if selected_actors:
+        raise RuntimeError("selected_source_has_no_static_mesh")
+    raise RuntimeError("no_static_mesh_selected")
+
+
+def get_static_mesh_asset_fbx_paths(session_dir, static_mesh, asset_index, asset_count):
+    """单资产会话沿用source.fbx/edited.fbx，批量会话每个资产一对FBX"""
+    if asset_count == 1:
+        return get_static_mesh_source_fbx_path(session_dir), get_static_mesh_edited_fbx_path(session_dir)
+    file_stem = f"{asset_index:03d}_{make_safe_name(static_mesh.get_name())}"
+    return (
+        os.path.join(session_dir, f"source_{file_stem}.fbx"),
+        os.path.join(session_dir, f"edited_{file_stem}.fbx"),
+    )
 
 
-def build_static_mesh_session_data(actor, static_mesh, session_id, session_dir, selection_source):
+def build_static_mesh_asset_data(source, session_dir, asset_index, asset_count):
+    actor = source["actor"]
+    static_mesh = source["static_mesh"]
     actor_label = ""
     actor_guid = ""
     if actor is not None:
@@ -214,7 +639,32 @@ def build_static_mesh_session_data(actor, static_mesh, session_id, session_dir,
         actor_guid = str(actor.actor_guid) if actor is not None else ""
     except Exception:
         actor_guid = ""
+    source_fbx_path, edited_fbx_path = get_static_mesh_asset_fbx_paths(
+        session_dir, static_mesh, asset_index, asset_count
+    )
+    return {
+        "asset_name": str(static_mesh.get_name()),
+        "asset_path": str(static_mesh.get_path_name()),
+        "selection_source": source["selection_source"],
+        "source_actor": {
+            "label": actor_label,
+            "guid": actor_guid,
+        },
+        "source_fbx": source_fbx_path,
+        "edited_fbx": edited_fbx_path,
+    }
+
 
+def build_static_mesh_session_data(sources, session_id, session_dir):
+    """
+    构建会话数据；assets列出批量会话中的每个资产，顶层source_asset/source_actor/paths与第一个资产一致，
+    兼容只认识单资产会话的旧版本
+    """
+    assets = [
+        build_static_mesh_asset_data(source, session_dir, asset_index, len(sources))
+        for asset_index, source in enumerate(sources)
+    ]
+    first_asset = assets[0]
     return {
         "schema_version": STATIC_MESH_SCHEMA_VERSION,
         "session_type": STATIC_MESH_SESSION_TYPE,
@@ -222,19 +672,17 @@ def build_static_mesh_session_data(actor, static_mesh, session_id, session_dir,
         "ue_version": str(unreal.SystemLibrary.get_engine_version()),
         "blender_version": "5.0",
         "status": STATIC_MESH_STATUS_EXPORTED_FROM_UE,
-        "selection_source": selection_source,
-        "source_actor": {
-            "label": actor_label,
-            "guid": actor_guid,
-        },
+        "selection_source": first_asset["selection_source"],
+        "source_actor": dict(first_asset["source_actor"]),
         "source_asset": {
-            "asset_name": str(static_mesh.get_name()),
-            "asset_path": str(static_mesh.get_path_name()),
+            "asset_name": first_asset["asset_name"],
+            "asset_path": first_asset["asset_path"],
         },
         "paths": {
-            "source_fbx": get_static_mesh_source_fbx_path(session_dir),
-            "edited_fbx": get_static_mesh_edited_fbx_path(session_dir),
+            "source_fbx": first_asset["source_fbx"],
+            "edited_fbx": first_asset["edited_fbx"],
         },
+        "assets": assets,
         "export_options": {
             "axis": "UE_TO_BLENDER_DEFAULT",
             "unit": "CENTIMETERS",
@@ -248,46 +696,73 @@ def build_static_mesh_session_data(actor, static_mesh, session_id, session_dir,
     }
 
 
-def export_static_mesh_asset_to_fbx(static_mesh, output_fbx_path):
-    output_dir = os.path.dirname(output_fbx_path)
-    ensure_directory(output_dir)
-    log_static_mesh_info(
-        f"Exporting static mesh asset to FBX: asset={static_mesh.get_path_name()} output={output_fbx_path}"
-    )
-
+def get_static_mesh_session_assets(session_data):
+    """返回会话中的资产列表；没有assets的旧会话视为单资产会话"""
+    assets = session_data.get("assets")
+    if assets:
+        return assets
+    paths = session_data.get("paths", {})
+    source_asset = session_data.get("source_asset", {})
+    return [{
+        "asset_name": source_asset.get("asset_name", ""),
+        "asset_path": source_asset.get("asset_path", ""),
+        "selection_source": session_data.get("selection_source", ""),
+        "source_actor": dict(session_data.get("source_actor", {})),
+        "source_fbx": paths.get("source_fbx", ""),
+        "edited_fbx": paths.get("edited_fbx", ""),
+    }]
+
+
+def export_static_mesh_assets_to_fbx(static_meshes, output_fbx_paths):
+    """
+    用同一组导出选项和导出器，一次run_asset_export_tasks连续导出多个StaticMesh
+    参数：
+        static_meshes (list[unreal.StaticMesh]): 资产
+        output_fbx_paths (list[str]): 对应的FBX输出路径
+    """
     export_options = unreal.FbxExportOption()
     export_options.export_source_mesh = True
     export_options.vertex_color = False
     export_options.level_of_detail = False
     export_options.collision = False
-
-    export_task = unreal.AssetExportTask()
-    export_task.object = static_mesh
-    export_task.filename = output_fbx_path
-    export_task.automated = True
-    export_task.prompt = False
-    export_task.replace_identical = True
-    export_task.options = export_options
     static_mesh_exporter = unreal.StaticMeshExporterFBX()
-    export_task.exporter = static_mesh_exporter
-    result = static_mesh_exporter.run_asset_export_task(export_task)
-    export_errors = list(export_task.errors or [])
-    if export_errors:
-        for error_message in export_errors:
+
+    export_tasks = []
+    for static_mesh, output_fbx_path in zip(static_meshes, output_fbx_paths):
+        ensure_directory(os.path.dirname(output_fbx_path))
+        log_static_mesh_info(
+            f"Exporting static mesh asset to FBX: asset={static_mesh.get_path_name()} output={output_fbx_path}"
+        )
+        export_task = unreal.AssetExportTask()
+        export_task.object = static_mesh
+        export_task.filename = output_fbx_path
+        export_task.automated = True
+        export_task.prompt = False
+        export_task.replace_identical = True
+        export_task.options = export_options
+        export_task.exporter = static_mesh_exporter
+        export_tasks.append(export_task)
+
+    result = unreal.Exporter.run_asset_export_tasks(export_tasks)
+    for export_task in export_tasks:
+        for error_message in list(export_task.errors or []):
             log_static_mesh_error(f"Exporter message: {error_message}")
 
     log_static_mesh_info(f"Exporter returned: {result}")
 
-    if not result or not os.path.isfile(output_fbx_path):
-        if os.path.isfile(output_fbx_path):
-            file_size = os.path.getsize(output_fbx_path)
-            log_static_mesh_info(f"Unexpected partial FBX output exists: {output_fbx_path} ({file_size} bytes)")
-        else:
-            log_static_mesh_error(f"FBX file was not created: {output_fbx_path}")
+    missing_paths = [path for path in output_fbx_paths if not os.path.isfile(path)]
+    if not result or missing_paths:
+        for output_fbx_path in output_fbx_paths:
+            if os.path.isfile(output_fbx_path):
+                file_size = os.path.getsize(output_fbx_path)
+                log_static_mesh_info(f"FBX output exists: {output_fbx_path} ({file_size} bytes)")
+            else:
+                log_static_mesh_error(f"FBX file was not created: {output_fbx_path}")
         raise RuntimeError("static_mesh_export_failed")
-    file_size = os.path.getsize(output_fbx_path)
-    log_static_mesh_info(f"FBX export complete: {output_fbx_path} ({file_size} bytes)")
-    return output_fbx_path
+    for output_fbx_path in output_fbx_paths:
+        file_size = os.path.getsize(output_fbx_path)
+        log_static_mesh_info(f"FBX export complete: {output_fbx_path} ({file_size} bytes)")
+    return output_fbx_paths
 
 
 def build_static_mesh_import_options():
@@ -306,7 +781,7 @@ def build_static_mesh_import_options():
     return options
 
 
-def reimport_static_mesh_from_fbx(static_mesh_asset_path, source_fbx_path):
+def build_static_mesh_reimport_task(static_mesh_asset_path, source_fbx_path, import_options):
     package_path, asset_name = split_object_path(static_mesh_asset_path)
     task = unreal.AssetImportTask()
     task.filename = source_fbx_path
@@ -316,16 +791,34 @@ def reimport_static_mesh_from_fbx(static_mesh_asset_path, source_fbx_path):
     task.replace_existing = True
     task.replace_existing_settings = True
     task.save = True
-    task.options = build_static_mesh_import_options()
+    task.options = import_options
+    return task
 
-    asset_tools.import_asset_tasks([task])
 
-    reimported_asset = unreal.load_asset(static_mesh_asset_path)
-    if reimported_asset is None:
-        raise RuntimeError("static_mesh_reimport_failed")
-
-    editor_asset_lib.save_loaded_asset(reimported_asset, only_if_is_dirty=False)
-    return reimported_asset
+def reimport_static_meshes_from_fbx(reimport_pairs):
+    """
+    用一次import_asset_tasks重新导入多个StaticMesh
+    参数：
+        reimport_pairs (list[tuple[str, str]]): (资产路径, FBX路径)
+    返回：
+        list[unreal.StaticMesh]: 重新导入的资产
+    """
+    import_options = build_static_mesh_import_options()
+    tasks = [
+        build_static_mesh_reimport_task(asset_path, fbx_path, import_options)
+        for asset_path, fbx_path in reimport_pairs
+    ]
+    asset_tools.import_asset_tasks(tasks)
+
+    reimported_assets = []
+    for static_mesh_asset_path, _fbx_path in reimport_pairs:
+        reimported_asset = unreal.load_asset(static_mesh_asset_path)
+        if reimported_asset is None:
+            raise RuntimeError(f"static_mesh_reimport_failed: {static_mesh_asset_path}")
+        reimported_assets.append(reimported_asset)
+    for reimported_asset in reimported_assets:
+        editor_asset_lib.save_loaded_asset(reimported_asset, only_if_is_dirty=False)
+    return reimported_assets
 
 
 def get_default_object(asset) -> unreal.Object:
@@ -568,6 +1061,55 @@ def export_level_to_fbx(level_asset,output_path):
         print(f"✗ 导出 Level 失败: {level_name}")
         return None
 
+def export_level_to_usd(level_asset, output_path):
+    """
+    导出Level到USD文件，供Blender端通过原生USD导入器导入（保留实例化）。
+    Args:
+        level_asset: World对象
+        output_path (str): 输出目录
+    Returns:
+        str: 成功导出后返回USD文件的完整路径，否则返回None。
+    """
+    if level_asset is None:
+        print("错误: level_asset 为 None")
+        return None
+    if not hasattr(unreal, "LevelExporterUSD"):
+        print("错误: 未启用USD Importer插件，无法导出USD")
+        return None
+    if not os.path.exists(output_path):
+        os.makedirs(output_path)
+
+    level_name = level_asset.get_name()
+    usd_file_path = os.path.join(output_path, f"{level_name}{USD_LEVEL_EXT}")
+    print(f"导出路径: {usd_file_path}")
+
+    export_options = unreal.LevelExporterUSDOptions()
+    # 与FBX一致：厘米、Z轴向上，Blender端按prim名称对应JSON中的actor
+    stage_options = export_options.get_editor_property("stage_options")
+    stage_options.set_editor_property("meters_per_unit", 0.01)
+    stage_options.set_editor_property("up_axis", unreal.UsdUpAxis.Z_AXIS)
+    export_options.set_editor_property("stage_options", stage_options)
+    inner_options = export_options.get_editor_property("inner")
+    inner_options.set_editor_property("selected_actors_only", False)
+    inner_options.set_editor_property("export_actor_folders", False)
+    export_options.set_editor_property("inner", inner_options)
+
+    export_task = unreal.AssetExportTask()
+    export_task.object = level_asset
+    export_task.filename = usd_file_path
+    export_task.automated = True
+    export_task.prompt = False
+    export_task.replace_identical = True
+    export_task.options = export_options
+    usd_exporter = unreal.LevelExporterUSD()
+    export_task.exporter = usd_exporter
+
+    if usd_exporter.run_asset_export_task(export_task) and os.path.exists(usd_file_path):
+        print(f"✓ 成功导出 Level: {level_name} 到 {usd_file_path}")
+        return usd_file_path
+    print(f"✗ 导出 Level USD 失败: {level_name}")
+    return None
+
 def export_current_level_json(output_path):
     """
     导出当前关卡的世界信息和所有Actor的信息到JSON文件。
@@ -644,6 +1186,12 @@ def export_current_level_json(output_path):
                 "rotation": {"x": rotation.roll,"y": rotation.pitch, "z": rotation.yaw},
                 "scale": {"x": scale.x, "y": scale.y, "z": scale.z}
             }
+            # Actor 世界空间包围盒，供Blender代理导入模式生成box
+            bounds_origin, bounds_extent = actor.get_actor_bounds(False)
+            actor_info["bounds"] = {
+                "origin": {"x": bounds_origin.x, "y": bounds_origin.y, "z": bounds_origin.z},
+                "extent": {"x": bounds_extent.x, "y": bounds_extent.y, "z": bounds_extent.z}
+            }
             
             actors_data.append(actor_info)
         # 4. 组织最终的JSON数据
@@ -662,60 +1210,37 @@ def export_current_level_json(output_path):
             print(f"创建输出目录: {output_path}")
         
         file_path = os.path.join(output_path, f"{level_name_for_file}.json")
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(level_export_data, f, indent=4, ensure_ascii=False)
+        level_export_data = round_json_floats(level_export_data, JSON_FLOAT_PRECISION)
+        write_json_file(file_path, level_export_data)
         unreal.log(f"成功导出关卡数据到: {file_path}")
+        if SCENE_BINARY_SIDECAR_ENABLED:
+            header = {key: value for key, value in level_export_data.items() if key != "actors"}
+            binary_path = write_scene_binary(get_scene_binary_path(file_path), header, level_export_data["actors"])
+            unreal.log(f"成功导出二进制场景数据到: {binary_path}")
         return file_path
     except Exception as e:
         unreal.log_error(f"导出关卡数据时发生错误: {e}")
         import traceback
         unreal.log_error(traceback.format_exc())
         return None
-def import_json(file_path):
-    """
-    1. 从json导入数据
-    2. 检查json的关卡是否与目前打开的关卡一致（根据main_level和level_path校验是否同一个关卡）
-    3. 检查json里actor的transform是否与level中actor的transform一致（根据name, fname和guid校验是否同一个actor）
-    4. 如果json里有新actor，根据guid，创建一个actor，根据transform，设置actor的位置，旋转，缩放
-    """
-
-    # 1. 读取JSON文件
-    if not os.path.exists(file_path):
-        unreal.log_error(f"找不到JSON文件: {file_path}")
-        return
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        json_data = json.load(f)
-        unreal.log(f"成功读取JSON文件: {file_path}")
-
-    # 2. 校验关卡
-    main_level = editor_subsys.get_editor_world()
-    level_asset = get_level_asset(type="EDITOR")
-    main_level_path = main_level.get_path_name()
-    level_asset_path = level_asset.get_path_name()
-
-    json_main_level = json_data.get("main_level", "")
-    json_level_path = json_data.get("level_path", "")
-
-    if main_level_path != json_main_level or level_asset_path != json_level_path:
-        unreal.log_error("JSON中的关卡与当前打开的关卡不一致，导入终止。")
-        return
-
-    # 3. 获取当前关卡所有Actor，建立fname映射
+def get_level_fname_to_actor():
+    """获取当前关卡所有Actor，建立fname映射"""
     all_actors = actor_subsys.get_all_level_actors()
     fname_to_actor = {}
-    match_count = 0
     for actor in all_actors:
         if hasattr(actor, "get_fname"):
-            actor_fname = str(actor.get_fname())
-            actor_name = str(actor.get_actor_label())
-            fname_to_actor[actor_fname] = actor
-            match_count += 1
-    print(f"matched count: {match_count}")
-    # print(fname_to_actor)
-
-    # 4. 遍历JSON中的actors
-    json_actors_data = json_data.get("actors", [])
+            fname_to_actor[str(actor.get_fname())] = actor
+    print(f"matched count: {len(fname_to_actor)}")
+    return fname_to_actor
+
+
+def apply_blender_actors(json_actors_data, is_delta=False, fname_to_actor=None):
+    """
+    按Blender标记处理actor：BL_NEW复制新建，BL_DEL删除，其余同步transform（JSON导入与实时同步共用）
+    is_delta为True时只处理带BL_FLAG的actor；fname_to_actor为None时重新获取当前关卡的actor
+    """
+    if fname_to_actor is None:
+        fname_to_actor = get_level_fname_to_actor()
     # 先遍历一遍，收集需要处理的对象到不同列表
     bl_new_list = []   # 存储需要新建的actor信息
     bl_del_list = []   # 存储需要删除的actor信息
@@ -729,6 +1254,8 @@ def import_json(file_path):
         blender_flag = actor_info.get(BL_FLAG, None)
         if "Light" in actor_type:  # 忽略灯光
             continue
+        if is_delta and not blender_flag:
+            continue
         transform_data = actor_info.get("transform", {})
         location = transform_data.get("location", {})
         rotation = transform_data.get("rotation", {})
@@ -803,6 +1330,7 @@ def import_json(file_path):
                     break
 
     # 最后处理其他操作（如transform同步）
+    label_to_actor = None
     for actor_info, location, rotation, scale in other_ops:
         name = actor_info.get("name")
         fname = actor_info.get("fname")
@@ -813,6 +1341,13 @@ def import_json(file_path):
             candidate = fname_to_actor[fname]
             if candidate.get_actor_label() == name:
                 actor = candidate
+        if actor is None and actor_info.get(BL_FLAG) == BL_MOD:
+            # Blender新增后复制出的actor沿用源actor的fname，按label和类型匹配
+            if label_to_actor is None:
+                label_to_actor = {a.get_actor_label(): a for a in fname_to_actor.values()}
+            candidate = label_to_actor.get(name)
+            if candidate is not None and get_actor_type(candidate, candidate.get_class().get_name()) == actor_type:
+                actor = candidate
         if actor:
             # 检查transform是否一致
             if not is_transform_close(actor, location, rotation, scale):
@@ -823,6 +1358,47 @@ def import_json(file_path):
                 )
                 actor.set_actor_transform(new_transform, sweep=False, teleport=True)
                 unreal.log(f"已更新Actor: {name} 的Transform")
+
+
+def import_json(file_path):
+    """
+    1. 从json导入数据
+    2. 检查json的关卡是否与目前打开的关卡一致（根据main_level和level_path校验是否同一个关卡）
+    3. 检查json里actor的transform是否与level中actor的transform一致（根据name, fname和guid校验是否同一个actor）
+    4. 如果json里有新actor，根据guid，创建一个actor，根据transform，设置actor的位置，旋转，缩放
+    """
+
+    # 1. 读取JSON文件
+    if not os.path.exists(file_path):
+        unreal.log_error(f"找不到JSON文件: {file_path}")
+        return
+
+    if is_scene_binary_current(file_path):
+        json_data = read_scene_binary(get_scene_binary_path(file_path))
+        unreal.log(f"成功读取二进制场景文件: {get_scene_binary_path(file_path)}")
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            json_data = json.load(f)
+            unreal.log(f"成功读取JSON文件: {file_path}")
+
+    # 2. 校验关卡
+    main_level = editor_subsys.get_editor_world()
+    level_asset = get_level_asset(type="EDITOR")
+    main_level_path = main_level.get_path_name()
+    level_asset_path = level_asset.get_path_name()
+
+    json_main_level = json_data.get("main_level", "")
+    json_level_path = json_data.get("level_path", "")
+
+    if main_level_path != json_main_level or level_asset_path != json_level_path:
+        unreal.log_error("JSON中的关卡与当前打开的关卡不一致，导入终止。")
+        return
+
+    # 3. 按Blender标记新增/删除/同步transform
+    json_actors_data = json_data.get("actors", [])
+    # 按修改导出的JSON中，只有带BL_FLAG的actor需要处理
+    is_delta = json_data.get(BL_DELTA_KEY, False)
+    apply_blender_actors(json_actors_data, is_delta=is_delta)
     # unreal.EditorLevelLibrary.editor_screen_refresh()
     unreal.log("关卡数据导入完成。")
     return
@@ -831,28 +1407,24 @@ def import_json(file_path):
 def ubio_export_selected_static_mesh_to_blender():
     try:
         log_static_mesh_info("ubio_export_selected_static_mesh_to_blender started")
-        selection = get_selected_static_mesh_source()
-        actor = selection["actor"]
-        static_mesh = selection["static_mesh"]
-        selection_source = selection["selection_source"]
-        session_suffix = make_safe_name(static_mesh.get_name())
+        sources = get_selected_static_mesh_sources()
+        session_suffix = make_safe_name(sources[0]["static_mesh"].get_name())
+        if len(sources) > 1:
+            session_suffix = f"Batch{len(sources)}_{session_suffix}"
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         session_id = f"{timestamp}_{session_suffix}"
         session_dir = ensure_directory(os.path.join(STATIC_MESH_SESSION_DIR, session_id))
-        source_fbx_path = get_static_mesh_source_fbx_path(session_dir)
         session_file_path = get_session_file_path(session_dir)
 
         log_static_mesh_info(
-            f"Session prepared: source={selection_source} session_id={session_id} session_dir={session_dir}"
+            f"Session prepared: assets={len(sources)} source={sources[0]['selection_source']} "
+            f"session_id={session_id} session_dir={session_dir}"
         )
-        session_data = build_static_mesh_session_data(
-            actor,
-            static_mesh,
-            session_id,
-            session_dir,
-            selection_source,
+        session_data = build_static_mesh_session_data(sources, session_id, session_dir)
+        export_static_mesh_assets_to_fbx(
+            [source["static_mesh"] for source in sources],
+            [asset["source_fbx"] for asset in session_data["assets"]],
         )
-        export_static_mesh_asset_to_fbx(static_mesh, source_fbx_path)
         save_static_mesh_session(session_file_path, session_data)
 
         log_static_mesh_info(f"StaticMesh session exported successfully: {session_file_path}")
@@ -864,6 +1436,10 @@ def ubio_export_selected_static_mesh_to_blender():
 
 
 def ubio_reimport_static_mesh_from_blender(session_file_path=""):
+    """
+    把Blender导出的edited FBX重新导入到会话中的StaticMesh资产
+    返回重新导入的资产路径列表；整个会话几何体未修改时返回全部资产路径，失败时返回空列表
+    """
     session_file = session_file_path or ""
     try:
         session_file = session_file_path or find_latest_static_mesh_session_file()
@@ -874,19 +1450,44 @@ def ubio_reimport_static_mesh_from_blender(session_file_path=""):
         if session_data.get("session_type") != STATIC_MESH_SESSION_TYPE:
             raise RuntimeError("invalid_static_mesh_session")
 
-        edited_fbx_path = session_data.get("paths", {}).get("edited_fbx", "")
-        if not edited_fbx_path or not os.path.isfile(edited_fbx_path):
-            raise RuntimeError(f"edited_fbx_missing: {edited_fbx_path}")
-
-        asset_path = session_data.get("source_asset", {}).get("asset_path", "")
-        if not asset_path:
-            raise RuntimeError("missing_source_asset_path")
-
-        source_asset = unreal.load_asset(asset_path)
-        if source_asset is None:
-            raise RuntimeError(f"source_asset_not_found: {asset_path}")
-
-        reimport_static_mesh_from_fbx(asset_path, edited_fbx_path)
+        session_assets = session_data["assets"]
+        if session_data.get("unchanged"):
+            # Blender端几何指纹与UE端一致：跳过重新导入和保存（Nanite网格上最耗时的步骤）
+            log_static_mesh_info(f"Geometry unchanged, reimport skipped: {session_file}")
+            update_static_mesh_session_status(
+                session_data,
+                STATIC_MESH_STATUS_REIMPORTED_IN_UE,
+                "reimported_in_ue",
+            )
+            save_static_mesh_session(session_file, session_data)
+            return [asset.get("asset_path", "") for asset in session_assets]
+
+        reimport_pairs = []
+        reimported_assets = []
+        for asset in session_assets:
+            if asset.get("unchanged"):
+                log_static_mesh_info(f"Geometry unchanged, skipped: {asset.get('asset_path', '')}")
+                continue
+            edited_fbx_path = asset.get("edited_fbx", "")
+            if not edited_fbx_path or not os.path.isfile(edited_fbx_path):
+                # 批量会话中Blender端没有导出的资产保持不变
+                log_static_mesh_info(f"Edited FBX missing, skipped: {edited_fbx_path}")
+                continue
+            asset_path = asset.get("asset_path", "")
+            if not asset_path:
+                raise RuntimeError("missing_source_asset_path")
+            if unreal.load_asset(asset_path) is None:
+                raise RuntimeError(f"source_asset_not_found: {asset_path}")
+            reimport_pairs.append((asset_path, edited_fbx_path))
+            reimported_assets.append(asset)
+        if not reimport_pairs:
+            raise RuntimeError(f"edited_fbx_missing: {session_data.get('paths', {}).get('edited_fbx', '')}")
+
+        reimport_static_meshes_from_fbx(reimport_pairs)
+        for asset in reimported_assets:
+            # UE端资产现在对应Blender导出的几何体，下次比较以此为准
+            if asset.get("export_fingerprint"):
+                asset["ue_fingerprint"] = asset["export_fingerprint"]
         update_static_mesh_session_status(
             session_data,
             STATIC_MESH_STATUS_REIMPORTED_IN_UE,
@@ -894,8 +1495,9 @@ def ubio_reimport_static_mesh_from_blender(session_file_path=""):
         )
         save_static_mesh_session(session_file, session_data)
 
-        unreal.log(f"已重新导入 StaticMesh 资产: {asset_path}")
-        return asset_path
+        for asset_path, _edited_fbx_path in reimport_pairs:
+            unreal.log(f"已重新导入 StaticMesh 资产: {asset_path}")
+        return [asset_path for asset_path, _edited_fbx_path in reimport_pairs]
     except Exception as exc:
         unreal.log_error(f"导入 Blender 返回的 StaticMesh 失败: {exc}")
         if session_file and os.path.isfile(session_file):
@@ -910,7 +1512,164 @@ def ubio_reimport_static_mesh_from_blender(session_file_path=""):
             except Exception:
                 pass
         unreal.log_error(traceback.format_exc())
-        return None
+        return []
+
+
+# =====================
+# 实时同步（Blender插件 live_sync.py 的服务端）
+# =====================
+# 本地TCP，每条消息一行紧凑JSON；协议见Blender插件 live_sync.py，
+# tools/live_sync_server.py 是同协议的UE替身，修改时需三处同步。
+# 在编辑器Slate tick中非阻塞地收发，收到的delta合并后在一个编辑器事务中应用（可撤销）。
+
+class LiveSyncServer:
+    def __init__(self, host=LIVE_SYNC_HOST, port=LIVE_SYNC_PORT):
+        self.host = host
+        self.port = port
+        self._listener = None
+        self._clients = {}
+        self._welcomed_clients = set()  # hello校验通过的连接，只接受这些连接的delta
+        self._tick_handle = None
+        self._fname_to_actor = None
+
+    def start(self):
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.port))
+        self._listener.listen(1)
+        self._listener.setblocking(False)
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._tick)
+        unreal.log(f"UBIO实时同步已启动: {self.host}:{self.port}")
+
+    def stop(self):
+        if self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+        for client_sock in list(self._clients):
+            client_sock.close()
+        self._clients.clear()
+        self._welcomed_clients.clear()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        unreal.log("UBIO实时同步已停止")
+
+    def _send(self, client_sock, message):
+        try:
+            client_sock.sendall((json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8"))
+        except OSError:
+            self._drop(client_sock)
+
+    def _drop(self, client_sock):
+        self._clients.pop(client_sock, None)
+        self._welcomed_clients.discard(client_sock)
+        client_sock.close()
+
+    def _tick(self, _delta_seconds):
+        try:
+            while True:
+                client_sock, address = self._listener.accept()
+                client_sock.setblocking(False)
+                self._clients[client_sock] = bytearray()
+                unreal.log(f"UBIO实时同步: Blender已连接 {address}")
+        except BlockingIOError:
+            pass
+        deltas = []
+        for client_sock in list(self._clients):
+            for message in self._read_messages(client_sock):
+                if message.get("type") == "hello":
+                    self._handle_hello(client_sock, message)
+                elif message.get("type") == "delta" and client_sock in self._welcomed_clients:
+                    deltas.append((client_sock, message))
+        if deltas:
+            self._apply_deltas([message for _client_sock, message in deltas])
+            for client_sock, message in deltas:
+                self._send(client_sock, {"type": "ack", "seq": message.get("seq", 0)})
+
+    def _read_messages(self, client_sock):
+        buffer = self._clients[client_sock]
+        while True:
+            try:
+                chunk = client_sock.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                chunk = b""
+            if not chunk:
+                unreal.log("UBIO实时同步: Blender已断开")
+                self._drop(client_sock)
+                return []
+            buffer += chunk
+        messages = []
+        while b"\n" in buffer:
+            line, _sep, rest = bytes(buffer).partition(b"\n")
+            buffer[:] = rest
+            if not line.strip():
+                continue
+            try:
+                messages.append(json.loads(line.decode("utf-8")))
+            except (ValueError, UnicodeDecodeError) as exc:
+                # 数据流已不可信：断开连接，Blender端重连后重新发送
+                unreal.log_error(f"UBIO实时同步: 无法解析的消息，断开连接: {exc}")
+                self._drop(client_sock)
+                return []
+        return messages
+
+    def _handle_hello(self, client_sock, message):
+        main_level_path = editor_subsys.get_editor_world().get_path_name()
+        level_asset_path = get_level_asset(type="EDITOR").get_path_name()
+        if message.get("protocol") != LIVE_SYNC_PROTOCOL:
+            self._reject(client_sock, f"protocol {message.get('protocol')} != {LIVE_SYNC_PROTOCOL}")
+        elif message.get("main_level") != main_level_path or message.get("level_path") != level_asset_path:
+            self._reject(client_sock, f"UE opened level: {level_asset_path}")
+        else:
+            self._fname_to_actor = None
+            self._welcomed_clients.add(client_sock)
+            self._send(client_sock, {"type": "welcome"})
+
+    def _reject(self, client_sock, error):
+        self._send(client_sock, {"type": "error", "message": error})
+        self._drop(client_sock)
+
+    def _apply_deltas(self, messages):
+        actors = []
+        for message in messages:
+            actors.extend(dict(actor_info, **{BL_FLAG: BL_MOD}) for actor_info in message.get("updates", []))
+            actors.extend(dict(actor_info, **{BL_FLAG: BL_NEW}) for actor_info in message.get("added", []))
+            actors.extend(dict(actor_info, actor_type=actor_info.get("actor_type", ""), **{BL_FLAG: BL_DEL})
+                          for actor_info in message.get("removed", []))
+        if self._fname_to_actor is None:
+            self._fname_to_actor = get_level_fname_to_actor()
+        try:
+            with unreal.ScopedEditorTransaction("UBIO Live Sync"):
+                apply_blender_actors(actors, is_delta=True, fname_to_actor=self._fname_to_actor)
+        except Exception as exc:
+            # UE中手动删除过actor时缓存会失效，记录错误后下次重新获取
+            unreal.log_error(f"UBIO实时同步应用失败: {exc}")
+            unreal.log_error(traceback.format_exc())
+            self._fname_to_actor = None
+            return
+        if any(actor_info[BL_FLAG] != BL_MOD for actor_info in actors):
+            # 新增/删除后actor列表已变化，下次重新获取
+            self._fname_to_actor = None
+
+
+_live_sync_server = None
+
+
+def ubio_start_live_sync(port=LIVE_SYNC_PORT):
+    global _live_sync_server
+    ubio_stop_live_sync()
+    _live_sync_server = LiveSyncServer(port=port)
+    _live_sync_server.start()
+    return _live_sync_server
+
+
+def ubio_stop_live_sync():
+    global _live_sync_server
+    if _live_sync_server is not None:
+        _live_sync_server.stop()
+        _live_sync_server = None
 
 
 # 主执行部分
@@ -920,6 +1679,20 @@ def ubio_export():
     level_asset = get_level_asset(type="EDITOR")
     if level_asset:
         fbx_path=export_level_to_fbx(level_asset, DEFAULT_IO_TEMP_DIR)
+        usd_path = None
+        if USD_LEVEL_EXPORT_ENABLED:
+            usd_path = export_level_to_usd(level_asset, DEFAULT_IO_TEMP_DIR)
+        if json_path:
+            # 关卡文件写完后再登记，Blender端按清单找到的导出一定是完整的
+            paths = {"json": json_path, "fbx": fbx_path or "", "usd": usd_path or ""}
+            if SCENE_BINARY_SIDECAR_ENABLED:
+                paths["binary"] = get_scene_binary_path(json_path)
+            append_manifest_record(
+                MANIFEST_TYPE_SCENE,
+                os.path.splitext(os.path.basename(json_path))[0],
+                SCENE_STATUS_EXPORTED_FROM_UE,
+                paths,
+            )
     else:
         print("无法获取Level资产")
 
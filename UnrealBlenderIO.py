@@ -1,34 +1,89 @@
 import bpy
 import os
 import random
+import re
 import json
-from mathutils import Color
+import time
+import numpy as np
+from contextlib import nullcontext
+from mathutils import Color, Euler, Matrix, Vector
 # import blf
 # from mathutils import Vector
 # from math import radians
 from .util import (
     apply_static_mesh_session_metadata,
     build_static_mesh_collection_name,
+    build_static_mesh_asset_collection_name,
     clean_ubio_temp_dir,
     ensure_directory,
     find_latest_static_mesh_session_file,
-    find_static_mesh_session_objects,
+    find_latest_scene_json,
+    append_manifest_record,
+    get_manifest_path,
     get_iso_timestamp,
     get_static_mesh_edited_fbx,
     get_static_mesh_session_file,
     get_static_mesh_session_file_from_object,
+    get_static_mesh_session_assets,
+    get_static_mesh_objects_fingerprint,
     load_static_mesh_session,
     save_static_mesh_session,
     update_static_mesh_session_status,
     get_all_children,
+    get_actor_geometry_signature,
+    dedup_object_meshes,
     # find_level_asset_coll,
     set_proxy_pivot_properties,
     get_transform_from_obj,
-    # set_actor_transform,
+    get_actor_key_from_obj,
+    get_actor_key_from_dict,
+    build_actor_obj_index,
+    build_actor_record,
+    is_syncable_actor_obj,
+    UniqueNameAllocator,
+    set_actor_transforms,
+    get_transforms_from_objs,
+    ue_transform_array_to_dicts,
+    ue_transform_dicts_to_array,
+    are_flat_transforms_close,
+    get_blender_transform_from_ue,
+    flatten_ue_transform,
+    is_actor_in_region,
+    get_level_file_path,
+    get_usd_prim_name,
+    is_usd_path,
+    is_ubio_owned,
+    get_datablock_snapshot,
+    tag_new_datablocks,
+    use_active_collection,
+    get_actor_id,
+    get_actor_id_from_obj,
     # is_obj_transform_equal,
     Const
 )
+from .session_registry import find_static_mesh_session_objects, get_static_mesh_session_registry
+from .scene_io import read_scene_header, iter_scene_actors, rewrite_scene_json
 from .i18n import msgid, tr
+from .export_watcher import get_export_watcher, set_scene_import_running
+from .change_tracking import get_import_transform_array, get_modified_actor_transforms, mark_actor_obj_synced
+from .point_instancing import (
+    collapse_point_instances,
+    expand_point_instancer,
+    get_level_actor_entries,
+    has_point_instancers,
+    mark_point_instances_synced,
+    PointInstanceRecord,
+    is_point_instance_candidate,
+    is_point_instancer,
+)
+from .profiling import (
+    OperationProfile,
+    profile_count,
+    profile_iter,
+    profile_phase,
+    profiled,
+    run_profiled_operator,
+)
 # from .Toolsl import UBIOAddProxyPivotOperator, UBIOMirrorCopyActorsOperator
 
 
@@ -55,6 +110,7 @@ def make_collection(collection_name: str, type: str = "") -> bpy.types.Collectio
     return coll
 
 
+@profiled("collection_moves")
 def move_objs_to_collection(objs, collection_name: str) -> None:
     """
     将指定对象移动到指定集合中
@@ -82,21 +138,76 @@ def get_name_from_ue_path(path: str) -> str:
     return path.split(".")[-1]
 
 
-def convert_to_actor_instance(actor_obj):
+def create_collection_instance_obj(
+    name: str,
+    instance_coll: bpy.types.Collection,
+    target_collection: bpy.types.Collection,
+    location,
+    rotation,
+    scale,
+) -> bpy.types.Object:
+    """
+    通过data API创建collection instance empty（不调用operator）
+    参数：
+        name (str): 新对象名称
+        instance_coll (bpy.types.Collection): 被实例化的集合
+        target_collection (bpy.types.Collection): 新对象所在集合
+        location/rotation/scale: 新对象的transform
+    返回：
+        bpy.types.Object: 新的collection instance对象
+    """
+    inst_obj = bpy.data.objects.new(name, None)
+    inst_obj.instance_type = "COLLECTION"
+    inst_obj.instance_collection = instance_coll
+    inst_obj.location = location
+    inst_obj.rotation_euler = rotation
+    inst_obj.scale = scale
+    inst_obj.empty_display_size = 0.1
+    target_collection.objects.link(inst_obj)
+    return inst_obj
+
+
+def remove_objs_and_unused_meshes(objs) -> None:
+    """
+    批量删除对象，并删除因此变为无用户的Mesh
+    参数：
+        objs (list[bpy.types.Object]): 需要删除的对象
+    返回：
+        无
+    """
+    meshes = {obj.data for obj in objs if obj.type == "MESH" and obj.data is not None}
+    bpy.data.batch_remove(ids=list(objs))
+    unused_meshes = [mesh for mesh in meshes if mesh.users == 0]
+    if unused_meshes:
+        bpy.data.batch_remove(ids=unused_meshes)
+
+
+@profiled("instance_conversion")
+def convert_to_actor_instance(
+    actor_obj,
+    shared_collections: dict = None,
+    target_collection: bpy.types.Collection = None,
+):
     """
     把UE FBX导入actor的empty集合转换成更适合在Blender中使用的collection instance
     参数：
         actor_obj (bpy.types.Object): 需要转换的actor对象
+        shared_collections (dict): 可选，(ue_class, 几何签名) -> 共享集合 的缓存。
+            传入时，class与子对象几何都相同的Blueprint actor共用同一个集合，
+            重复的子对象会被直接删除
+        target_collection (bpy.types.Collection): 可选，actor及其子对象所在的集合；
+            已知时直接从该集合移出子对象，避免逐个查询users_collection（需遍历所有集合）
     返回：
         bpy.types.Object: 新的collection instance对象
     """
     actor_name = actor_obj.name
-    target_collection = actor_obj.users_collection[0]
-    temp_scene = bpy.data.scenes.new(actor_name)
+    if target_collection is None:
+        target_collection = actor_obj.users_collection[0]
     actor_type = actor_obj.get(Const.ACTORTYPE, None)
     actor_guid = actor_obj.get(Const.GUID, None)
     actor_fname = actor_obj.get(Const.FNAME, None)
     actor_class = actor_obj.get(Const.ACTORCLASS, None)
+    import_transform = actor_obj.get(Const.IMPORT_TRANSFORM, None)
     if actor_obj.type == "EMPTY":
         if actor_obj.instance_collection is not None:
             return None
@@ -108,50 +219,76 @@ def convert_to_actor_instance(actor_obj):
         target_objs = get_all_children(actor_obj)
     else:
         return None
-    for target_obj in target_objs:
-        for c in target_obj.users_collection:
-            c.objects.unlink(target_obj)
-        if target_obj.type == "EMPTY":
-            target_obj.empty_display_size = 0.01
-    scene_coll = temp_scene.collection
-    new_coll = bpy.data.collections.new(actor_name)
-    scene_coll.children.link(new_coll)
-    for o in target_objs:
-        new_coll.objects.link(o)
+
+    shared_key = None
+    instance_coll = None
+    if shared_collections is not None and actor_type in Const.COLLINST_TYPES:
+        shared_key = (actor_class, get_actor_geometry_signature(actor_obj, target_objs))
+        instance_coll = shared_collections.get(shared_key)
+
+    if instance_coll is None:
+        instance_coll = bpy.data.collections.new(actor_name)
+        instance_coll[Const.OWNED_ID] = True
+        for target_obj in target_objs:
+            try:
+                target_collection.objects.unlink(target_obj)
+            except RuntimeError:
+                for c in target_obj.users_collection:
+                    c.objects.unlink(target_obj)
+            if target_obj.type == "EMPTY":
+                target_obj.empty_display_size = 0.01
+            instance_coll.objects.link(target_obj)
+        if shared_key is not None:
+            shared_collections[shared_key] = instance_coll
+    elif target_objs:
+        # 与已有共享集合几何一致，子对象不再需要
+        remove_objs_and_unused_meshes(target_objs)
+
     bpy.data.objects.remove(actor_obj)
-    bpy.ops.object.collection_instance_add(
-        collection=new_coll.name,
-        location=target_location,
-        rotation=target_rotation,
-        scale=target_scale,
+    new_actor_obj = create_collection_instance_obj(
+        actor_name,
+        instance_coll,
+        target_collection,
+        target_location,
+        target_rotation,
+        target_scale,
     )
-    bpy.data.scenes.remove(temp_scene)
-    new_actor_obj = bpy.data.objects[actor_name]
     new_actor_obj[Const.GUID] = actor_guid
     new_actor_obj[Const.FNAME] = actor_fname
     new_actor_obj[Const.ACTORTYPE] = actor_type
     new_actor_obj[Const.ACTORCLASS] = actor_class
-    new_actor_obj.empty_display_size = 0.1
-    new_actor_obj.users_collection[0].objects.unlink(new_actor_obj)
-    target_collection.objects.link(new_actor_obj)
+    if import_transform is not None:
+        new_actor_obj[Const.IMPORT_TRANSFORM] = import_transform
     return new_actor_obj
 
 # =====================
 # 新增工具函数（集合与Actor相关）
 # =====================
 
-def get_or_create_main_collections(scene_data: dict):
+def get_level_collection_names(scene_data: dict) -> tuple:
     """
-    根据scene_data获取或创建主集合、main_level集合、level_asset集合
+    根据scene_data计算main_level集合与level_asset集合的名称
     参数：
-        scene_data (dict): UE导出json解析后的数据
+        scene_data (dict): UE导出json解析后的数据（至少包含main_level和level_path）
     返回：
-        (ubio_coll, main_level_coll, level_asset_coll): 三个集合对象
+        (main_level_name, level_path_name): 两个集合名称
     """
     main_level = scene_data.get("main_level", None)
     level_path = scene_data.get("level_path", None)
     main_level_name = get_name_from_ue_path(main_level)
     level_path_name = Const.MAINLEVEL if main_level == level_path else get_name_from_ue_path(level_path)
+    return main_level_name, level_path_name
+
+
+def get_or_create_main_collections(scene_data: dict):
+    """
+    根据scene_data获取或创建主集合、main_level集合、level_asset集合
+    参数：
+        scene_data (dict): UE导出json解析后的数据
+    返回：
+        (ubio_coll, main_level_coll, level_asset_coll): 三个集合对象
+    """
+    main_level_name, level_path_name = get_level_collection_names(scene_data)
     ubio_coll = make_collection(Const.UECOLL, type=Const.COLL_ROOT)
     main_level_coll = make_collection(main_level_name, type=Const.COLL_MAIN)
     level_asset_coll = make_collection(level_path_name, type=Const.COLL_LEVEL)
@@ -178,6 +315,7 @@ def setup_collection_hierarchy(ubio_coll: bpy.types.Collection, main_level_coll:
             scene_coll.children.unlink(bpy.data.collections[coll.name])
 
 
+@profiled("custom_props")
 def set_actor_custom_props(obj: bpy.types.Object, actor_dict: dict) -> None:
     """
     设置actor的自定义属性
@@ -191,6 +329,7 @@ def set_actor_custom_props(obj: bpy.types.Object, actor_dict: dict) -> None:
     obj[Const.FNAME] = actor_dict["fname"]
     obj[Const.ACTORTYPE] = actor_dict["actor_type"]
     obj[Const.ACTORCLASS] = actor_dict["class"]
+    obj[Const.IMPORT_TRANSFORM] = flatten_ue_transform(actor_dict.get("transform", {}))
 
 
 def clear_collection_and_children(coll: bpy.types.Collection) -> None:
@@ -209,6 +348,7 @@ def clear_collection_and_children(coll: bpy.types.Collection) -> None:
     bpy.data.collections.remove(coll)
 
 
+@profiled("clear_scene")
 def clear_imported_scene(ubio_coll: bpy.types.Collection, main_level_coll: bpy.types.Collection) -> None:
     """
     清理已导入的资源集合及其对象
@@ -221,8 +361,7 @@ def clear_imported_scene(ubio_coll: bpy.types.Collection, main_level_coll: bpy.t
     """
     if ubio_coll:
         objs_to_remove = [obj for obj in ubio_coll.all_objects]
-    for obj in objs_to_remove:
-        bpy.data.objects.remove(obj, do_unlink=True)
+    remove_ubio_objs_and_data(objs_to_remove)
     for coll in main_level_coll.children:
         main_level_coll.children.unlink(coll)
         bpy.data.collections.remove(coll)
@@ -238,8 +377,50 @@ def clear_imported_scene(ubio_coll: bpy.types.Collection, main_level_coll: bpy.t
     # bpy.data.collections.remove(main_level_coll)
     if not ubio_coll.children:
         bpy.data.collections.remove(ubio_coll)
-    bpy.ops.outliner.orphans_purge(do_local_ids=True)
-    
+
+
+@profiled("purge")
+def remove_ubio_objs_and_data(objs) -> None:
+    """
+    批量删除对象及其引用的、由UBIO导入创建（带Const.OWNED_ID标记）且因此变为无用户的datablock，
+    包括collection instance引用的集合及其中的对象、Mesh/Light、材质和贴图。
+    不带标记或仍被其它数据使用的datablock保持不变，耗时只与UBIO创建的数据量有关
+    参数：
+        objs (Iterable[bpy.types.Object]): 需要删除的对象
+    返回：
+        无
+    """
+    obdata = set()
+    materials = set()
+    objs_to_remove = set(objs)
+    # collection instance引用的集合在对象删除后才可能无用户，逐层删除集合及其中的对象
+    while objs_to_remove:
+        instance_colls = set()
+        for obj in objs_to_remove:
+            if obj.data is not None:
+                obdata.add(obj.data)
+            materials.update(slot.material for slot in obj.material_slots if slot.material is not None)
+            if is_ubio_owned(obj.instance_collection):
+                instance_colls.add(obj.instance_collection)
+        bpy.data.batch_remove(ids=list(objs_to_remove))
+        unused_colls = [coll for coll in instance_colls if coll.users == 0]
+        objs_to_remove = {obj for coll in unused_colls for obj in coll.all_objects}
+        if unused_colls:
+            bpy.data.batch_remove(ids=unused_colls)
+
+    images = set()
+    for material in materials:
+        if is_ubio_owned(material) and material.node_tree is not None:
+            images.update(
+                node.image for node in material.node_tree.nodes if node.type == "TEX_IMAGE" and node.image is not None
+            )
+    # 物体数据 -> 材质 -> 贴图 依次删除，上一层删除后下一层的用户数才会归零
+    for datablocks in (obdata, materials, images):
+        unused = [datablock for datablock in datablocks if is_ubio_owned(datablock) and datablock.users == 0]
+        if unused:
+            bpy.data.batch_remove(ids=unused)
+
+
 def find_gpro_objs(objs):
     """
     在给定对象列表中查找具有"GPro_Instance"几何节点修改器的对象，
@@ -276,7 +457,17 @@ def gen_random_color():
     color = (temp_color.r, temp_color.g, temp_color.b, 1.0)
     return color
 
-def set_random_color_by_class(target_objs):
+@profiled("colouring")
+def set_random_color_by_class(target_objs, reference_objs=None):
+    """
+    按ue_class为对象设置随机颜色
+    参数：
+        target_objs (Iterable[bpy.types.Object]): 需要着色的对象
+        reference_objs (Iterable[bpy.types.Object]): 可选，已着色的对象，
+            其class已有的颜色会被沿用（增量导入时保持颜色稳定）
+    返回：
+        无
+    """
     class_objects = {}
     for obj in target_objs:
         if Const.ACTORCLASS in obj:
@@ -285,11 +476,24 @@ def set_random_color_by_class(target_objs):
                 class_objects[actor_class] = []
             class_objects[actor_class].append(obj)
 
+    class_colors = {}
+    if reference_objs is not None:
+        target_obj_set = {obj for objects in class_objects.values() for obj in objects}
+        for obj in reference_objs:
+            actor_class = obj.get(Const.ACTORCLASS, None)
+            if actor_class in class_objects and actor_class not in class_colors:
+                if obj not in target_obj_set:
+                    class_colors[actor_class] = tuple(obj.color)
+
     # 为每个Class生成一个随机颜色，并设置对象颜色
     
     assigned_colors = set()
 
     for actor_class, objects in class_objects.items():
+        if actor_class in class_colors:
+            for obj in objects:
+                obj.color = class_colors[actor_class]
+            continue
         # 生成一个独特的随机颜色
         color = gen_random_color()
         # 确保颜色在一定程度上是独特的，避免过于相近的颜色
@@ -302,38 +506,211 @@ def set_random_color_by_class(target_objs):
             obj.color=color
     
     #Set View Mode
-    bpy.context.space_data.shading.color_type = 'OBJECT'
-    bpy.context.space_data.shading.type = 'SOLID'
-    bpy.context.space_data.shading.light = 'MATCAP'
-    
+    space_data = bpy.context.space_data
+    if space_data is not None and space_data.type == "VIEW_3D":
+        view_spaces = [space_data]
+    else:
+        # modal导入时context中不一定有3D视图，改为设置当前屏幕中的所有3D视图
+        screen = bpy.context.screen
+        view_spaces = [area.spaces.active for area in screen.areas if area.type == "VIEW_3D"] if screen else []
+    for space in view_spaces:
+        space.shading.color_type = 'OBJECT'
+        space.shading.type = 'SOLID'
+        space.shading.light = 'MATCAP'
 
-def import_json_scene(json_path: str):
-    print(tr("log.import_json_scene", path=json_path))
-    with open(json_path, "r") as f:
-        json_scene_data = json.load(f)
 
-    fbx_path = os.path.splitext(json_path)[0] + ".fbx"
-    if not os.path.exists(fbx_path):
-        print(tr("log.fbx_not_found", path=fbx_path))
-        return None
-    
-    ubio_coll, main_level_coll, level_asset_coll = get_or_create_main_collections(json_scene_data)
-    ubio_coll.color_tag = Const.UECOLL_COLOR
-    setup_collection_hierarchy(ubio_coll, main_level_coll, level_asset_coll)
+@profiled("fbx_import")
+def import_fbx_objects(fbx_path: str, target_collection: bpy.types.Collection = None) -> list:
+    """
+    以UBIO统一参数导入FBX，并返回新导入的对象
+    参数：
+        fbx_path (str): FBX文件路径
+        target_collection (bpy.types.Collection): 可选，导入时作为活动集合，对象直接链接到该集合；
+            无法设为活动集合时导入后再整体移动
+    返回：
+        list[bpy.types.Object]: 新导入的对象列表
+    """
     existing_objs = set(bpy.data.objects)
-    bpy.ops.import_scene.fbx(
-        filepath=fbx_path,
-        use_custom_normals=True,
-        use_custom_props=False,
-        use_image_search=False,
-        use_anim=False,
-        bake_space_transform=True,
+    datablock_snapshot = get_datablock_snapshot()
+    with use_active_collection(target_collection) if target_collection else nullcontext(True) as is_in_target:
+        bpy.ops.import_scene.fbx(
+            filepath=fbx_path,
+            use_custom_normals=True,
+            use_custom_props=False,
+            use_image_search=False,
+            use_anim=False,
+            bake_space_transform=True,
+        )
+    imported_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
+    tag_new_datablocks(datablock_snapshot)
+    if not is_in_target:
+        move_objs_to_collection(imported_objs, target_collection.name)
+    return imported_objs
+
+
+@profiled("usd_import")
+def import_usd_objects(usd_path: str, target_collection: bpy.types.Collection = None) -> list:
+    """
+    以UBIO统一参数导入USD（C++导入器，保留场景实例化），并返回新导入的对象
+    参数：
+        usd_path (str): USD文件路径
+        target_collection (bpy.types.Collection): 可选，导入时作为活动集合，对象直接链接到该集合
+    返回：
+        list[bpy.types.Object]: 新导入的对象列表
+    """
+    import_options = {
+        "filepath": usd_path,
+        "import_cameras": False,
+        "import_lights": True,
+        "import_materials": True,
+        "set_frame_range": False,
+    }
+    # 实例化选项在不同Blender版本中名称不同
+    op_props = bpy.ops.wm.usd_import.get_rna_type().properties.keys()
+    for instancing_prop in ("support_scene_instancing", "use_instancing"):
+        if instancing_prop in op_props:
+            import_options[instancing_prop] = True
+            break
+
+    existing_objs = set(bpy.data.objects)
+    datablock_snapshot = get_datablock_snapshot()
+    with use_active_collection(target_collection) if target_collection else nullcontext(True) as is_in_target:
+        bpy.ops.wm.usd_import(**import_options)
+    imported_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
+    tag_new_datablocks(datablock_snapshot)
+    if not is_in_target:
+        move_objs_to_collection(imported_objs, target_collection.name)
+    return imported_objs
+
+
+def map_usd_objs_to_actors(objs: list, actors: list) -> list:
+    """
+    把USD导入的对象与JSON中的actor对应起来：按fguid属性、actor名称、fname（转换为prim名称后）匹配，
+    匹配的对象改回actor名称并按JSON设置transform，之后的处理与FBX导入一致；
+    关卡根prim、actor文件夹等不对应actor的空物体会被删除
+    参数：
+        objs (list[bpy.types.Object]): USD导入的对象
+        actors (list[dict]): UE actor信息
+    返回：
+        list[bpy.types.Object]: 处理后仍然存在的导入对象
+    """
+    actor_by_prim_name = {}
+    actor_by_guid = {}
+    for actor in actors:
+        for name in (actor.get("fname"), actor.get("name")):
+            if name:
+                actor_by_prim_name[get_usd_prim_name(name)] = actor
+        if actor.get("fguid"):
+            actor_by_guid[actor["fguid"]] = actor
+
+    matched_actors = {}
+    matched_actor_ids = set()
+    for obj in objs:
+        actor = actor_by_guid.get(obj.get("fguid", None))
+        if actor is None:
+            actor = actor_by_prim_name.get(re.sub(r"\.\d{3,}$", "", obj.name))
+        if actor is not None and id(actor) not in matched_actor_ids:
+            matched_actors[obj] = actor
+            matched_actor_ids.add(id(actor))
+
+    # 先让出名称，避免改名时与其它导入对象冲突
+    for obj in matched_actors:
+        obj.name = f"{Const.USD_PRIM_PREFIX}{obj.name}"
+    transform_objs = []
+    for obj, actor in matched_actors.items():
+        obj.name = actor["name"]
+        if obj.parent is not None and obj.parent not in matched_actors:
+            world_matrix = obj.matrix_world.copy()
+            obj.parent = None
+            obj.matrix_world = world_matrix
+        if "transform" in actor:
+            transform_objs.append(obj)
+    set_actor_transforms(transform_objs, [matched_actors[obj]["transform"] for obj in transform_objs])
+
+    remaining_objs = list(objs)
+    while True:
+        wrapper_objs = [
+            obj
+            for obj in remaining_objs
+            if obj.type == "EMPTY" and obj not in matched_actors and not obj.children and obj.instance_collection is None
+        ]
+        if not wrapper_objs:
+            break
+        wrapper_set = set(wrapper_objs)
+        remaining_objs = [obj for obj in remaining_objs if obj not in wrapper_set]
+        bpy.data.batch_remove(ids=wrapper_objs)
+    return remaining_objs
+
+
+def import_level_objects(level_path: str, target_collection: bpy.types.Collection, actors) -> list:
+    """
+    导入关卡几何文件（FBX或USD），USD导入后按actor信息映射对象名称
+    参数：
+        level_path (str): 关卡FBX/USD路径
+        target_collection (bpy.types.Collection): 导入对象所在的集合
+        actors (list[dict]): UE actor信息（仅USD使用）
+    返回：
+        list[bpy.types.Object]: 新导入的对象列表
+    """
+    if is_usd_path(level_path):
+        return map_usd_objs_to_actors(import_usd_objects(level_path, target_collection), actors)
+    return import_fbx_objects(level_path, target_collection)
+
+
+def run_import_steps(steps):
+    """
+    同步执行导入步骤生成器直到结束
+    参数：
+        steps (Generator): iter_import_*系列生成器
+    返回：
+        生成器的返回值
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def process_imported_actor_objs(
+    ubio_objs: list,
+    actors,
+    level_asset_coll: bpy.types.Collection,
+    share_blueprint_instances: bool = False,
+) -> list:
+    """
+    把FBX导入的对象与JSON中的actor记录关联：写入自定义属性、转换collection instance、隐藏辅助empty
+    参数：
+        ubio_objs (list[bpy.types.Object]): 本次FBX导入的对象（已位于level_asset_coll中）
+        actors (Iterable[dict]): 需要关联的UE actor信息
+        level_asset_coll (bpy.types.Collection): Level Asset集合
+        share_blueprint_instances (bool): 是否让相同的Blueprint actor共用同一个Collection Instance
+    返回：
+        list[bpy.types.Object]: 处理后仍然存在的导入对象
+    """
+    return run_import_steps(
+        iter_process_imported_actor_objs(ubio_objs, actors, level_asset_coll, share_blueprint_instances)
     )
-    ubio_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
-    move_objs_to_collection(ubio_objs, level_asset_coll.name)
 
+
+def iter_process_imported_actor_objs(
+    ubio_objs: list,
+    actors,
+    level_asset_coll: bpy.types.Collection,
+    share_blueprint_instances: bool = False,
+):
+    """
+    process_imported_actor_objs的分步版本，每处理Const.IMPORT_CHUNK_SIZE个actor产出一次进度
+    参数：
+        同process_imported_actor_objs
+    返回：
+        Generator[(str, int)]: 产出 (进度阶段, 已处理actor数)，返回处理后仍然存在的导入对象
+    """
     level_instance_objs = [obj for obj in ubio_objs if obj.type == "EMPTY" and "LevelInstanceEditorInstanceActor" in obj.name]
-    for actor in json_scene_data["actors"]:
+    shared_collections = {} if share_blueprint_instances else None
+    for actor_index, actor in enumerate(actors, 1):
+        if actor_index % Const.IMPORT_CHUNK_SIZE == 0:
+            yield "progress.actors", actor_index
         obj = bpy.data.objects.get(actor["name"])
         if obj:
             set_actor_custom_props(obj, actor)
@@ -356,9 +733,13 @@ def import_json_scene(json_path: str):
             if is_coll_inst:
                 if obj in ubio_objs:
                     ubio_objs.remove(obj)
-                convert_to_actor_instance(obj)
+                convert_to_actor_instance(obj, shared_collections, level_asset_coll)
             elif is_light:
                 obj.hide_select = True
+    if shared_collections:
+        # 共享模式下重复的子对象已被删除
+        remaining_objs = set(bpy.data.objects)
+        ubio_objs = [obj for obj in ubio_objs if obj in remaining_objs]
     for obj in ubio_objs:
         if obj.type == "EMPTY" and len(obj.children) == 0:
             obj.hide_viewport = True
@@ -367,7 +748,537 @@ def import_json_scene(json_path: str):
     for obj in level_asset_coll.objects:
         if obj.type == 'EMPTY' and obj.name == Const.PROXY_PIVOT_OBJ:
             set_proxy_pivot_properties(obj)
+    return ubio_objs
+
+
+def iter_actors_with_snapshot(actors, snapshot: dict):
+    """
+    在actor流经导入流程时顺带记录 actor ID -> class 快照，避免再读一遍场景文件
+    参数：
+        actors (Iterable[dict]): UE actor信息
+        snapshot (dict): 用于写入快照的字典
+    返回：
+        Iterator[dict]: 原样产出的actor信息
+    """
+    for actor in actors:
+        snapshot[get_actor_id(actor)] = str(actor.get("class", ""))
+        yield actor
+
+
+def save_import_snapshot(level_asset_coll: bpy.types.Collection, actors) -> None:
+    """
+    在Level Asset集合上记录本次导入的actor状态（actor ID -> class），供增量导入比较
+    参数：
+        level_asset_coll (bpy.types.Collection): Level Asset集合
+        actors (Iterable[dict] or dict): UE actor信息列表，或已构建好的 ID -> class 字典
+    返回：
+        无
+    """
+    if isinstance(actors, dict):
+        snapshot = actors
+    else:
+        snapshot = {get_actor_id(actor): str(actor.get("class", "")) for actor in actors}
+    level_asset_coll[Const.IMPORT_SNAPSHOT] = json.dumps(snapshot, separators=(",", ":"))
+
+
+def load_import_snapshot(level_asset_coll: bpy.types.Collection):
+    """
+    读取上一次导入时记录的actor状态
+    参数：
+        level_asset_coll (bpy.types.Collection): Level Asset集合，可为None
+    返回：
+        dict or None: actor ID -> class，没有记录时返回None
+    """
+    if level_asset_coll is None:
+        return None
+    snapshot = level_asset_coll.get(Const.IMPORT_SNAPSHOT, None)
+    if not snapshot:
+        return None
+    try:
+        return json.loads(snapshot)
+    except ValueError:
+        return None
+
+
+def can_import_incrementally(scene_data: dict) -> bool:
+    """
+    判断当前Blender场景中是否存在同一关卡的上一次导入记录
+    参数：
+        scene_data (dict): UE导出json解析后的数据（至少包含main_level和level_path）
+    返回：
+        bool: 是否可以增量导入
+    """
+    main_level_name, level_path_name = get_level_collection_names(scene_data)
+    if bpy.data.collections.get(Const.UECOLL) is None:
+        return False
+    if bpy.data.collections.get(main_level_name) is None:
+        return False
+    level_asset_coll = bpy.data.collections.get(level_path_name)
+    if has_point_instancers(level_asset_coll):
+        # 点实例化的actor没有对应对象，无法逐个比较，改为完整导入
+        return False
+    return load_import_snapshot(level_asset_coll) is not None
+
+
+def remove_actor_objs(actor_objs) -> int:
+    """
+    删除actor对象及其子对象，并清理因此不再被使用的collection instance集合
+    参数：
+        actor_objs (Iterable[bpy.types.Object]): 需要删除的actor对象
+    返回：
+        int: 删除的actor数量
+    """
+    objs_to_remove = {}
+    instance_colls = set()
+    actor_count = 0
+    for obj in actor_objs:
+        actor_count += 1
+        for target_obj in [obj] + get_all_children(obj):
+            objs_to_remove[target_obj.name] = target_obj
+            if target_obj.instance_collection is not None:
+                instance_colls.add(target_obj.instance_collection)
+    if objs_to_remove:
+        remove_objs_and_unused_meshes(list(objs_to_remove.values()))
+    for coll in instance_colls:
+        if coll.users == 0:
+            clear_collection_and_children(coll)
+    return actor_count
+
+
+@profiled("level_subset_import")
+def import_level_subset(
+    level_path: str,
+    actors,
+    level_asset_coll: bpy.types.Collection,
+    dedup_meshes: bool = False,
+) -> list:
+    """
+    导入关卡FBX/USD，但只保留指定actor（及其子对象）的几何体，其余对象立即删除
+    参数：
+        level_path (str): 关卡FBX或USD路径
+        actors (list[dict]): 需要保留的UE actor信息
+        level_asset_coll (bpy.types.Collection): 保留对象移动到的Level Asset集合
+        dedup_meshes (bool): 是否合并保留对象中几何一致的Mesh
+    返回：
+        list[bpy.types.Object]: 保留下来的对象
+    """
+    actor_names = {actor["name"] for actor in actors}
+    level_instance_locations = [
+        (
+            actor["transform"]["location"]["x"] / 100,
+            -actor["transform"]["location"]["y"] / 100,
+            actor["transform"]["location"]["z"] / 100,
+        )
+        for actor in actors
+        if actor.get("actor_type") == "LevelInstance" and "transform" in actor
+    ]
+
+    imported_objs = import_level_objects(level_path, level_asset_coll, actors)
+    keep_objs = set()
+    for obj in imported_objs:
+        is_target = obj.name in actor_names
+        if not is_target and obj.type == "EMPTY" and "LevelInstanceEditorInstanceActor" in obj.name:
+            is_target = any(
+                (obj.location - Vector(location)).length < 1e-3
+                for location in level_instance_locations
+            )
+        if is_target:
+            keep_objs.add(obj)
+            keep_objs.update(get_all_children(obj))
+    discard_objs = [obj for obj in imported_objs if obj not in keep_objs]
+    kept_objs = [obj for obj in imported_objs if obj in keep_objs]
+    if discard_objs:
+        remove_objs_and_unused_meshes(discard_objs)
+    if dedup_meshes:
+        print(tr("log.dedup_meshes_done", count=dedup_object_meshes(kept_objs)))
+    return kept_objs
+
+
+def get_actor_proxy_mesh(actor: dict, actor_matrix: Matrix, proxy_meshes: dict):
+    """
+    根据actor的世界空间包围盒生成代理box mesh（actor局部空间），相同尺寸的box共用同一个mesh
+    参数：
+        actor (dict): UE actor信息（bounds为世界空间 origin/extent，单位cm）
+        actor_matrix (Matrix): actor在Blender中的变换矩阵
+        proxy_meshes (dict): 局部包围盒 -> mesh 的缓存
+    返回：
+        bpy.types.Mesh or None: 没有有效包围盒时返回None
+    """
+    bounds = actor.get("bounds", None)
+    if not bounds:
+        return None
+    origin = bounds["origin"]
+    extent = Vector((abs(bounds["extent"]["x"]), abs(bounds["extent"]["y"]), abs(bounds["extent"]["z"]))) / 100
+    if max(extent) < 1e-4 or abs(actor_matrix.determinant()) < 1e-12:
+        return None
+    center = Vector((origin["x"] / 100, -origin["y"] / 100, origin["z"] / 100))
+    matrix_inv = actor_matrix.inverted()
+    corners = [
+        matrix_inv @ (center + Vector((sx * extent.x, sy * extent.y, sz * extent.z)))
+        for sx in (-1, 1)
+        for sy in (-1, 1)
+        for sz in (-1, 1)
+    ]
+    bounds_min = [round(min(corner[axis] for corner in corners), 4) for axis in range(3)]
+    bounds_max = [round(max(corner[axis] for corner in corners), 4) for axis in range(3)]
+    mesh_key = (*bounds_min, *bounds_max)
+    mesh = proxy_meshes.get(mesh_key)
+    if mesh is None:
+        verts = [
+            (x, y, z)
+            for x in (bounds_min[0], bounds_max[0])
+            for y in (bounds_min[1], bounds_max[1])
+            for z in (bounds_min[2], bounds_max[2])
+        ]
+        faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+        mesh = bpy.data.meshes.new(Const.PROXY_MESH)
+        mesh.from_pydata(verts, [], faces)
+        mesh[Const.OWNED_ID] = True
+        proxy_meshes[mesh_key] = mesh
+    return mesh
+
+
+def iter_create_actor_proxy_objs(actors, level_asset_coll: bpy.types.Collection):
+    """
+    代理导入模式：不导入FBX，只按JSON的transform与bounds为每个actor创建box（无bounds时为empty）
+    代理对象带有与完整导入相同的自定义属性，可直接参与导出JSON；每创建Const.IMPORT_CHUNK_SIZE个代理产出一次进度
+    参数：
+        actors (Iterable[dict]): UE actor信息
+        level_asset_coll (bpy.types.Collection): 代理对象所在的Level Asset集合
+    返回：
+        Generator[(str, int)]: 产出 (进度阶段, 已处理actor数)，返回创建的代理对象
+    """
+    proxy_meshes = {}
+    proxy_objs = []
+    for actor_index, actor in enumerate(actors, 1):
+        if actor_index % Const.IMPORT_CHUNK_SIZE == 0:
+            yield "progress.actors", actor_index
+        location, rotation, scale = get_blender_transform_from_ue(actor["transform"])
+        mesh = get_actor_proxy_mesh(actor, Matrix.LocRotScale(location, Euler(rotation), scale), proxy_meshes)
+        obj = bpy.data.objects.new(actor["name"], mesh)
+        if mesh is None:
+            obj.empty_display_type = "PLAIN_AXES"
+            obj.empty_display_size = 0.2
+        else:
+            obj.display_type = "WIRE"
+        obj.location = location
+        obj.rotation_euler = rotation
+        obj.scale = scale
+        level_asset_coll.objects.link(obj)
+        set_actor_custom_props(obj, actor)
+        obj[Const.PROXY_ACTOR] = True
+        proxy_objs.append(obj)
+    return proxy_objs
+
+
+def expand_proxy_actor_objs(
+    json_path: str,
+    proxy_objs,
+    share_blueprint_instances: bool = False,
+    dedup_meshes: bool = False,
+    level_format: str = Const.LEVEL_FORMAT_FBX,
+):
+    """
+    把代理对象替换为关卡FBX/USD中的真实几何体，保留代理对象在Blender中被修改后的transform
+    参数：
+        json_path (str): UE导出的JSON路径（同名FBX/USD需在同一目录）
+        proxy_objs (list[bpy.types.Object]): 需要展开的代理对象
+        share_blueprint_instances (bool): 是否让相同的Blueprint actor共用同一个Collection Instance
+        dedup_meshes (bool): 是否合并几何一致的Mesh
+        level_format (str): 关卡几何文件格式，Const.LEVEL_FORMAT_FBX 或 Const.LEVEL_FORMAT_USD
+    返回：
+        list[bpy.types.Object] or None: 展开后的actor对象；关卡文件不存在时返回None
+    """
+    level_path = get_level_file_path(json_path, level_format)
+    if not os.path.exists(level_path):
+        print(tr("log.level_file_not_found", path=level_path))
+        return None
+    _main_level_name, level_path_name = get_level_collection_names(read_scene_header(json_path))
+    level_asset_coll = bpy.data.collections.get(level_path_name)
+    if level_asset_coll is None:
+        return None
+
+    proxy_by_id = {get_actor_id_from_obj(obj): obj for obj in proxy_objs}
+    actors = [actor for actor in iter_scene_actors(json_path) if get_actor_id(actor) in proxy_by_id]
+    if not actors:
+        return []
+    # 代理对象先让出名称，FBX中的同名对象才能保持actor原名
+    proxy_names = {}
+    for actor in actors:
+        proxy_obj = proxy_by_id[get_actor_id(actor)]
+        proxy_names[proxy_obj] = proxy_obj.name
+        proxy_obj.name = f"{Const.PROXY_ACTOR}_{proxy_obj.name}"
+
+    new_objs = import_level_subset(level_path, actors, level_asset_coll, dedup_meshes=dedup_meshes)
+    process_imported_actor_objs(
+        new_objs,
+        actors,
+        level_asset_coll,
+        share_blueprint_instances=share_blueprint_instances,
+    )
+
+    expanded_objs = []
+    expanded_proxies = []
+    for actor in actors:
+        proxy_obj = proxy_by_id[get_actor_id(actor)]
+        actor_obj = level_asset_coll.objects.get(actor["name"])
+        if actor_obj is None:
+            # FBX中没有该actor（如灯光），保留代理
+            proxy_obj.name = proxy_names[proxy_obj]
+            continue
+        actor_obj.location = proxy_obj.location
+        actor_obj.rotation_euler = proxy_obj.rotation_euler
+        actor_obj.scale = proxy_obj.scale
+        expanded_objs.append(actor_obj)
+        expanded_proxies.append(proxy_obj)
+    if expanded_proxies:
+        remove_objs_and_unused_meshes(expanded_proxies)
+    set_random_color_by_class(expanded_objs, reference_objs=level_asset_coll.objects)
+    return expanded_objs
+
+
+def get_import_region(params):
+    """
+    根据UI参数计算导入区域
+    参数：
+        params (UBIO_PG_Params): UI参数
+    返回：
+        tuple or None: (最小点, 最大点)，Blender空间（米）；未启用区域导入时返回None
+    """
+    if params.ubio_region_mode == Const.REGION_MODE_BOX:
+        region_min = tuple(min(a, b) for a, b in zip(params.ubio_region_min, params.ubio_region_max))
+        region_max = tuple(max(a, b) for a, b in zip(params.ubio_region_min, params.ubio_region_max))
+        return region_min, region_max
+    if params.ubio_region_mode == Const.REGION_MODE_GRID:
+        cell_size = params.ubio_region_cell_size
+        cell_x, cell_y = params.ubio_region_cell
+        return (
+            (cell_x * cell_size, cell_y * cell_size, float("-inf")),
+            ((cell_x + 1) * cell_size, (cell_y + 1) * cell_size, float("inf")),
+        )
+    return None
+
+
+def import_json_scene(
+    json_path: str,
+    share_blueprint_instances: bool = False,
+    proxy: bool = False,
+    dedup_meshes: bool = False,
+    region: tuple = None,
+    level_format: str = Const.LEVEL_FORMAT_FBX,
+    point_instance: bool = False,
+):
+    """
+    导入UE导出的JSON + FBX场景
+    参数：
+        json_path (str): UE导出的JSON路径（同名FBX需在同一目录）
+        share_blueprint_instances (bool): 是否让相同的Blueprint actor共用同一个Collection Instance
+        proxy (bool): 代理模式，只按bounds创建box，不导入FBX
+        dedup_meshes (bool): 导入FBX后合并几何一致的Mesh（关卡FBX中每个actor都有独立的Mesh）
+        region (tuple or None): (最小点, 最大点)，Blender空间的导入区域；为None时导入整个关卡
+        level_format (str): 关卡几何文件格式，Const.LEVEL_FORMAT_FBX 或 Const.LEVEL_FORMAT_USD（同名.usd/.usdc/.usda）
+        point_instance (bool): 把引用同一Mesh的StaticMesh actor合并为点实例化对象（会同时合并Mesh）
+    返回：
+        bpy.types.Collection or None: UnrealIO根集合，失败时返回None
+    """
+    return run_import_steps(
+        iter_import_json_scene(
+            json_path, share_blueprint_instances, proxy, dedup_meshes, region, level_format, point_instance
+        )
+    )
+
+
+def iter_import_json_scene(
+    json_path: str,
+    share_blueprint_instances: bool = False,
+    proxy: bool = False,
+    dedup_meshes: bool = False,
+    region: tuple = None,
+    level_format: str = Const.LEVEL_FORMAT_FBX,
+    point_instance: bool = False,
+):
+    """
+    import_json_scene的分步版本：FBX导入仍是一次阻塞调用，之后的actor处理按块产出进度，
+    供modal operator在timer中逐步推进（关闭生成器即可中途取消）
+    参数：
+        同import_json_scene
+    返回：
+        Generator[(str, int)]: 产出 (进度阶段, 已处理actor数)，返回UnrealIO根集合，失败时返回None
+    """
+    print(tr("log.import_json_scene", path=json_path))
+    with profile_phase("json_header"):
+        json_scene_header = read_scene_header(json_path)
+
+    level_path = get_level_file_path(json_path, level_format)
+    if not proxy and not os.path.exists(level_path):
+        print(tr("log.level_file_not_found", path=level_path))
+        return None
+    
+    ubio_coll, main_level_coll, level_asset_coll = get_or_create_main_collections(json_scene_header)
+    ubio_coll.color_tag = Const.UECOLL_COLOR
+    setup_collection_hierarchy(ubio_coll, main_level_coll, level_asset_coll)
+    # 点实例化按Mesh分组，需要先合并几何一致的Mesh
+    dedup_meshes = dedup_meshes or point_instance
+
+    import_snapshot = {}
+    actors = profile_iter(iter_scene_actors(json_path), "json_load", "actors")
+    if region is not None:
+        actors = [actor for actor in actors if is_actor_in_region(actor, *region)]
+        print(tr("log.region_actor_count", count=len(actors)))
+    actors = iter_actors_with_snapshot(actors, import_snapshot)
+    if proxy:
+        yield from iter_create_actor_proxy_objs(actors, level_asset_coll)
+    elif region is not None:
+        # 只保留区域内actor的几何体，快照在list()时已填充
+        actors = list(actors)
+        yield "progress.fbx_import", 0
+        ubio_objs = import_level_subset(level_path, actors, level_asset_coll, dedup_meshes=dedup_meshes)
+        yield from iter_process_imported_actor_objs(
+            ubio_objs,
+            actors,
+            level_asset_coll,
+            share_blueprint_instances=share_blueprint_instances,
+        )
+    else:
+        if is_usd_path(level_path):
+            # USD对象需要先按actor信息映射名称，快照在list()时已填充
+            actors = list(actors)
+        yield "progress.fbx_import", 0
+        ubio_objs = import_level_objects(level_path, level_asset_coll, actors)
+        profile_count("objects", len(ubio_objs))
+        if dedup_meshes:
+            print(tr("log.dedup_meshes_done", count=dedup_object_meshes(ubio_objs)))
+        yield from iter_process_imported_actor_objs(
+            ubio_objs,
+            actors,
+            level_asset_coll,
+            share_blueprint_instances=share_blueprint_instances,
+        )
+    if point_instance and not proxy:
+        instancers = collapse_point_instances(list(level_asset_coll.objects), level_asset_coll)
+        print(tr("log.point_instancers_done", count=len(instancers)))
+    yield "progress.colour", len(import_snapshot)
     set_random_color_by_class(level_asset_coll.objects)
+    save_import_snapshot(level_asset_coll, import_snapshot)
+    return ubio_coll
+
+
+def iter_import_json_scene_incremental(
+    json_path: str,
+    share_blueprint_instances: bool = False,
+    proxy: bool = False,
+    dedup_meshes: bool = False,
+    region: tuple = None,
+    level_format: str = Const.LEVEL_FORMAT_FBX,
+):
+    """
+    根据上一次导入记录增量更新场景：原地更新transform、删除已移除的actor，
+    只为新增、class发生变化或在Blender中被删除的actor从FBX中导入几何体；
+    非代理模式下关卡文件不存在时不修改场景，直接返回None
+    参数：
+        json_path (str): UE导出的JSON路径（同名FBX需在同一目录）
+        share_blueprint_instances (bool): 是否让相同的Blueprint actor共用同一个Collection Instance
+        proxy (bool): 代理模式，新增actor只创建box，不导入FBX
+        dedup_meshes (bool): 是否合并新导入对象中几何一致的Mesh
+        region (tuple or None): (最小点, 最大点)，Blender空间的导入区域；区域外的actor视为不在本次导入中
+        level_format (str): 关卡几何文件格式，Const.LEVEL_FORMAT_FBX 或 Const.LEVEL_FORMAT_USD
+    返回：
+        Generator[(str, int)]: 产出 (进度阶段, 已处理actor数)，返回UnrealIO根集合；没有可用的导入记录或失败时返回None
+    """
+    print(tr("log.import_json_scene_incremental", path=json_path))
+    with profile_phase("json_header"):
+        json_scene_header = read_scene_header(json_path)
+
+    _main_level_name, level_path_name = get_level_collection_names(json_scene_header)
+    ubio_coll = bpy.data.collections.get(Const.UECOLL)
+    level_asset_coll = bpy.data.collections.get(level_path_name)
+    previous_snapshot = load_import_snapshot(level_asset_coll)
+    if ubio_coll is None or previous_snapshot is None:
+        return None
+    # 在修改场景之前确认关卡文件存在：返回None后会回退到完整导入，场景不能已被改动一半
+    level_path = None
+    if not proxy:
+        level_path = get_level_file_path(json_path, level_format)
+        if not os.path.exists(level_path):
+            print(tr("log.level_file_not_found", path=level_path))
+            return None
+
+    obj_by_id = {}
+    for obj in level_asset_coll.objects:
+        actor_id = get_actor_id_from_obj(obj)
+        if actor_id:
+            obj_by_id.setdefault(actor_id, obj)
+
+    new_snapshot = {}
+    pending_actors = []
+    objs_to_remove = []
+    kept_objs = []
+    kept_transforms = []
+    for actor_index, actor in enumerate(profile_iter(iter_scene_actors(json_path), "json_load", "actors"), 1):
+        if actor_index % Const.IMPORT_CHUNK_SIZE == 0:
+            yield "progress.actors", actor_index
+        if region is not None and not is_actor_in_region(actor, *region):
+            continue
+        actor_id = get_actor_id(actor)
+        actor_class = str(actor.get("class", ""))
+        new_snapshot[actor_id] = actor_class
+        obj = obj_by_id.get(actor_id)
+        if previous_snapshot.get(actor_id) != actor_class or obj is None:
+            # 新增、class变化或在Blender中被删除：需要重新获取几何体
+            if obj is not None:
+                objs_to_remove.append(obj)
+            pending_actors.append(actor)
+            continue
+        if obj.name != actor["name"]:
+            obj.name = actor["name"]
+        kept_objs.append(obj)
+        kept_transforms.append(actor.get("transform", {}))
+
+    # 保留的actor批量比较同步transform，只更新UE端移动过的对象
+    with profile_phase("transforms"):
+        ue_values = ue_transform_dicts_to_array(kept_transforms)
+        is_moved = ~are_flat_transforms_close(get_import_transform_array(kept_objs), ue_values)
+        moved_objs = [obj for obj, moved in zip(kept_objs, is_moved.tolist()) if moved]
+        moved_values = ue_values[is_moved]
+        set_actor_transforms(moved_objs, moved_values)
+        for obj, transform_values in zip(moved_objs, moved_values.tolist()):
+            mark_actor_obj_synced(obj, transform_values)
+    moved_count = len(moved_objs)
+
+    for actor_id in previous_snapshot.keys() - new_snapshot.keys():
+        obj = obj_by_id.get(actor_id)
+        if obj is not None:
+            objs_to_remove.append(obj)
+    removed_count = remove_actor_objs(objs_to_remove)
+
+    if pending_actors and proxy:
+        new_objs = yield from iter_create_actor_proxy_objs(pending_actors, level_asset_coll)
+        set_random_color_by_class(new_objs, reference_objs=level_asset_coll.objects)
+    elif pending_actors:
+        yield "progress.fbx_import", 0
+        new_objs = import_level_subset(level_path, pending_actors, level_asset_coll, dedup_meshes=dedup_meshes)
+        yield from iter_process_imported_actor_objs(
+            new_objs,
+            pending_actors,
+            level_asset_coll,
+            share_blueprint_instances=share_blueprint_instances,
+        )
+        yield "progress.colour", len(new_snapshot)
+        new_actor_names = {actor["name"] for actor in pending_actors}
+        set_random_color_by_class(
+            [obj for obj in level_asset_coll.objects if obj.name in new_actor_names],
+            reference_objs=level_asset_coll.objects,
+        )
+
+    save_import_snapshot(level_asset_coll, new_snapshot)
+    print(
+        tr(
+            "log.incremental_import_done",
+            moved=moved_count,
+            removed=removed_count,
+            added=len(pending_actors),
+        )
+    )
     return ubio_coll
 
 
@@ -397,43 +1308,58 @@ def import_static_mesh_session(session_file: str):
     if session_data.get("session_type") != Const.STATIC_MESH_SESSION_TYPE:
         raise ValueError("invalid_session_type")
 
-    source_fbx = session_data.get("paths", {}).get("source_fbx")
-    if not source_fbx or not os.path.isfile(source_fbx):
-        raise FileNotFoundError(source_fbx or "")
+    session_assets = get_static_mesh_session_assets(session_data)
+    for asset in session_assets:
+        source_fbx = asset.get("source_fbx")
+        if not source_fbx or not os.path.isfile(source_fbx):
+            raise FileNotFoundError(source_fbx or "")
 
+    # 会话集合按session_id从注册表查找（集合被改名后仍能找到），不存在时新建
     collection_name = build_static_mesh_collection_name(session_data)
-    session_collection = bpy.data.collections.get(collection_name)
+    session_collection = get_static_mesh_session_registry().get_collection(session_data.get("session_id", ""))
     if session_collection is None:
         session_collection = bpy.data.collections.new(collection_name)
         bpy.context.scene.collection.children.link(session_collection)
     else:
-        for obj in list(session_collection.objects):
+        for obj in list(session_collection.all_objects):
             bpy.data.objects.remove(obj, do_unlink=True)
-
-    existing_objs = set(bpy.data.objects)
-    bpy.ops.import_scene.fbx(
-        filepath=source_fbx,
-        use_custom_normals=True,
-        use_custom_props=False,
-        use_image_search=False,
-        use_anim=False,
-        bake_space_transform=True,
-    )
-    imported_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
+        for child_collection in list(session_collection.children):
+            bpy.data.collections.remove(child_collection)
+
+    # 批量会话在一次调用中逐个导入所有资产的FBX，对象按资产序号标记；
+    # 各资产都位于原点，分别放入会话集合下的子集合，便于单独显示/隐藏（不偏移对象，导出时pivot保持不变）
+    is_batch_session = len(session_assets) > 1
+    imported_objs = []
+    imported_asset_objs = []
+    for asset_index, asset in enumerate(session_assets):
+        asset_collection = session_collection
+        if is_batch_session:
+            asset_collection = bpy.data.collections.new(
+                build_static_mesh_asset_collection_name(session_data, asset_index)
+            )
+            session_collection.children.link(asset_collection)
+        asset_objs = import_fbx_objects(asset["source_fbx"], asset_collection)
+        imported_asset_objs.append(asset_objs)
+        for obj in asset_objs:
+            apply_static_mesh_session_metadata(
+                obj,
+                session_file,
+                session_data,
+                collection_name=session_collection.name,
+                asset_index=asset_index,
+            )
+        imported_objs.extend(asset_objs)
 
     if not imported_objs:
         raise RuntimeError("no_imported_objects")
 
-    for obj in imported_objs:
-        for coll in list(obj.users_collection):
-            coll.objects.unlink(obj)
-        session_collection.objects.link(obj)
-        apply_static_mesh_session_metadata(
-            obj,
-            session_file,
-            session_data,
-            collection_name=session_collection.name,
-        )
+    # ue_fingerprint记录UE端资产当前对应的几何体，导出时与之比较判断是否需要重新导入。
+    # UE已重新导入过Blender的修改时，source_fbx仍是修改前的几何体，保留UE端记录的指纹（或上次导出的指纹）
+    ue_was_reimported = session_data.get("status") == Const.STATIC_MESH_STATUS_REIMPORTED_IN_UE
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for asset, asset_objs in zip(session_assets, imported_asset_objs):
+        ue_fingerprint = asset.get("ue_fingerprint") or asset.get("export_fingerprint") if ue_was_reimported else None
+        asset["ue_fingerprint"] = ue_fingerprint or get_static_mesh_objects_fingerprint(asset_objs, depsgraph)
 
     apply_static_mesh_session_metadata(
         session_collection,
@@ -441,6 +1367,9 @@ def import_static_mesh_session(session_file: str):
         session_data,
         collection_name=session_collection.name,
     )
+    get_static_mesh_session_registry().register_session(
+        session_data.get("session_id", ""), imported_objs, session_collection
+    )
     update_static_mesh_session_status(
         session_data,
         Const.STATIC_MESH_STATUS_IMPORTED_IN_BLENDER,
@@ -456,20 +1385,32 @@ def import_static_mesh_session(session_file: str):
     return session_data, imported_objs
 
 
-def export_static_mesh_session_to_fbx(context, session_file: str, session_data: dict):
+@profiled("fbx_export")
+def export_static_mesh_session_to_fbx(context, session_file: str, session_data: dict) -> list:
+    """
+    把会话中每个资产修改后的对象导出为各自的edited FBX，并更新会话文件
+    参数：
+        context (bpy.types.Context): 上下文
+        session_file (str): 会话文件路径
+        session_data (dict): 会话数据
+    返回：
+        list[str]: 本次导出的edited FBX路径；几何体都未修改时为空列表
+    """
     session_id = session_data.get("session_id", "")
-    export_objects = [
-        obj
-        for obj in find_static_mesh_session_objects(session_id)
-        if obj.type in {"MESH", "EMPTY"}
-    ]
-
-    if not export_objects:
+    session_assets = get_static_mesh_session_assets(session_data)
+    asset_export_objects = {}
+    for obj in find_static_mesh_session_objects(session_id):
+        if obj.type not in {"MESH", "EMPTY"}:
+            continue
+        asset_index = obj.get(Const.STATIC_MESH_PROP_ASSET_INDEX, 0)
+        if 0 <= asset_index < len(session_assets):
+            asset_export_objects.setdefault(asset_index, []).append(obj)
+
+    if not asset_export_objects:
         raise RuntimeError("no_export_objects")
 
     session_dir = os.path.dirname(session_file)
     ensure_directory(session_dir)
-    edited_fbx_path = session_data.get("paths", {}).get("edited_fbx") or get_static_mesh_edited_fbx(session_dir)
 
     previous_active = context.view_layer.objects.active
     previous_selection = list(context.selected_objects)
@@ -478,24 +1419,42 @@ def export_static_mesh_session_to_fbx(context, session_file: str, session_data:
     if previous_active is not None and previous_active.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
 
-    bpy.ops.object.select_all(action="DESELECT")
-    export_objects.sort(key=lambda obj: (obj.type != "MESH", obj.name))
-    for obj in export_objects:
-        obj.select_set(True)
-    context.view_layer.objects.active = export_objects[0]
-
-    bpy.ops.export_scene.fbx(
-        filepath=edited_fbx_path,
-        use_selection=True,
-        object_types={"MESH", "EMPTY"},
-        use_mesh_modifiers=True,
-        apply_unit_scale=True,
-        bake_space_transform=False,
-        axis_forward="-Z",
-        axis_up="Y",
-        add_leaf_bones=False,
-        path_mode="AUTO",
-    )
+    # 每个资产导出到各自的edited FBX；没有对象或几何指纹与UE端一致的资产标记为unchanged，
+    # 不导出FBX，UE端跳过重新导入和保存
+    depsgraph = context.evaluated_depsgraph_get()
+    edited_fbx_paths = []
+    for asset_index, asset in enumerate(session_assets):
+        export_objects = asset_export_objects.get(asset_index)
+        if not export_objects:
+            asset["unchanged"] = True
+            continue
+        fingerprint = get_static_mesh_objects_fingerprint(export_objects, depsgraph)
+        asset["export_fingerprint"] = fingerprint
+        asset["unchanged"] = fingerprint == asset.get("ue_fingerprint")
+        if asset["unchanged"]:
+            continue
+        edited_fbx_path = asset.get("edited_fbx") or get_static_mesh_edited_fbx(session_dir)
+        asset["edited_fbx"] = edited_fbx_path
+
+        bpy.ops.object.select_all(action="DESELECT")
+        export_objects.sort(key=lambda obj: (obj.type != "MESH", obj.name))
+        for obj in export_objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = export_objects[0]
+
+        bpy.ops.export_scene.fbx(
+            filepath=edited_fbx_path,
+            use_selection=True,
+            object_types={"MESH", "EMPTY"},
+            use_mesh_modifiers=True,
+            apply_unit_scale=True,
+            bake_space_transform=False,
+            axis_forward="-Z",
+            axis_up="Y",
+            add_leaf_bones=False,
+            path_mode="AUTO",
+        )
+        edited_fbx_paths.append(edited_fbx_path)
 
     bpy.ops.object.select_all(action="DESELECT")
     for obj in previous_selection:
@@ -507,14 +1466,16 @@ def export_static_mesh_session_to_fbx(context, session_file: str, session_data:
             bpy.ops.object.mode_set(mode=previous_mode)
 
     session_data.setdefault("paths", {})
-    session_data["paths"]["edited_fbx"] = edited_fbx_path
+    session_data["paths"]["edited_fbx"] = session_assets[0].get("edited_fbx") or get_static_mesh_edited_fbx(session_dir)
+    session_data["assets"] = session_assets
+    session_data["unchanged"] = not edited_fbx_paths
     update_static_mesh_session_status(
         session_data,
         Const.STATIC_MESH_STATUS_EXPORTED_FROM_BLENDER,
         "exported_from_blender",
     )
     save_static_mesh_session(session_file, session_data)
-    return edited_fbx_path
+    return edited_fbx_paths
 
 # =====================
 # 主要操作类
@@ -525,9 +1486,12 @@ class UBIO_OT_ImportLatestStaticMeshSession(bpy.types.Operator):
     bl_description = msgid("op.import_latest_static_mesh.desc")
     bl_options = {"UNDO"}
 
-    latest_session_path: bpy.props.StringProperty()
+    latest_session_path: bpy.props.StringProperty(options={"SKIP_SAVE"})
 
     def execute(self, context):
+        return run_profiled_operator(self, "import_static_mesh_session", self.run_operator, context)
+
+    def run_operator(self, context):
         if not self.latest_session_path or not os.path.isfile(self.latest_session_path):
             self.report({"ERROR"}, tr("report.static_mesh.latest_session_not_found"))
             return {"CANCELLED"}
@@ -563,6 +1527,8 @@ class UBIO_OT_ImportLatestStaticMeshSession(bpy.types.Operator):
         return {"FINISHED"}
 
     def invoke(self, context, event):
+        if self.latest_session_path:
+            return self.execute(context)
         latest_session_path = find_latest_static_mesh_session_file()
         if not latest_session_path:
             self.report(
@@ -584,6 +1550,9 @@ class UBIO_OT_ImportStaticMeshSession(bpy.types.Operator):
     bl_options = {"UNDO"}
 
     def execute(self, context):
+        return run_profiled_operator(self, "import_static_mesh_session", self.run_operator, context)
+
+    def run_operator(self, context):
         params = context.scene.ubio_params
         session_path = params.ubio_static_mesh_session_path
         if not session_path or not os.path.isfile(session_path):
@@ -628,6 +1597,9 @@ class UBIO_OT_ExportStaticMeshSession(bpy.types.Operator):
     bl_options = {"UNDO"}
 
     def execute(self, context):
+        return run_profiled_operator(self, "export_static_mesh_session", self.run_operator, context)
+
+    def run_operator(self, context):
         params = context.scene.ubio_params
         session_file, source_obj = get_static_mesh_session_context(context)
         if not session_file or not os.path.isfile(session_file):
@@ -639,7 +1611,7 @@ class UBIO_OT_ExportStaticMeshSession(bpy.types.Operator):
 
         try:
             session_data = load_static_mesh_session(session_file)
-            edited_fbx_path = export_static_mesh_session_to_fbx(context, session_file, session_data)
+            edited_fbx_paths = export_static_mesh_session_to_fbx(context, session_file, session_data)
         except RuntimeError as exc:
             if str(exc) == "no_export_objects":
                 self.report({"ERROR"}, tr("report.static_mesh.no_export_objects"))
@@ -653,130 +1625,341 @@ class UBIO_OT_ExportStaticMeshSession(bpy.types.Operator):
         params.ubio_static_mesh_session_path = session_file
         if source_obj is not None:
             source_obj.select_set(True)
+        if not edited_fbx_paths:
+            self.report({"INFO"}, tr("report.static_mesh.export_unchanged"))
+            return {"FINISHED"}
+        if len(edited_fbx_paths) > 1:
+            self.report(
+                {"INFO"},
+                tr(
+                    "report.static_mesh.export_batch_success",
+                    count=len(edited_fbx_paths),
+                    path=os.path.dirname(session_file),
+                ),
+            )
+            return {"FINISHED"}
         self.report(
             {"INFO"},
             tr(
                 "report.static_mesh.export_success",
-                path=edited_fbx_path,
+                path=edited_fbx_paths[0],
             ),
         )
         return {"FINISHED"}
 
 
-class UBIO_OT_ImportLatestUnrealScene(bpy.types.Operator):
+class SceneImportModal:
+    """
+    场景导入的modal流程，UBIO_OT_ImportUnrealScene 与 UBIO_OT_ImportLatestUnrealScene 共用；
+    导入的JSON路径取自 ubio_params.ubio_json_path
+    """
+
+    _timer = None
+    _import_steps = None
+    _profile = None
+    _actor_count = 0
+    _is_incremental = False
+
+    def create_import_steps(self, context):
+        """
+        检查导入条件并创建导入步骤生成器
+        返回：
+            Generator or None: 导入步骤，条件不满足时返回None（已report错误）
+        """
+        params = context.scene.ubio_params
+        json_path = params.ubio_json_path
+        json_scene_header = read_scene_header(json_path)
+        is_proxy = params.ubio_import_mode == Const.IMPORT_MODE_PROXY
+        is_point_instance = params.ubio_import_mode == Const.IMPORT_MODE_POINTS
+        level_path = get_level_file_path(json_path, params.ubio_level_format)
+        if not is_proxy and not os.path.exists(level_path):
+            self.report({"ERROR"}, tr("report.import_scene.level_file_not_found", path=level_path))
+            return None
+        if bpy.context.scene.unit_settings.length_unit != "CENTIMETERS":
+            self.report({"WARNING"}, tr("report.import_scene.unit_not_cm"))
+        self._actor_count = json_scene_header.get("actor_count", 0)
+        self._is_incremental = params.ubio_incremental_import and can_import_incrementally(json_scene_header)
+        import_options = {
+            "share_blueprint_instances": params.ubio_share_blueprint_instances,
+            "proxy": is_proxy,
+            "dedup_meshes": params.ubio_dedup_meshes,
+            "region": get_import_region(params),
+            "level_format": params.ubio_level_format,
+        }
+
+        def iter_import_steps():
+            ubio_collection = None
+            if self._is_incremental:
+                ubio_collection = yield from iter_import_json_scene_incremental(json_path, **import_options)
+            if ubio_collection is None:
+                ubio_collection = yield from iter_import_json_scene(
+                    json_path, point_instance=is_point_instance, **import_options
+                )
+            return ubio_collection
+
+        return iter_import_steps()
+
+    def finish_import(self, context, ubio_collection):
+        profile_summary = self._profile.finish()
+        if ubio_collection is None:
+            self.report({"ERROR"}, tr("report.import_scene.failed"))
+            return {"CANCELLED"}
+        json_path = context.scene.ubio_params.ubio_json_path
+        self.report({"INFO"}, tr("report.import_scene.success", filename=os.path.basename(json_path)))
+        self.report({"INFO"}, profile_summary)
+        return {"FINISHED"}
+
+    def run_import(self, context):
+        """不经过modal，一次性完成导入（脚本调用execute时）"""
+        self._profile = OperationProfile("import_scene")
+        with self._profile.activate():
+            import_steps = self.create_import_steps(context)
+            if import_steps is None:
+                return {"CANCELLED"}
+            ubio_collection = run_import_steps(import_steps)
+        return self.finish_import(context, ubio_collection)
+
+    def start_import(self, context):
+        """
+        清理上一次导入的场景（增量导入除外）并启动modal导入
+        """
+        json_scene_header = read_scene_header(context.scene.ubio_params.ubio_json_path)
+        main_level_name, _level_path_name = get_level_collection_names(json_scene_header)
+        ubio_coll = bpy.data.collections.get(Const.UECOLL)
+        main_level_coll = bpy.data.collections.get(main_level_name)
+        params = context.scene.ubio_params
+        is_incremental = params.ubio_incremental_import and can_import_incrementally(json_scene_header)
+        self._profile = OperationProfile("import_scene")
+        with self._profile.activate():
+            if ubio_coll and main_level_coll and not is_incremental:
+                clear_imported_scene(ubio_coll, main_level_coll)
+            self._import_steps = self.create_import_steps(context)
+        if self._import_steps is None:
+            return {"CANCELLED"}
+        window_manager = context.window_manager
+        window_manager.progress_begin(0, 100)
+        self._timer = window_manager.event_timer_add(Const.IMPORT_TIMER_INTERVAL, window=context.window)
+        window_manager.modal_handler_add(self)
+        set_scene_import_running(True)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            return self.cancel_import(context)
+        if event.type != "TIMER":
+            # 导入步骤跨tick持有对象和集合的引用：只放行视图导航，
+            # 撤销/删除/进入编辑模式等事件在导入期间被拦截，避免引用失效
+            if event.type in Const.IMPORT_PASS_THROUGH_EVENTS:
+                return {"PASS_THROUGH"}
+            return {"RUNNING_MODAL"}
+        # 每个timer tick最多处理Const.IMPORT_TICK_BUDGET秒，之后把控制权还给UI；
+        # 阻塞的FBX导入前先返回一次，让状态栏先刷新
+        deadline = time.perf_counter() + Const.IMPORT_TICK_BUDGET
+        try:
+            with self._profile.activate():
+                while True:
+                    phase, done_count = next(self._import_steps)
+                    if phase == "progress.fbx_import" or time.perf_counter() >= deadline:
+                        break
+        except StopIteration as stop:
+            self.end_modal(context)
+            return self.finish_import(context, stop.value)
+        except Exception:
+            self.end_modal(context)
+            raise
+        total_count = max(self._actor_count, done_count, 1)
+        context.window_manager.progress_update(min(done_count / total_count, 1.0) * 100)
+        context.workspace.status_text_set(tr(phase, done=done_count, total=total_count))
+        return {"RUNNING_MODAL"}
+
+    def end_modal(self, context):
+        set_scene_import_running(False)
+        window_manager = context.window_manager
+        if self._timer is not None:
+            window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        window_manager.progress_end()
+        context.workspace.status_text_set(None)
+
+    def cancel_import(self, context):
+        """
+        ESC取消：停止导入生成器；完整导入时清理已导入的一半场景，增量导入未保存快照，下次会重新比较
+        """
+        self._import_steps.close()
+        self.end_modal(context)
+        if not self._is_incremental:
+            json_scene_header = read_scene_header(context.scene.ubio_params.ubio_json_path)
+            main_level_name, _level_path_name = get_level_collection_names(json_scene_header)
+            ubio_coll = bpy.data.collections.get(Const.UECOLL)
+            main_level_coll = bpy.data.collections.get(main_level_name)
+            if ubio_coll and main_level_coll:
+                clear_imported_scene(ubio_coll, main_level_coll)
+        self._profile.finish()
+        self.report({"WARNING"}, tr("report.import_scene.cancelled"))
+        return {"CANCELLED"}
+
+
+class UBIO_OT_ImportLatestUnrealScene(SceneImportModal, bpy.types.Operator):
     bl_idname = "ubio.import_latest_unreal_scene"
     bl_label = msgid("op.import_latest.label")
     bl_description = msgid("op.import_latest.desc")
     bl_options = {"UNDO"}
 
-    latest_json_path: bpy.props.StringProperty()
-
-    def execute(self, context):
-        json_path = self.latest_json_path
-        if not json_path or not os.path.exists(json_path):
+    latest_json_path: bpy.props.StringProperty(options={"SKIP_SAVE"})
+
+    def use_latest_json_path(self, context) -> bool:
+        """
+        确定要导入的JSON（未指定latest_json_path时取交换目录中最新的导出）并写入UI路径
+        返回：
+            bool: 是否找到可导入的JSON（找不到时已report错误）
+        """
+        if not self.latest_json_path:
+            temp_dir = Const.DEFAULT_IO_TEMP_DIR
+            if not os.path.isdir(temp_dir):
+                self.report({"ERROR"}, tr("report.import_latest.default_dir_missing", path=temp_dir))
+                return False
+            latest_json_path = find_latest_scene_json(temp_dir)
+            if latest_json_path is None:
+                self.report({"ERROR"}, tr("report.import_latest.no_json_in_dir", path=temp_dir))
+                return False
+            self.latest_json_path = latest_json_path
+        if not os.path.exists(self.latest_json_path):
             self.report({"ERROR"}, tr("report.import_latest.invalid_json_path"))
-            return {"CANCELLED"}
-        params = context.scene.ubio_params
-        params.ubio_json_path = json_path # UI路径修改时自动触发导入
-
-
-        # if bpy.context.scene.unit_settings.length_unit != "CENTIMETERS":
-        #     self.report({"WARNING"}, "Blender单位不是厘米，可能会导致比例不一致")
-
-        # # ubio_collection = import_json_scene(json_path)
-        # # if ubio_collection is None:
-        # #     self.report({"ERROR"}, "导入场景失败")
-        # #     return {"CANCELLED"}
-        # else:
+            return False
+        # 直接写ID属性，不触发ubio_json_path的update回调（回调会再启动一次导入）
+        context.scene.ubio_params["ubio_json_path"] = self.latest_json_path
         self.report(
             {"INFO"},
-            tr("report.import_latest.success", filename=os.path.basename(json_path)),
+            tr("report.import_latest.success", filename=os.path.basename(self.latest_json_path)),
         )
-        return {"FINISHED"}
+        return True
 
-    def invoke(self, context, event):
-        temp_dir = Const.DEFAULT_IO_TEMP_DIR
-        if not os.path.isdir(temp_dir):
-            self.report({"ERROR"}, tr("report.import_latest.default_dir_missing", path=temp_dir))
+    def execute(self, context):
+        if not self.use_latest_json_path(context):
             return {"CANCELLED"}
+        return self.run_import(context)
 
-        json_files = [f for f in os.listdir(temp_dir) if f.lower().endswith('.json')]
-        if not json_files:
-            self.report({"ERROR"}, tr("report.import_latest.no_json_in_dir", path=temp_dir))
+    def invoke(self, context, event):
+        if not self.use_latest_json_path(context):
             return {"CANCELLED"}
+        return self.start_import(context)
 
-        latest_json_file = max(json_files, key=lambda f: os.path.getmtime(os.path.join(temp_dir, f)))
-        self.latest_json_path = os.path.join(temp_dir, latest_json_file)
-
-        with open(self.latest_json_path, "r") as f:
-            json_scene_data = json.load(f)
-
-        main_level = json_scene_data.get("main_level", None)
-        main_level_name = get_name_from_ue_path(main_level)
 
-        ubio_coll = bpy.data.collections.get(Const.UECOLL)
-        main_level_coll = bpy.data.collections.get(main_level_name)
-
-        if ubio_coll and main_level_coll:
-            clear_imported_scene(ubio_coll, main_level_coll)
-
-        return self.execute(context)
-
-
-
-
-
-
-class UBIO_OT_ImportUnrealScene(bpy.types.Operator):
+class UBIO_OT_ImportUnrealScene(SceneImportModal, bpy.types.Operator):
     bl_idname = "ubio.import_unreal_scene"
     bl_label = msgid("op.import_scene.label")
     bl_description = msgid("op.import_scene.desc")
     bl_options = {"UNDO"}
 
     def execute(self, context):
+        return self.run_import(context)
+
+    def invoke(self, context, event):
         params = context.scene.ubio_params
         json_path = params.ubio_json_path
-        with open(json_path, "r") as f:
-            json_scene_data = json.load(f)
-        fbx_path = os.path.splitext(json_path)[0] + ".fbx"
-        if not os.path.exists(fbx_path):
-            self.report({"ERROR"}, tr("report.import_scene.fbx_not_found", path=fbx_path))
+        if not os.path.exists(json_path):
+            self.report({"ERROR"}, tr("report.import_scene.json_not_found", path=json_path))
             return {"CANCELLED"}
-        if bpy.context.scene.unit_settings.length_unit != "CENTIMETERS":
-            self.report({"WARNING"}, tr("report.import_scene.unit_not_cm"))
-        # 使用新函数
-        ubio_collection=import_json_scene(json_path)
-        if ubio_collection is None:
-            self.report({"ERROR"}, tr("report.import_scene.failed"))
+        if not json_path.lower().endswith(".json"):
+            self.report({"ERROR"}, tr("report.import_scene.json_ext_invalid"))
             return {"CANCELLED"}
-        else:      
-            self.report({"INFO"}, tr("report.import_scene.success", filename=os.path.basename(json_path)))
-        return {"FINISHED"}
+        return self.start_import(context)
 
-    def invoke(self, context, event):
+
+class UBIO_OT_ExpandProxyActors(bpy.types.Operator):
+    bl_idname = "ubio.expand_proxy_actors"
+    bl_label = msgid("op.expand_proxy.label")
+    bl_description = msgid("op.expand_proxy.desc")
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
         params = context.scene.ubio_params
         json_path = params.ubio_json_path
         if not os.path.exists(json_path):
             self.report({"ERROR"}, tr("report.import_scene.json_not_found", path=json_path))
             return {"CANCELLED"}
-        if not json_path.lower().endswith(".json"):
-            self.report({"ERROR"}, tr("report.import_scene.json_ext_invalid"))
+        proxy_objs = [obj for obj in context.selected_objects if obj.get(Const.PROXY_ACTOR, False)]
+        if not proxy_objs:
+            self.report({"WARNING"}, tr("report.expand_proxy.no_selection"))
             return {"CANCELLED"}
-        with open(json_path, "r") as f:
-            json_scene_data = json.load(f)
-        main_level = json_scene_data.get("main_level", None)
-        level_path = json_scene_data.get("level_path", None)
-        main_level_name = get_name_from_ue_path(main_level)
-        if main_level == level_path:
-            level_path_name = Const.MAINLEVEL
-        else:
-            level_path_name = get_name_from_ue_path(level_path)
-        ubio_coll = bpy.data.collections.get(Const.UECOLL)
-        main_level_coll = bpy.data.collections.get(main_level_name)
-        if ubio_coll and main_level_coll:
-            clear_imported_scene(ubio_coll, main_level_coll)
-        return self.execute(context)
+        expanded_objs = expand_proxy_actor_objs(
+            json_path,
+            proxy_objs,
+            share_blueprint_instances=params.ubio_share_blueprint_instances,
+            dedup_meshes=params.ubio_dedup_meshes,
+            level_format=params.ubio_level_format,
+        )
+        if expanded_objs is None:
+            level_path = get_level_file_path(json_path, params.ubio_level_format)
+            self.report({"ERROR"}, tr("report.import_scene.level_file_not_found", path=level_path))
+            return {"CANCELLED"}
+        for obj in expanded_objs:
+            obj.select_set(True)
+        self.report({"INFO"}, tr("report.expand_proxy.done", count=len(expanded_objs), total=len(proxy_objs)))
+        return {"FINISHED"}
+
 
+class UBIO_OT_CollapsePointInstances(bpy.types.Operator):
+    bl_idname = "ubio.collapse_point_instances"
+    bl_label = msgid("op.collapse_points.label")
+    bl_description = msgid("op.collapse_points.desc")
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        candidate_objs = [obj for obj in context.selected_objects if is_point_instance_candidate(obj)]
+        if not candidate_objs:
+            self.report({"WARNING"}, tr("report.collapse_points.no_selection"))
+            return {"CANCELLED"}
+        level_asset_coll = candidate_objs[0].users_collection[0]
+        dedup_object_meshes(candidate_objs)
+        # 合并几何一致的Mesh后，同一资源的actor才会引用同一个Mesh
+        instancers = collapse_point_instances(candidate_objs, level_asset_coll)
+        for obj in instancers:
+            obj.select_set(True)
+        self.report(
+            {"INFO"},
+            tr("report.collapse_points.done", count=len(instancers), total=len(candidate_objs)),
+        )
+        return {"FINISHED"}
+
+
+class UBIO_OT_ExpandPointInstances(bpy.types.Operator):
+    bl_idname = "ubio.expand_point_instances"
+    bl_label = msgid("op.expand_points.label")
+    bl_description = msgid("op.expand_points.desc")
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        instancers = [obj for obj in context.selected_objects if is_point_instancer(obj)]
+        if not instancers:
+            self.report({"WARNING"}, tr("report.expand_points.no_selection"))
+            return {"CANCELLED"}
+        expanded_objs = []
+        for instancer in instancers:
+            expanded_objs.extend(expand_point_instancer(instancer, instancer.users_collection[0]))
+        for obj in expanded_objs:
+            obj.select_set(True)
+        self.report({"INFO"}, tr("report.expand_points.done", count=len(expanded_objs)))
+        return {"FINISHED"}
+
+
+class UBIO_OT_SetImportRegionFromSelection(bpy.types.Operator):
+    bl_idname = "ubio.set_import_region_from_selection"
+    bl_label = msgid("op.region_from_selection.label")
+    bl_description = msgid("op.region_from_selection.desc")
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        selected_objs = list(context.selected_objects)
+        if not selected_objs:
+            self.report({"WARNING"}, tr("report.region_from_selection.no_selection"))
+            return {"CANCELLED"}
+        corners = [obj.matrix_world @ Vector(corner) for obj in selected_objs for corner in obj.bound_box]
+        params = context.scene.ubio_params
+        params.ubio_region_min = [min(corner[axis] for corner in corners) for axis in range(3)]
+        params.ubio_region_max = [max(corner[axis] for corner in corners) for axis in range(3)]
+        params.ubio_region_mode = Const.REGION_MODE_BOX
+        return {"FINISHED"}
 
 
 class UBIO_OT_ExportUnrealJSON(bpy.types.Operator):
@@ -786,6 +1969,9 @@ class UBIO_OT_ExportUnrealJSON(bpy.types.Operator):
     bl_options = {"UNDO"}
 
     def execute(self, context):
+        return run_profiled_operator(self, "export_json", self.run_operator, context)
+
+    def run_operator(self, context):
         params = context.scene.ubio_params
         json_path = params.ubio_json_path
 
@@ -794,9 +1980,9 @@ class UBIO_OT_ExportUnrealJSON(bpy.types.Operator):
             self.report({"ERROR"}, tr("report.export_json.json_not_found", path=json_path))
             return {"CANCELLED"}
         
-        # 解析JSON文件
-        with open(json_path, "r") as f:
-            scene_data = json.load(f)
+        # 只解析JSON顶层字段，actors在后续流式处理
+        with profile_phase("json_header"):
+            scene_header = read_scene_header(json_path)
 
         # 找到UECOLL下的collection
         ubio_coll = bpy.data.collections.get(Const.UECOLL)
@@ -822,8 +2008,8 @@ class UBIO_OT_ExportUnrealJSON(bpy.types.Operator):
             print(f"{main_level_coll.name} is mainlevel")
 
         # 获取json中的main_level和level_path
-        main_level_path = scene_data.get("main_level", None)
-        level_path = scene_data.get("level_path", None)
+        main_level_path = scene_header.get("main_level", None)
+        level_path = scene_header.get("level_path", None)
         main_level_name = get_name_from_ue_path(main_level_path)
         level_name = get_name_from_ue_path(level_path)
         is_match_json = False
@@ -841,65 +2027,82 @@ class UBIO_OT_ExportUnrealJSON(bpy.types.Operator):
         if level_asset_coll is None:
             self.report({'ERROR'}, tr("report.export_json.level_asset_not_found"))
             return {"CANCELLED"}
-        level_actor_objs = [obj for obj in level_asset_coll.all_objects]
+        # 点实例化对象展开为逐actor条目，transform从点属性读取
+        level_actor_objs = get_level_actor_entries(level_asset_coll.all_objects)
         # 找出所有有 fname 的 object，且在 json 中没有对应的
         existing_actor_keys = set(
-            (str(a.get("name")), str(a.get("actor_type")), str(a.get("fname")), str(a.get("fguid")))
-            for a in scene_data.get("actors", [])
+            get_actor_key_from_dict(a) for a in profile_iter(iter_scene_actors(json_path), "json_load", "actors")
         )
+        profile_count("objects", len(level_actor_objs))
+        new_actor_objs = []
+        name_allocator = UniqueNameAllocator(bpy.data.objects.keys())
         for obj in level_actor_objs:
-            fname = obj.get(Const.FNAME, None)
-            actortype = obj.get(Const.ACTORTYPE, "")
-            guid = str(obj.get(Const.GUID, ""))
-            if fname and actortype in ["StaticMesh", "Blueprint", "LevelInstance"]:
-                key = (obj.name, str(obj.get(Const.ACTORTYPE, "")), str(fname), guid)
+            if is_syncable_actor_obj(obj):
+                key = get_actor_key_from_obj(obj)
                 if key not in existing_actor_keys:
                     # 添加到json
                     safe_name = obj.name.replace('.', '_')
                     if obj.name != safe_name:
-                        if safe_name not in bpy.data.objects:
-                            obj.name = safe_name
-                        else:
-                            idx = 1
-                            new_name = f"{safe_name}_{idx}"
-                            while new_name in bpy.data.objects:
-                                idx += 1
-                                new_name = f"{safe_name}_{idx}"
-                            obj.name = new_name
-                        safe_name = obj.name
-                    new_actor = {
-                        "name": safe_name,
-                        "actor_type": obj.get(Const.ACTORTYPE, ""),
-                        "fname": fname,
-                        "fguid": guid,
-                        "class": obj.get(Const.ACTORCLASS, ""),
-                        "transform": get_transform_from_obj(obj),
-                        "Blender": "NewActor"
-                    }
-                    scene_data["actors"].append(new_actor)
-        # 遍历json中的actors，检查其在Blender中是否存在
-        for actor in scene_data.get("actors", []):
-            actor_name = actor.get("name")
-            actor_type = actor.get("actor_type")
-            actor_fname = actor.get("fname")
-            actor_guid = str(actor.get("fguid"))
-            found = False
-            for obj in level_actor_objs:
-                if (
-                    obj.name == actor_name
-                    and str(obj.get(Const.ACTORTYPE, "")) == actor_type
-                    and str(obj.get(Const.FNAME, "")) == actor_fname
-                    and str(obj.get(Const.GUID, "")) == actor_guid
-                ):
-                    found = True
+                        obj.name = name_allocator.allocate(safe_name)
+                        name_allocator.register(obj.name)
+                    new_actor_objs.append(obj)
+        new_actors = [
+            dict(build_actor_record(obj, transform), **{Const.BL_FLAG: Const.BL_NEW})
+            for obj, transform in zip(new_actor_objs, get_transforms_from_objs(new_actor_objs))
+        ]
+        # 流式遍历json中的actors，通过索引检查其在Blender中是否存在
+        actor_obj_index = build_actor_obj_index(level_actor_objs)
+        # 区域导入时只有快照中的actor被导入过，其余actor不能标记为Removed
+        imported_actor_ids = load_import_snapshot(level_asset_coll)
+
+        # 只有depsgraph标记过修改的actor才重新计算transform（批量转换），导出后记为新的同步值
+        with profile_phase("transforms"):
+            modified_transforms = get_modified_actor_transforms(actor_obj_index.values())
+            modified_transform_dicts = dict(zip(
+                modified_transforms,
+                ue_transform_array_to_dicts(np.array(list(modified_transforms.values()))),
+            ))
+        synced_objs = []
+        synced_records = []
+
+        def update_actor(actor):
+            obj = actor_obj_index.get(get_actor_key_from_dict(actor))
+            if obj is not None:
+                is_new_actor = actor.get("Blender") == Const.BL_NEW
+                transform_values = modified_transforms.get(obj)
+                if transform_values is not None:
+                    actor["transform"] = modified_transform_dicts[obj]
+                    if not is_new_actor:
+                        actor["Blender"] = Const.BL_MOD
+                elif is_new_actor:
                     actor["transform"] = get_transform_from_obj(obj)
-                    break
-            if not found:
+                if isinstance(obj, PointInstanceRecord):
+                    if obj.get(Const.DIRTY, False):
+                        synced_records.append((obj, transform_values))
+                elif transform_values is not None:
+                    synced_objs.append((obj, transform_values))
+            elif imported_actor_ids is None or get_actor_id(actor) in imported_actor_ids:
                 actor["Blender"] = "Removed"  # 标记此actor在Blender中不存在
-
-        # 保存修改后的json
-        with open(json_path, "w") as f:
-            json.dump(scene_data, f, indent=4)
+            return actor
+
+        # 保存修改后的json（新actor追加在末尾）；ubio_delta告知UE端未标记的actor无需处理
+        with profile_phase("json_write"):
+            rewrite_scene_json(json_path, update_actor, new_actors, header_updates={Const.DELTA_KEY: True})
+        append_manifest_record(
+            Const.MANIFEST_TYPE_SCENE,
+            os.path.splitext(os.path.basename(json_path))[0],
+            Const.SCENE_STATUS_EXPORTED_FROM_BLENDER,
+            {"json": json_path},
+            manifest_path=get_manifest_path(os.path.dirname(json_path)),
+        )
+        watcher = get_export_watcher()
+        if watcher is not None:
+            watcher.mark_scene_handled(json_path)
+        for obj, transform_values in synced_objs:
+            mark_actor_obj_synced(obj, transform_values)
+        mark_point_instances_synced(synced_records)
+        profile_count("new_actors", len(new_actors))
+        profile_count("modified_actors", len(synced_objs) + sum(1 for _record, values in synced_records if values))
 
         self.report({"INFO"}, tr("report.export_json.sync_done"))
         return {"FINISHED"}
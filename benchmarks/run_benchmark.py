@@ -0,0 +1,316 @@
+"""
+UBIO无界面性能基准：生成合成关卡后依次测量 导入 / 导出JSON / 清理 的耗时与内存峰值，结果逐行追加到JSONL文件。
+    blender --background --factory-startup --python benchmarks/run_benchmark.py -- --actors 1000,10000,50000,100000
+插件直接从仓库目录加载（不需要事先安装）；详见benchmarks/README.md。
+"""
+import bpy
+import argparse
+import ctypes
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 可选：装了psutil时用它读取RSS；wintypes只在Windows上用到
+try:
+    import psutil
+except ImportError:
+    psutil = None
+try:
+    from ctypes import wintypes
+except (ImportError, ValueError):
+    wintypes = None
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+ADDON_MODULE = "UnrealBlenderIO"
+MEMORY_SAMPLE_INTERVAL = 0.05
+DEFAULT_ACTOR_COUNTS = "1000,10000,50000,100000"
+
+sys.path.insert(0, BENCHMARK_DIR)
+import synthetic_scene  # noqa: E402
+
+
+def load_addon():
+    """
+    从仓库目录加载并注册插件
+    返回：
+        module: 插件包
+    """
+    addon = sys.modules.get(ADDON_MODULE)
+    if addon is not None:
+        return addon
+    spec = importlib.util.spec_from_file_location(
+        ADDON_MODULE,
+        os.path.join(REPO_DIR, "__init__.py"),
+        submodule_search_locations=[REPO_DIR],
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_MODULE] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return addon
+
+
+# =====================
+# 内存采样
+# =====================
+
+def _get_rss_reader():
+    """
+    选择当前平台可用的常驻内存（RSS）读取方式
+    返回：
+        Callable[[], int] or None: 返回RSS字节数的函数
+    """
+    if psutil is not None:
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
+    if os.path.exists("/proc/self/statm"):
+        page_size = os.sysconf("SC_PAGE_SIZE")
+
+        def read_statm():
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * page_size
+        return read_statm
+    if sys.platform == "win32" and wintypes is not None:
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        current_process = ctypes.windll.kernel32.GetCurrentProcess()
+
+        def read_working_set():
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            get_process_memory_info(current_process, ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize
+        return read_working_set
+    return None
+
+
+_read_rss = _get_rss_reader()
+
+
+class MemorySampler:
+    """
+    后台线程定期采样RSS，记录with块内的峰值；长时间持有GIL的调用期间无法采样，峰值为近似值
+    """
+
+    def __init__(self, interval: float = MEMORY_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = _read_rss()
+        if rss > self.peak_rss:
+            self.peak_rss = rss
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if _read_rss is not None:
+            self.start_rss = self.peak_rss = _read_rss()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *_exc):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._sample()
+        return False
+
+
+def to_mb(value: int):
+    return round(value / (1024 * 1024), 1) if _read_rss is not None else None
+
+
+# =====================
+# 基准阶段
+# =====================
+
+class BenchmarkRun:
+    """
+    单个actor规模的一次基准运行，收集各阶段结果
+    """
+
+    def __init__(self, actor_count: int, options: dict):
+        self.actor_count = actor_count
+        self.options = options
+        self.results = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        测量with块的耗时和内存；块内可向产出的dict写入phases等附加信息
+        参数：
+            name (str): 阶段名称
+        """
+        extra = {}
+        with MemorySampler() as sampler:
+            start_time = time.perf_counter()
+            yield extra
+            seconds = time.perf_counter() - start_time
+        self.results.append(dict(
+            {
+                "actors": self.actor_count,
+                "stage": name,
+                "seconds": round(seconds, 4),
+                "rss_before_mb": to_mb(sampler.start_rss),
+                "peak_rss_mb": to_mb(sampler.peak_rss),
+            },
+            **extra,
+        ))
+
+
+def get_profile_phases(profile) -> dict:
+    return {phase: round(seconds, 4) for phase, seconds in profile.phase_times.items()}
+
+
+def run_scene_benchmark(addon, json_path: str, actor_count: int, options: dict) -> list:
+    """
+    对一个场景依次测量导入、导出JSON和清理
+    参数：
+        addon (module): 插件包
+        json_path (str): 合成场景JSON路径
+        actor_count (int): actor数量
+        options (dict): 导入选项
+    返回：
+        list[dict]: 各阶段结果
+    """
+    ubio = addon.UnrealBlenderIO
+    profiling = addon.profiling
+    run = BenchmarkRun(actor_count, options)
+    params = bpy.context.scene.ubio_params
+
+    with run.stage("import") as extra:
+        profile = profiling.OperationProfile("benchmark_import", enable_cprofile=options["cprofile"])
+        with profile.activate():
+            ubio_coll = ubio.import_json_scene(
+                json_path,
+                share_blueprint_instances=options["share_blueprint_instances"],
+                proxy=options["proxy"],
+                dedup_meshes=options["dedup_meshes"],
+                level_format=options["level_format"],
+            )
+        profile.finish()
+        extra["phases"] = get_profile_phases(profile)
+        extra["counts"] = dict(profile.counts)
+    if ubio_coll is None:
+        raise RuntimeError(f"Import failed: {json_path}")
+
+    # 导出会改写JSON，使用副本保持生成的场景可重复使用
+    export_json_path = os.path.splitext(json_path)[0] + "_export.json"
+    shutil.copyfile(json_path, export_json_path)
+    addon.scene_io.clear_scene_cache(export_json_path)
+    params["ubio_json_path"] = export_json_path  # 不触发路径update回调中的自动导入
+    # 导出operator自带OperationProfile，分阶段耗时见其输出和profile日志
+    with run.stage("export") as extra:
+        extra["result"] = sorted(bpy.ops.ubio.export_unreal_scene_json())
+
+    with run.stage("clear") as extra:
+        json_scene_header = addon.scene_io.read_scene_header(json_path)
+        main_level_name, _level_path_name = ubio.get_level_collection_names(json_scene_header)
+        profile = profiling.OperationProfile("benchmark_clear", enable_cprofile=options["cprofile"])
+        with profile.activate():
+            ubio.clear_imported_scene(
+                bpy.data.collections.get(addon.util.Const.UECOLL),
+                bpy.data.collections.get(main_level_name),
+            )
+        profile.finish()
+        extra["phases"] = get_profile_phases(profile)
+    return run.results
+
+
+def append_results(results_path: str, results: list, common: dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+    with open(results_path, "a", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(dict(common, **result), ensure_ascii=False) + "\n")
+
+
+def print_results(results: list) -> None:
+    print(f"{'actors':>8} {'stage':<10} {'seconds':>10} {'peak MB':>10}")
+    for result in results:
+        peak = result["peak_rss_mb"]
+        print(
+            f"{result['actors']:>8} {result['stage']:<10} {result['seconds']:>10.3f} "
+            f"{peak if peak is not None else '-':>10}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UBIO headless benchmark")
+    parser.add_argument("--actors", default=DEFAULT_ACTOR_COUNTS, help="comma separated actor counts")
+    parser.add_argument("--output-dir", default=os.path.join(tempfile.gettempdir(), "UBIO_Benchmark"))
+    parser.add_argument("--results", default="", help="JSONL results file (default: <output-dir>/results.jsonl)")
+    parser.add_argument("--reuse", action="store_true", help="reuse previously generated scenes")
+    parser.add_argument("--proxy", action="store_true", help="benchmark proxy import mode")
+    parser.add_argument("--share", action="store_true", help="share Blueprint collection instances")
+    parser.add_argument("--no-dedup", action="store_true", help="disable mesh deduplication")
+    parser.add_argument("--cprofile", action="store_true", help="also dump cProfile stats per stage")
+    parser.add_argument("--label", default="", help="free-form label stored with every result")
+    synthetic_scene.add_generator_arguments(parser)
+    args = parser.parse_args(synthetic_scene.get_script_args())
+
+    addon = load_addon()
+    generator_kwargs = synthetic_scene.get_generator_kwargs(args)
+    options = {
+        "proxy": args.proxy,
+        "share_blueprint_instances": args.share,
+        "dedup_meshes": not args.no_dedup,
+        "level_format": addon.util.Const.LEVEL_FORMAT_USD if args.usd else addon.util.Const.LEVEL_FORMAT_FBX,
+        "cprofile": args.cprofile,
+        "generator": generator_kwargs,
+    }
+    common = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "label": args.label,
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": options,
+    }
+    results_path = args.results or os.path.join(args.output_dir, "results.jsonl")
+    all_results = []
+    for actor_count in (int(value) for value in args.actors.split(",") if value.strip()):
+        json_path = os.path.join(args.output_dir, f"Synthetic_{actor_count}.json")
+        run = BenchmarkRun(actor_count, options)
+        if not (args.reuse and os.path.exists(json_path)):
+            with run.stage("generate"):
+                json_path = synthetic_scene.generate_synthetic_scene(args.output_dir, actor_count, **generator_kwargs)
+        results = run.results + run_scene_benchmark(addon, json_path, actor_count, options)
+        append_results(results_path, results, common)
+        print_results(results)
+        all_results.extend(results)
+    print(f"[UBIO Benchmark] results appended to {results_path}")
+    print_results(all_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+生成UE导出格式的合成关卡（export_current_level_json 结构的JSON + 对应的关卡FBX），用于UBIO性能基准。
+必须在Blender中运行（FBX由Blender导出）：
+    blender --background --factory-startup --python benchmarks/synthetic_scene.py -- --actors 10000 --output-dir D:/UBIO_Bench
+本目录没有__init__.py，不会被插件的auto_load加载。
+"""
+import bpy
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import uuid
+from mathutils import Vector
+
+MESH_CLASS_PREFIX = "SM_Synthetic"
+BLUEPRINT_CLASS_PREFIX = "BP_Synthetic"
+
+
+def build_base_meshes(mesh_class_count: int, rng: random.Random) -> list:
+    """
+    创建若干个作为StaticMesh资源的基础Mesh（细分和尺寸各不相同）
+    参数：
+        mesh_class_count (int): 资源数量
+        rng (random.Random): 随机数生成器
+    返回：
+        list[(bpy.types.Mesh, float)]: Mesh与其包围球半径（米）
+    """
+    meshes = []
+    for mesh_index in range(mesh_class_count):
+        radius = rng.uniform(0.5, 4.0)
+        segments = 8 + (mesh_index % 4) * 8
+        rings = max(4, segments // 2)
+        verts = [(0.0, 0.0, radius)]
+        for ring in range(1, rings):
+            theta = math.pi * ring / rings
+            for segment in range(segments):
+                phi = 2 * math.pi * segment / segments
+                verts.append((
+                    radius * math.sin(theta) * math.cos(phi),
+                    radius * math.sin(theta) * math.sin(phi),
+                    radius * math.cos(theta),
+                ))
+        verts.append((0.0, 0.0, -radius))
+        faces = []
+        for segment in range(segments):
+            faces.append((0, 1 + segment, 1 + (segment + 1) % segments))
+        for ring in range(rings - 2):
+            row = 1 + ring * segments
+            next_row = row + segments
+            for segment in range(segments):
+                following = (segment + 1) % segments
+                faces.append((row + segment, next_row + segment, next_row + following, row + following))
+        bottom = len(verts) - 1
+        last_row = 1 + (rings - 2) * segments
+        for segment in range(segments):
+            faces.append((bottom, last_row + (segment + 1) % segments, last_row + segment))
+        mesh = bpy.data.meshes.new(f"{MESH_CLASS_PREFIX}_{mesh_index:03d}")
+        mesh.from_pydata(verts, [], faces)
+        mesh.uv_layers.new(name="UVMap")
+        meshes.append((mesh, radius))
+    return meshes
+
+
+def pick_actor_type(rng: random.Random, blueprint_ratio: float, level_instance_ratio: float, light_ratio: float) -> str:
+    value = rng.random()
+    if value < blueprint_ratio:
+        return "Blueprint"
+    value -= blueprint_ratio
+    if value < level_instance_ratio:
+        return "LevelInstance"
+    value -= level_instance_ratio
+    if value < light_ratio:
+        return "PointLight"
+    return "StaticMesh"
+
+
+def generate_actor_records(
+    actor_count: int,
+    mesh_radii: list,
+    blueprint_class_count: int = 8,
+    blueprint_ratio: float = 0.1,
+    level_instance_ratio: float = 0.02,
+    light_ratio: float = 0.03,
+    world_extent: float = 2000.0,
+    seed: int = 0,
+) -> list:
+    """
+    生成UE actor记录（与export_current_level_json的actor结构一致，额外带有"_"开头的生成参数）
+    参数：
+        actor_count (int): actor数量
+        mesh_radii (list[float]): 每个StaticMesh资源的半径（米）
+        blueprint_class_count (int): Blueprint class数量
+        blueprint_ratio / level_instance_ratio / light_ratio (float): 各类型actor所占比例，其余为StaticMesh
+        world_extent (float): actor分布范围（米，XY方向的边长）
+        seed (int): 随机种子
+    返回：
+        list[dict]: actor记录
+    """
+    rng = random.Random(seed)
+    actors = []
+    for actor_index in range(actor_count):
+        actor_type = pick_actor_type(rng, blueprint_ratio, level_instance_ratio, light_ratio)
+        mesh_index = rng.randrange(len(mesh_radii))
+        if actor_type == "StaticMesh":
+            class_name = "StaticMeshActor"
+            name = f"{MESH_CLASS_PREFIX}_{mesh_index:03d}_{actor_index}"
+        elif actor_type == "Blueprint":
+            class_name = f"{BLUEPRINT_CLASS_PREFIX}_{actor_index % blueprint_class_count:02d}_C"
+            name = f"{class_name[:-2]}_{actor_index}"
+        elif actor_type == "LevelInstance":
+            class_name = "LevelInstance"
+            name = f"LI_Synthetic_{actor_index}"
+        else:
+            class_name = "PointLight"
+            name = f"PointLight_{actor_index}"
+        scale = rng.uniform(0.5, 2.0)
+        location = {
+            "x": rng.uniform(-world_extent, world_extent) * 50,
+            "y": rng.uniform(-world_extent, world_extent) * 50,
+            "z": rng.uniform(0.0, 50.0) * 100,
+        }
+        radius_cm = mesh_radii[mesh_index] * scale * 100 * (2 if actor_type != "StaticMesh" else 1)
+        actors.append({
+            "name": name,
+            "fname": f"{class_name}_{actor_index}",
+            "fguid": uuid.UUID(int=rng.getrandbits(128)).hex.upper(),
+            "class": class_name,
+            "actor_type": actor_type,
+            "transform": {
+                "location": location,
+                "rotation": {"x": 0.0, "y": 0.0, "z": rng.uniform(-180.0, 180.0)},
+                "scale": {"x": scale, "y": scale, "z": scale},
+            },
+            "bounds": {
+                "origin": dict(location),
+                "extent": {"x": radius_cm, "y": radius_cm, "z": radius_cm},
+            },
+            "_mesh_index": mesh_index,
+        })
+    return actors
+
+
+def _set_transform_from_ue(obj, transform: dict) -> None:
+    # 与插件util.set_actor_transform相同的坐标转换，生成器不依赖插件本身
+    loc = transform["location"]
+    rot = transform["rotation"]
+    scale = transform["scale"]
+    obj.location = Vector((loc["x"] / 100, -loc["y"] / 100, loc["z"] / 100))
+    obj.rotation_euler = (math.radians(rot["x"]), -math.radians(rot["y"]), -math.radians(rot["z"]))
+    obj.scale = Vector((scale["x"], scale["y"], scale["z"]))
+
+
+def build_level_fbx(actors: list, meshes: list, fbx_path: str, unique_meshes: bool = True, usd_path: str = "") -> None:
+    """
+    按actor记录在当前场景中创建对象并导出为关卡FBX，对象层级与UE LevelExporterFBX一致：
+    StaticMesh为mesh对象，Blueprint为带mesh子对象的empty，LevelInstance旁边另有LevelInstanceEditorInstanceActor
+    参数：
+        actors (list[dict]): generate_actor_records生成的记录
+        meshes (list[(bpy.types.Mesh, float)]): build_base_meshes创建的Mesh
+        fbx_path (str): 输出FBX路径
+        unique_meshes (bool): 每个actor使用独立的Mesh副本（UE导出的关卡FBX就是如此）
+        usd_path (str): 可选，同时导出关卡USD，用于测试USD导入流程
+    """
+    scene_coll = bpy.context.scene.collection
+    light_data = bpy.data.lights.new("SyntheticPointLight", "POINT")
+    created_objs = []
+
+    def new_mesh_obj(name, mesh_index, parent=None, offset=(0.0, 0.0, 0.0)):
+        base_mesh = meshes[mesh_index][0]
+        obj = bpy.data.objects.new(name, base_mesh.copy() if unique_meshes else base_mesh)
+        obj.location = offset
+        obj.parent = parent
+        scene_coll.objects.link(obj)
+        created_objs.append(obj)
+        return obj
+
+    for actor_index, actor in enumerate(actors):
+        actor_type = actor["actor_type"]
+        mesh_index = actor["_mesh_index"]
+        if actor_type == "StaticMesh":
+            obj = new_mesh_obj(actor["name"], mesh_index)
+        elif actor_type == "PointLight":
+            obj = bpy.data.objects.new(actor["name"], light_data)
+            scene_coll.objects.link(obj)
+            created_objs.append(obj)
+        else:
+            obj = bpy.data.objects.new(actor["name"], None)
+            scene_coll.objects.link(obj)
+            created_objs.append(obj)
+            if actor_type == "Blueprint":
+                new_mesh_obj(f"{actor['name']}_Body", mesh_index, obj)
+                new_mesh_obj(f"{actor['name']}_Detail", (mesh_index + 1) % len(meshes), obj, (0.0, 0.0, 1.0))
+        _set_transform_from_ue(obj, actor["transform"])
+        if actor_type == "LevelInstance":
+            editor_obj = bpy.data.objects.new(f"LevelInstanceEditorInstanceActor_{actor_index}", None)
+            scene_coll.objects.link(editor_obj)
+            created_objs.append(editor_obj)
+            editor_obj.location = obj.location
+            new_mesh_obj(f"{actor['name']}_Content", mesh_index, editor_obj)
+
+    bpy.ops.export_scene.fbx(
+        filepath=fbx_path,
+        use_selection=False,
+        object_types={"EMPTY", "MESH", "LIGHT"},
+        bake_space_transform=True,
+        add_leaf_bones=False,
+        bake_anim=False,
+    )
+    if usd_path:
+        bpy.ops.wm.usd_export(filepath=usd_path, selected_objects_only=False, export_animation=False)
+    created_meshes = {obj.data for obj in created_objs if obj.type == "MESH"}
+    bpy.data.batch_remove(ids=created_objs)
+    bpy.data.batch_remove(ids=list(created_meshes) + [light_data])
+
+
+def write_level_json(actors: list, json_path: str, level_name: str) -> dict:
+    """
+    按export_current_level_json的结构写出场景JSON（去掉生成参数）
+    参数：
+        actors (list[dict]): actor记录
+        json_path (str): 输出路径
+        level_name (str): 关卡名
+    返回：
+        dict: 场景顶层字段（不含actors）
+    """
+    level_path = f"/Game/UBIO_Benchmark/{level_name}.{level_name}"
+    header = {
+        "main_level": level_path,
+        "level_path": level_path,
+        "level_name_for_file": level_name,
+        "export_path": os.path.dirname(json_path),
+        "actor_count": len(actors),
+    }
+    export_actors = [{key: value for key, value in actor.items() if not key.startswith("_")} for actor in actors]
+    with open(json_path, "w", encoding="utf-8") as f:
+        # 与UE端导出一致：紧凑JSON
+        json.dump(dict(header, actors=export_actors), f, ensure_ascii=False, separators=(",", ":"))
+    return header
+
+
+def generate_synthetic_scene(
+    output_dir: str,
+    actor_count: int,
+    mesh_class_count: int = 32,
+    blueprint_class_count: int = 8,
+    blueprint_ratio: float = 0.1,
+    level_instance_ratio: float = 0.02,
+    light_ratio: float = 0.03,
+    unique_meshes: bool = True,
+    export_usd: bool = False,
+    seed: int = 0,
+) -> str:
+    """
+    生成一套合成场景（JSON + FBX）
+    参数：
+        output_dir (str): 输出目录
+        actor_count (int): actor数量
+        其余参数见generate_actor_records / build_level_fbx
+    返回：
+        str: 场景JSON路径
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    level_name = f"Synthetic_{actor_count}"
+    json_path = os.path.join(output_dir, f"{level_name}.json")
+    rng = random.Random(seed)
+    meshes = build_base_meshes(mesh_class_count, rng)
+    actors = generate_actor_records(
+        actor_count,
+        [radius for _mesh, radius in meshes],
+        blueprint_class_count=blueprint_class_count,
+        blueprint_ratio=blueprint_ratio,
+        level_instance_ratio=level_instance_ratio,
+        light_ratio=light_ratio,
+        seed=seed,
+    )
+    base_path = os.path.splitext(json_path)[0]
+    build_level_fbx(
+        actors,
+        meshes,
+        base_path + ".fbx",
+        unique_meshes=unique_meshes,
+        usd_path=base_path + ".usdc" if export_usd else "",
+    )
+    bpy.data.batch_remove(ids=[mesh for mesh, _radius in meshes])
+    write_level_json(actors, json_path, level_name)
+    return json_path
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mesh-classes", type=int, default=32, help="number of distinct StaticMesh assets")
+    parser.add_argument("--blueprint-classes", type=int, default=8, help="number of distinct Blueprint classes")
+    parser.add_argument("--blueprint-ratio", type=float, default=0.1)
+    parser.add_argument("--level-instance-ratio", type=float, default=0.02)
+    parser.add_argument("--light-ratio", type=float, default=0.03)
+    parser.add_argument("--shared-meshes", action="store_true", help="reuse one mesh per asset instead of one per actor")
+    parser.add_argument("--usd", action="store_true", help="also export the level as USD (.usdc)")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def get_generator_kwargs(args) -> dict:
+    return {
+        "mesh_class_count": args.mesh_classes,
+        "blueprint_class_count": args.blueprint_classes,
+        "blueprint_ratio": args.blueprint_ratio,
+        "level_instance_ratio": args.level_instance_ratio,
+        "light_ratio": args.light_ratio,
+        "unique_meshes": not args.shared_meshes,
+        "export_usd": args.usd,
+        "seed": args.seed,
+    }
+
+
+def get_script_args() -> list:
+    # blender ... --python script.py -- <script args>
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic UE level export for UBIO benchmarks")
+    parser.add_argument("--actors", type=int, default=1000)
+    parser.add_argument("--output-dir", required=True)
+    add_generator_arguments(parser)
+    args = parser.parse_args(get_script_args())
+    json_path = generate_synthetic_scene(args.output_dir, args.actors, **get_generator_kwargs(args))
+    print(f"[UBIO Benchmark] generated {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from .util import Const, are_flat_transforms_close, get_ue_transform_array
+
+# =====================
+# actor修改跟踪
+# =====================
+# 导入时每个actor对象都记录了Const.IMPORT_TRANSFORM（上一次与UE同步的transform）。
+# depsgraph_update_post只处理本次更新的对象：transform偏离同步值的actor被标记为Const.DIRTY，
+# 导出JSON时只需检查带标记的对象，未改动的actor不再逐个计算transform。
+
+
+def get_obj_ue_transform_values(obj) -> list:
+    return get_ue_transform_array((obj,))[0].tolist()
+
+
+def get_import_transform_array(objs) -> np.ndarray:
+    """
+    读取对象的同步transform，没有同步记录的行填NaN
+    参数：
+        objs (Sequence[bpy.types.Object or PointInstanceRecord]): actor对象
+    返回：
+        np.ndarray: (N, 9) UE空间数组
+    """
+    values = np.full((len(objs), 9), np.nan)
+    for row, obj in enumerate(objs):
+        import_transform = obj.get(Const.IMPORT_TRANSFORM, None)
+        if import_transform is not None and len(import_transform) == 9:
+            values[row] = list(import_transform)
+    return values
+
+
+def get_modified_actor_transforms(objs) -> dict:
+    """
+    找出transform相对上一次同步发生变化的actor，并批量计算其UE空间transform
+    参数：
+        objs (Iterable[bpy.types.Object or PointInstanceRecord]): actor对象
+    返回：
+        dict: {actor对象: 展开的UE transform（9个float）}；没有同步记录的对象一律视为已修改
+    """
+    candidates = [
+        obj for obj in objs
+        if obj.get(Const.IMPORT_TRANSFORM, None) is None or obj.get(Const.DIRTY, False)
+    ]
+    if not candidates:
+        return {}
+    ue_values = get_ue_transform_array(candidates)
+    is_close = are_flat_transforms_close(get_import_transform_array(candidates), ue_values)
+    return {
+        obj: values
+        for obj, values, close in zip(candidates, ue_values.tolist(), is_close.tolist())
+        if not close
+    }
+
+
+def mark_actor_obj_synced(obj, transform_values: list = None) -> None:
+    """
+    导出或增量导入后，把对象当前transform记为新的同步值并清除修改标记
+    参数：
+        obj (bpy.types.Object): actor对象
+        transform_values (list[float] or None): 已计算好的展开transform，为None时从对象读取
+    """
+    obj[Const.IMPORT_TRANSFORM] = transform_values if transform_values is not None else get_obj_ue_transform_values(obj)
+    if Const.DIRTY in obj:
+        del obj[Const.DIRTY]
+
+
+@persistent
+def _track_actor_updates(_scene, depsgraph) -> None:
+    moved_objs = []
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        if obj.get(Const.DIRTY, False):
+            continue
+        if obj.get(Const.POINT_INSTANCER, False):
+            # 点实例的transform来自点属性，编辑点云或移动实例化对象都视为修改
+            if update.is_updated_transform or update.is_updated_geometry:
+                obj[Const.DIRTY] = True
+            continue
+        if update.is_updated_transform and obj.get(Const.IMPORT_TRANSFORM, None) is not None:
+            moved_objs.append(obj)
+    if not moved_objs:
+        return
+    is_close = are_flat_transforms_close(get_import_transform_array(moved_objs), get_ue_transform_array(moved_objs))
+    for obj, close in zip(moved_objs, is_close.tolist()):
+        if not close:
+            obj[Const.DIRTY] = True
+
+
+def register():
+    if _track_actor_updates not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_track_actor_updates)
+
+
+def unregister():
+    if _track_actor_updates in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_track_actor_updates)
@@ -0,0 +1,276 @@
+import bpy
+import os
+import time
+from bpy.app.handlers import persistent
+from .util import Const
+from .i18n import tr
+
+# =====================
+# UE导出目录监视
+# =====================
+# 用bpy.app.timers定时检查交换目录，发现UE新导出的场景（JSON + 关卡FBX/USD）或StaticMesh会话后自动导入。
+# 每次tick只stat交换目录和会话目录本身：新文件出现或原子替换（重命名）时目录mtime才会变化，
+# 此时才用os.scandir重建快照；等待中的候选文件额外stat一次。全程不解析文件内容。
+# UE先写JSON再写FBX：关卡文件不早于JSON、且两者的(mtime, size)连续保持Const.WATCH_SETTLE_SECONDS不变，才认为导出完成。
+# Blender导出JSON只改写JSON，关卡文件比JSON旧，不会触发自动导入。
+# 场景导入modal进行中时跳过整个tick（等待中的导出留到导入结束后处理）；稳定下来的文件路径直接传给导入操作。
+
+SCENE_EXTENSIONS = (".json", ".fbx") + Const.USD_EXTENSIONS
+
+
+def _stat_signature(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PendingExport:
+    """
+    等待写入完成的导出：文件签名在稳定时间内保持不变才视为完成
+    """
+
+    def __init__(self, key: str, paths: tuple):
+        self.key = key
+        self.paths = paths
+        self.signature = None
+        self.stable_since = 0.0
+
+    def is_settled(self, now: float) -> bool:
+        """
+        重新stat候选文件，判断是否已稳定
+        参数：
+            now (float): 当前time.monotonic()
+        返回：
+            bool: 是否写入完成
+        """
+        signature = tuple(_stat_signature(path) for path in self.paths)
+        if None in signature:
+            self.signature = None
+            return False
+        if signature != self.signature:
+            self.signature = signature
+            self.stable_since = now
+            return False
+        return now - self.stable_since >= Const.WATCH_SETTLE_SECONDS
+
+
+class ExportWatcher:
+    """
+    交换目录的stat快照与自动导入状态；启动时已有的导出视为已处理
+    """
+
+    def __init__(self, exchange_dir: str = Const.DEFAULT_IO_TEMP_DIR, session_dir: str = Const.STATIC_MESH_SESSION_DIR):
+        self.exchange_dir = exchange_dir
+        self.session_dir = session_dir
+        self._dir_signatures = {}
+        self._scene_entries = {}
+        self._session_names = ()
+        self.handled_scenes = {}
+        self.handled_session = ""
+        self.pending_scene = None
+        self.pending_session = None
+        self.refresh()
+        latest_json = self.get_latest_scene_json()
+        if latest_json is not None:
+            self.handled_scenes[latest_json] = self._scene_entries[os.path.basename(latest_json).lower()][0]
+        if self._session_names:
+            self.handled_session = self._session_names[-1]
+
+    def _dir_changed(self, path: str) -> bool:
+        signature = _stat_signature(path)
+        if signature == self._dir_signatures.get(path, False):
+            return False
+        self._dir_signatures[path] = signature
+        return True
+
+    def refresh(self) -> None:
+        """
+        目录mtime变化时用os.scandir重建快照（只读取stat信息）
+        """
+        if self._dir_changed(self.exchange_dir):
+            entries = {}
+            try:
+                with os.scandir(self.exchange_dir) as it:
+                    for entry in it:
+                        if entry.name.lower().endswith(SCENE_EXTENSIONS) and entry.is_file():
+                            stat = entry.stat()
+                            entries[entry.name.lower()] = (stat.st_mtime_ns, entry.name)
+            except OSError:
+                pass
+            self._scene_entries = entries
+        if self._dir_changed(self.session_dir):
+            try:
+                with os.scandir(self.session_dir) as it:
+                    # 会话目录名以时间戳开头，按名称排序即按导出顺序
+                    self._session_names = tuple(sorted(entry.name for entry in it if entry.is_dir()))
+            except OSError:
+                self._session_names = ()
+
+    def get_latest_scene_json(self):
+        json_entries = [value for name, value in self._scene_entries.items() if name.endswith(".json")]
+        if not json_entries:
+            return None
+        _mtime_ns, file_name = max(json_entries)
+        return os.path.join(self.exchange_dir, file_name)
+
+    def get_level_file(self, json_path: str, level_format: str):
+        base_name = os.path.splitext(os.path.basename(json_path))[0].lower()
+        extensions = Const.USD_EXTENSIONS if level_format == Const.LEVEL_FORMAT_USD else (".fbx",)
+        for extension in extensions:
+            entry = self._scene_entries.get(base_name + extension)
+            if entry is not None:
+                return os.path.join(self.exchange_dir, entry[1])
+        return None
+
+    def poll_scene(self, level_format: str, now: float):
+        """
+        返回：
+            str or None: 已完成且未处理的场景JSON路径
+        """
+        json_path = self.get_latest_scene_json()
+        if json_path is None:
+            return None
+        json_mtime_ns = self._scene_entries[os.path.basename(json_path).lower()][0]
+        if self.handled_scenes.get(json_path) == json_mtime_ns:
+            return None
+        level_path = self.get_level_file(json_path, level_format)
+        if level_path is None:
+            return None
+        if self.pending_scene is None or self.pending_scene.key != json_path:
+            self.pending_scene = PendingExport(json_path, (json_path, level_path))
+        if not self.pending_scene.is_settled(now):
+            return None
+        json_signature, level_signature = self.pending_scene.signature
+        if level_signature[0] < json_signature[0]:
+            # 关卡文件比JSON旧：UE还在写关卡文件，或JSON是Blender导出改写的
+            return None
+        self.handled_scenes[json_path] = json_signature[0]
+        self._scene_entries[os.path.basename(json_path).lower()] = (json_signature[0], os.path.basename(json_path))
+        self.pending_scene = None
+        return json_path
+
+    def poll_session(self, now: float):
+        """
+        返回：
+            str or None: 已完成且未处理的StaticMesh会话文件路径
+        """
+        if not self._session_names:
+            return None
+        session_name = self._session_names[-1]
+        if self.handled_session == session_name:
+            return None
+        session_path = os.path.join(self.session_dir, session_name)
+        session_file = os.path.join(session_path, Const.STATIC_MESH_SESSION_FILE)
+        if self.pending_session is None or self.pending_session.key != session_path:
+            self.pending_session = PendingExport(
+                session_path,
+                (session_file, os.path.join(session_path, Const.STATIC_MESH_SOURCE_FBX)),
+            )
+        if not self.pending_session.is_settled(now):
+            return None
+        self.handled_session = session_name
+        self.pending_session = None
+        return session_file
+
+    def mark_scene_handled(self, json_path: str) -> None:
+        """
+        Blender自身改写JSON后调用，避免把自己的导出当作新导出
+        """
+        signature = _stat_signature(json_path)
+        if signature is not None:
+            self.handled_scenes[os.path.join(self.exchange_dir, os.path.basename(json_path))] = signature[0]
+
+
+_watcher = None
+_is_scene_import_running = False
+
+
+def get_export_watcher():
+    return _watcher
+
+
+def set_scene_import_running(is_running: bool) -> None:
+    """场景导入modal开始/结束时调用，导入期间监视器不启动新的导入"""
+    global _is_scene_import_running
+    _is_scene_import_running = is_running
+
+
+def _run_import_op(operator, **kwargs) -> None:
+    window = bpy.context.window_manager.windows[0] if bpy.context.window_manager.windows else None
+    if window is None:
+        operator("INVOKE_DEFAULT", **kwargs)
+        return
+    override = {"window": window, "screen": window.screen}
+    area = next((area for area in window.screen.areas if area.type == "VIEW_3D"), None)
+    if area is not None:
+        override["area"] = area
+    with bpy.context.temp_override(**override):
+        operator("INVOKE_DEFAULT", **kwargs)
+
+
+def _watch_timer():
+    if _watcher is None:
+        return None
+    if _is_scene_import_running:
+        return Const.WATCH_INTERVAL
+    scene = bpy.context.scene
+    params = getattr(scene, "ubio_params", None) if scene is not None else None
+    if params is None:
+        return Const.WATCH_INTERVAL
+    now = time.monotonic()
+    _watcher.refresh()
+    json_path = _watcher.poll_scene(params.ubio_level_format, now)
+    if json_path is not None:
+        print(tr("log.export_watcher.import_scene", path=json_path))
+        _run_import_op(bpy.ops.ubio.import_latest_unreal_scene, latest_json_path=json_path)
+    session_file = _watcher.poll_session(now)
+    if session_file is not None:
+        print(tr("log.export_watcher.import_session", path=session_file))
+        _run_import_op(bpy.ops.ubio.import_latest_static_mesh_session, latest_session_path=session_file)
+    return Const.WATCH_INTERVAL
+
+
+def start_export_watcher() -> None:
+    global _watcher
+    if _watcher is None:
+        _watcher = ExportWatcher()
+    if not bpy.app.timers.is_registered(_watch_timer):
+        bpy.app.timers.register(_watch_timer, first_interval=Const.WATCH_INTERVAL, persistent=True)
+
+
+def stop_export_watcher() -> None:
+    global _watcher
+    if bpy.app.timers.is_registered(_watch_timer):
+        bpy.app.timers.unregister(_watch_timer)
+    _watcher = None
+
+
+def update_watch_exports(self, context) -> None:
+    """ubio_watch_exports切换时启动或停止监视"""
+    if self.ubio_watch_exports:
+        start_export_watcher()
+    else:
+        stop_export_watcher()
+
+
+@persistent
+def _restore_export_watcher(*_args) -> None:
+    set_scene_import_running(False)  # 打开文件会结束进行中的modal
+    params = getattr(bpy.context.scene, "ubio_params", None)
+    if params is not None and params.ubio_watch_exports:
+        start_export_watcher()
+    else:
+        stop_export_watcher()
+
+
+def register():
+    if _restore_export_watcher not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_restore_export_watcher)
+
+
+def unregister():
+    stop_export_watcher()
+    if _restore_export_watcher in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_restore_export_watcher)
@@ -0,0 +1,305 @@
+import bpy
+import json
+import os
+import socket
+from bpy.app.handlers import persistent
+from .util import (
+    Const,
+    build_actor_record,
+    dump_json_compact,
+    get_actor_key_from_obj,
+    get_transforms_from_objs,
+    is_syncable_actor_obj,
+)
+from .scene_io import read_scene_header
+from .point_instancing import get_level_actor_entries, is_point_instancer, iter_point_instance_records
+from .UnrealBlenderIO import get_level_collection_names
+from .i18n import msgid, tr
+
+# =====================
+# 与UE编辑器的实时同步
+# =====================
+# Blender作为客户端连接UE脚本中的LiveSyncServer（本地TCP），每条消息是一行紧凑JSON：
+#   -> {"type": "hello", "protocol": 1, "main_level": ..., "level_path": ...}
+#   <- {"type": "welcome"} 或 {"type": "error", "message": ...}
+#   -> {"type": "delta", "seq": n, "updates": [actor], "added": [actor], "removed": [actor]}
+#   <- {"type": "ack", "seq": n}
+# actor记录与场景JSON一致（name/actor_type/fname/fguid/class/transform）。
+# depsgraph回调只记录变化的对象名，定时器每Const.LIVE_SYNC_INTERVAL秒合并发送一次，
+# 拖动对象时每秒最多发送几条消息。tools/live_sync_server.py 是可在Linux上测试协议的UE替身。
+
+
+class LiveSyncClient:
+    """
+    非阻塞的行分隔JSON socket连接：发送不完的数据留在缓冲区，下次flush继续发送
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._sock = None
+        self._outbox = bytearray()
+        self._inbox = bytearray()
+
+    def connect(self, timeout: float = Const.LIVE_SYNC_CONNECT_TIMEOUT) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.setblocking(False)
+
+    def send(self, message: dict) -> None:
+        self._outbox += (dump_json_compact(message, Const.JSON_FLOAT_PRECISION) + "\n").encode("utf-8")
+        self.flush()
+
+    def flush(self) -> None:
+        while self._outbox:
+            try:
+                sent = self._sock.send(self._outbox)
+            except BlockingIOError:
+                return
+            del self._outbox[:sent]
+
+    def poll(self) -> list:
+        """
+        读取已到达的消息
+        返回：
+            list[dict]: 完整的消息；对端关闭连接时抛出ConnectionError
+        """
+        while True:
+            try:
+                chunk = self._sock.recv(65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                raise ConnectionError("connection closed by peer")
+            self._inbox += chunk
+        messages = []
+        while b"\n" in self._inbox:
+            line, _sep, rest = bytes(self._inbox).partition(b"\n")
+            self._inbox = bytearray(rest)
+            if line.strip():
+                messages.append(json.loads(line.decode("utf-8")))
+        return messages
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+
+class LiveSyncSession:
+    """
+    一次实时同步会话：记录待发送的变化，定时合并为delta消息
+    """
+
+    def __init__(self, client: LiveSyncClient, level_asset_coll_name: str):
+        self.client = client
+        self.level_asset_coll_name = level_asset_coll_name
+        self.seq = 0
+        self.acked_seq = 0
+        self.is_welcomed = False
+        self.pending_names = set()
+        self.needs_rescan = False
+        self.known_actors = {}
+        self.last_error = ""
+
+    def get_level_asset_coll(self):
+        return bpy.data.collections.get(self.level_asset_coll_name)
+
+    def scan_actors(self) -> dict:
+        """
+        返回：
+            dict: actor匹配键 -> actor对象（点实例展开为逐actor记录）
+        """
+        level_asset_coll = self.get_level_asset_coll()
+        if level_asset_coll is None:
+            return {}
+        return {
+            get_actor_key_from_obj(obj): obj
+            for obj in get_level_actor_entries(level_asset_coll.all_objects)
+            if is_syncable_actor_obj(obj)
+        }
+
+    def collect(self, depsgraph) -> None:
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Collection):
+                # 对象的新增/删除表现为集合更新
+                self.needs_rescan = True
+            elif isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry):
+                self.pending_names.add(update.id.original.name)
+
+    def build_delta(self):
+        """
+        合并自上次发送以来的变化
+        返回：
+            dict or None: delta消息，没有变化时返回None
+        """
+        added_objs = []
+        removed_keys = []
+        if self.needs_rescan:
+            current_actors = self.scan_actors()
+            added_objs = [obj for key, obj in current_actors.items() if key not in self.known_actors]
+            removed_keys = [key for key in self.known_actors if key not in current_actors]
+            self.known_actors = {key: obj.name for key, obj in current_actors.items()}
+            self.needs_rescan = False
+        added_names = {obj.name for obj in added_objs}
+
+        updated_objs = []
+        for name in self.pending_names - added_names:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                continue
+            if is_point_instancer(obj):
+                updated_objs.extend(iter_point_instance_records(obj))
+            elif is_syncable_actor_obj(obj) and get_actor_key_from_obj(obj) in self.known_actors:
+                updated_objs.append(obj)
+        self.pending_names.clear()
+        if not (added_objs or removed_keys or updated_objs):
+            return None
+
+        transforms = get_transforms_from_objs(updated_objs + added_objs)
+        records = [build_actor_record(obj, transform) for obj, transform in zip(updated_objs + added_objs, transforms)]
+        self.seq += 1
+        return {
+            "type": "delta",
+            "seq": self.seq,
+            "updates": records[:len(updated_objs)],
+            "added": records[len(updated_objs):],
+            "removed": [
+                {"name": name, "actor_type": actor_type, "fname": fname, "fguid": guid}
+                for name, actor_type, fname, guid in removed_keys
+            ],
+        }
+
+    def tick(self) -> bool:
+        """
+        处理收到的消息并发送合并后的delta
+        返回：
+            bool: 会话是否继续
+        """
+        for message in self.client.poll():
+            message_type = message.get("type")
+            if message_type == "welcome":
+                self.is_welcomed = True
+            elif message_type == "ack":
+                self.acked_seq = max(self.acked_seq, int(message.get("seq", 0)))
+            elif message_type == "error":
+                self.last_error = str(message.get("message", ""))
+                print(tr("log.live_sync.server_error", error=self.last_error))
+                return False
+        self.client.flush()
+        if self.is_welcomed:
+            delta = self.build_delta()
+            if delta is not None:
+                self.client.send(delta)
+        return True
+
+
+_session = None
+
+
+def get_live_sync_session():
+    return _session
+
+
+def _track_live_sync_updates(_scene, depsgraph) -> None:
+    if _session is not None:
+        _session.collect(depsgraph)
+
+
+def _live_sync_timer():
+    if _session is None:
+        return None
+    try:
+        if _session.tick():
+            return Const.LIVE_SYNC_INTERVAL
+    except (OSError, ValueError) as exc:
+        print(tr("log.live_sync.disconnected", error=str(exc)))
+    stop_live_sync()
+    return None
+
+
+def start_live_sync(json_path: str, host: str = Const.LIVE_SYNC_HOST, port: int = Const.LIVE_SYNC_PORT):
+    """
+    连接UE并开始实时同步当前导入的关卡
+    参数：
+        json_path (str): 当前关卡对应的场景JSON（用于校验UE端打开的关卡）
+        host (str): UE端地址
+        port (int): UE端端口
+    返回：
+        LiveSyncSession: 会话；连接失败时抛出OSError
+    """
+    global _session
+    stop_live_sync()
+    scene_header = read_scene_header(json_path)
+    _main_level_name, level_path_name = get_level_collection_names(scene_header)
+    client = LiveSyncClient(host, port)
+    client.connect()
+    session = LiveSyncSession(client, level_path_name)
+    session.known_actors = {key: obj.name for key, obj in session.scan_actors().items()}
+    client.send({
+        "type": "hello",
+        "protocol": Const.LIVE_SYNC_PROTOCOL,
+        "main_level": scene_header.get("main_level", ""),
+        "level_path": scene_header.get("level_path", ""),
+    })
+    _session = session
+    bpy.app.handlers.depsgraph_update_post.append(_track_live_sync_updates)
+    bpy.app.timers.register(_live_sync_timer, first_interval=Const.LIVE_SYNC_INTERVAL)
+    return session
+
+
+def stop_live_sync() -> None:
+    global _session
+    if _track_live_sync_updates in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_track_live_sync_updates)
+    if bpy.app.timers.is_registered(_live_sync_timer):
+        bpy.app.timers.unregister(_live_sync_timer)
+    if _session is not None:
+        _session.client.close()
+        _session = None
+
+
+class UBIO_OT_ToggleLiveSync(bpy.types.Operator):
+    bl_idname = "ubio.toggle_live_sync"
+    bl_label = msgid("op.toggle_live_sync.label")
+    bl_description = msgid("op.toggle_live_sync.desc")
+
+    def execute(self, context):
+        if _session is not None:
+            stop_live_sync()
+            self.report({"INFO"}, tr("report.live_sync.stopped"))
+            return {"FINISHED"}
+        params = context.scene.ubio_params
+        json_path = params.ubio_json_path
+        if not os.path.exists(json_path):
+            self.report({"ERROR"}, tr("report.live_sync.json_not_found", path=json_path))
+            return {"CANCELLED"}
+        _main_level_name, level_path_name = get_level_collection_names(read_scene_header(json_path))
+        if bpy.data.collections.get(level_path_name) is None:
+            self.report({"ERROR"}, tr("report.export_json.level_asset_not_found"))
+            return {"CANCELLED"}
+        try:
+            start_live_sync(json_path, port=params.ubio_live_sync_port)
+        except OSError as exc:
+            self.report({"ERROR"}, tr("report.live_sync.connect_failed", port=params.ubio_live_sync_port, error=str(exc)))
+            return {"CANCELLED"}
+        self.report({"INFO"}, tr("report.live_sync.started", port=params.ubio_live_sync_port))
+        return {"FINISHED"}
+
+
+@persistent
+def _stop_live_sync_on_load(*_args) -> None:
+    stop_live_sync()
+
+
+def register():
+    if _stop_live_sync_on_load not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(_stop_live_sync_on_load)
+
+
+def unregister():
+    stop_live_sync()
+    if _stop_live_sync_on_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_stop_live_sync_on_load)
@@ -0,0 +1,332 @@
+import bpy
+import json
+from mathutils import Euler, Matrix, Vector
+from .util import Const
+from .profiling import profiled
+
+# =====================
+# StaticMesh actor点实例化
+# =====================
+# 引用同一Mesh的StaticMesh actor合并为一个点云对象 + Geometry Nodes实例化：
+# 每个点对应一个actor，点位置为actor位置，旋转/缩放/actor序号存为点属性；
+# GUID、fname等字符串无法作为几何属性保存，按actor序号存放在实例化对象的自定义属性中。
+# 被实例化的Mesh挂在一个隐藏的原型对象上，供节点组的Object Info引用。
+
+POINT_INSTANCER_MODIFIER = "UBIO Point Instances"
+POINT_INSTANCER_PREFIX = "UBIO_Instances_"
+POINT_PROTOTYPE_PREFIX = "UBIO_Prototype_"
+
+
+class PointInstanceRecord:
+    """
+    点实例对应的actor记录，提供与bpy.types.Object相同的name/location/rotation_euler/scale/get接口，
+    导出JSON时可以与普通actor对象一起处理
+    """
+
+    def __init__(self, actor_info: dict, location: Vector, rotation_euler: Euler, scale: Vector,
+                 instancer=None, actor_index: int = -1):
+        """
+        参数：
+            actor_info (dict): 实例化对象中保存的actor信息
+            location / rotation_euler / scale: 世界空间transform（Blender空间）
+            instancer (bpy.types.Object or None): 所属实例化对象
+            actor_index (int): 在实例化对象actor信息中的序号
+        """
+        self.name = actor_info["name"]
+        self.instancer = instancer
+        self.actor_index = actor_index
+        self.location = location
+        self.rotation_euler = rotation_euler
+        self.scale = scale
+        self._props = {
+            Const.GUID: actor_info.get("guid", ""),
+            Const.FNAME: actor_info.get("fname", ""),
+            Const.ACTORTYPE: actor_info.get("actor_type", ""),
+            Const.ACTORCLASS: actor_info.get("class", ""),
+        }
+        if actor_info.get("import_transform") is not None:
+            self._props[Const.IMPORT_TRANSFORM] = actor_info["import_transform"]
+        if instancer is not None and instancer.get(Const.DIRTY, False):
+            self._props[Const.DIRTY] = True
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+
+def is_point_instancer(obj) -> bool:
+    return bool(obj.get(Const.POINT_INSTANCER, False))
+
+
+def get_point_instancer_node_group() -> bpy.types.NodeTree:
+    """
+    获取（不存在时创建）点实例化节点组：按点属性中的旋转/缩放实例化输入对象
+    返回：
+        bpy.types.NodeTree: 节点组
+    """
+    node_group = bpy.data.node_groups.get(Const.POINT_NODE_GROUP)
+    if node_group is not None:
+        return node_group
+    node_group = bpy.data.node_groups.new(Const.POINT_NODE_GROUP, "GeometryNodeTree")
+    node_group.interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+    node_group.interface.new_socket("Instance", in_out="INPUT", socket_type="NodeSocketObject")
+    node_group.interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+
+    nodes = node_group.nodes
+    links = node_group.links
+    group_input = nodes.new("NodeGroupInput")
+    group_input.location = (-600, 0)
+    group_output = nodes.new("NodeGroupOutput")
+    group_output.location = (300, 0)
+    object_info = nodes.new("GeometryNodeObjectInfo")
+    object_info.location = (-350, -100)
+    object_info.transform_space = "ORIGINAL"
+    object_info.inputs["As Instance"].default_value = True
+    rotation_attr = nodes.new("GeometryNodeInputNamedAttribute")
+    rotation_attr.location = (-350, -300)
+    rotation_attr.data_type = "FLOAT_VECTOR"
+    rotation_attr.inputs["Name"].default_value = Const.POINT_ATTR_ROTATION
+    scale_attr = nodes.new("GeometryNodeInputNamedAttribute")
+    scale_attr.location = (-350, -450)
+    scale_attr.data_type = "FLOAT_VECTOR"
+    scale_attr.inputs["Name"].default_value = Const.POINT_ATTR_SCALE
+    instance_on_points = nodes.new("GeometryNodeInstanceOnPoints")
+    instance_on_points.location = (0, 0)
+
+    links.new(group_input.outputs["Geometry"], instance_on_points.inputs["Points"])
+    links.new(group_input.outputs["Instance"], object_info.inputs["Object"])
+    links.new(object_info.outputs["Geometry"], instance_on_points.inputs["Instance"])
+    links.new(rotation_attr.outputs["Attribute"], instance_on_points.inputs["Rotation"])
+    links.new(scale_attr.outputs["Attribute"], instance_on_points.inputs["Scale"])
+    links.new(instance_on_points.outputs["Instances"], group_output.inputs["Geometry"])
+    return node_group
+
+
+def _get_instance_socket_id(node_group: bpy.types.NodeTree) -> str:
+    for item in node_group.interface.items_tree:
+        if item.item_type == "SOCKET" and item.in_out == "INPUT" and item.socket_type == "NodeSocketObject":
+            return item.identifier
+    raise KeyError("Instance")
+
+
+def is_point_instance_candidate(obj) -> bool:
+    """
+    判断对象是否可以合并为点实例：独立的StaticMesh actor（无父子关系、无修改器、XYZ欧拉旋转）
+    """
+    return (
+        obj.type == "MESH"
+        and obj.data is not None
+        and obj.get(Const.ACTORTYPE, None) == "StaticMesh"
+        and obj.get(Const.GUID, None) is not None
+        and obj.parent is None
+        and not obj.children
+        and not obj.modifiers
+        and obj.rotation_mode == "XYZ"
+        and not obj.get(Const.PROXY_ACTOR, False)
+    )
+
+
+@profiled("point_instancing")
+def collapse_point_instances(objs, level_asset_coll: bpy.types.Collection, min_count: int = None) -> list:
+    """
+    把引用同一Mesh的StaticMesh actor合并为点实例化对象（需先去重Mesh，否则每个actor的Mesh都不同）
+    参数：
+        objs (Iterable[bpy.types.Object]): 候选对象
+        level_asset_coll (bpy.types.Collection): 实例化对象与原型对象所在的Level Asset集合
+        min_count (int): 同一Mesh至少有多少个actor才合并，默认Const.POINT_INSTANCE_MIN_COUNT
+    返回：
+        list[bpy.types.Object]: 新建的实例化对象
+    """
+    if min_count is None:
+        min_count = Const.POINT_INSTANCE_MIN_COUNT
+    objs_by_mesh = {}
+    for obj in objs:
+        if is_point_instance_candidate(obj):
+            objs_by_mesh.setdefault(obj.data, []).append(obj)
+    instancers = []
+    for mesh, mesh_objs in objs_by_mesh.items():
+        if len(mesh_objs) >= min_count:
+            instancers.append(create_point_instancer(mesh, mesh_objs, level_asset_coll))
+    return instancers
+
+
+def create_point_instancer(mesh: bpy.types.Mesh, objs: list, level_asset_coll: bpy.types.Collection):
+    """
+    为一组引用同一Mesh的actor创建点云 + Geometry Nodes实例化对象，并删除原actor对象
+    参数：
+        mesh (bpy.types.Mesh): 共用的Mesh
+        objs (list[bpy.types.Object]): 引用该Mesh的actor对象
+        level_asset_coll (bpy.types.Collection): 所在集合
+    返回：
+        bpy.types.Object: 实例化对象
+    """
+    prototype_obj = bpy.data.objects.new(f"{POINT_PROTOTYPE_PREFIX}{mesh.name}", mesh)
+    prototype_obj[Const.POINT_PROTOTYPE] = True
+    level_asset_coll.objects.link(prototype_obj)
+    prototype_obj.hide_viewport = True
+    prototype_obj.hide_render = True
+    prototype_obj.hide_select = True
+
+    locations = []
+    rotations = []
+    scales = []
+    actor_infos = []
+    for obj in objs:
+        locations.extend(obj.location)
+        rotations.extend(obj.rotation_euler)
+        scales.extend(obj.scale)
+        import_transform = obj.get(Const.IMPORT_TRANSFORM, None)
+        actor_infos.append({
+            "name": obj.name,
+            "guid": str(obj.get(Const.GUID, "")),
+            "fname": str(obj.get(Const.FNAME, "")),
+            "class": str(obj.get(Const.ACTORCLASS, "")),
+            "actor_type": str(obj.get(Const.ACTORTYPE, "")),
+            "import_transform": list(import_transform) if import_transform is not None else None,
+        })
+
+    points = bpy.data.meshes.new(f"{POINT_INSTANCER_PREFIX}{mesh.name}")
+    points[Const.OWNED_ID] = True
+    points.vertices.add(len(objs))
+    points.vertices.foreach_set("co", locations)
+    points.attributes.new(Const.POINT_ATTR_ROTATION, "FLOAT_VECTOR", "POINT").data.foreach_set("vector", rotations)
+    points.attributes.new(Const.POINT_ATTR_SCALE, "FLOAT_VECTOR", "POINT").data.foreach_set("vector", scales)
+    points.attributes.new(Const.POINT_ATTR_INDEX, "INT", "POINT").data.foreach_set("value", list(range(len(objs))))
+    points.update()
+
+    instancer = bpy.data.objects.new(points.name, points)
+    instancer[Const.POINT_INSTANCER] = True
+    instancer[Const.POINT_ACTORS] = json.dumps(actor_infos, ensure_ascii=False)
+    instancer[Const.ACTORCLASS] = actor_infos[0]["class"]
+    if any(obj.get(Const.DIRTY, False) for obj in objs):
+        instancer[Const.DIRTY] = True
+    instancer.color = objs[0].color
+    level_asset_coll.objects.link(instancer)
+    node_group = get_point_instancer_node_group()
+    modifier = instancer.modifiers.new(POINT_INSTANCER_MODIFIER, "NODES")
+    modifier.node_group = node_group
+    modifier[_get_instance_socket_id(node_group)] = prototype_obj
+
+    bpy.data.batch_remove(ids=list(objs))
+    return instancer
+
+
+def iter_point_instance_records(instancer):
+    """
+    读取实例化对象的点属性，逐个产出actor记录（世界空间transform，已包含实例化对象自身的变换）
+    参数：
+        instancer (bpy.types.Object): 实例化对象
+    返回：
+        Iterator[PointInstanceRecord]: actor记录
+    """
+    actor_infos = json.loads(instancer.get(Const.POINT_ACTORS, "[]"))
+    points = instancer.data
+    point_count = len(points.vertices)
+    locations = [0.0] * (point_count * 3)
+    rotations = [0.0] * (point_count * 3)
+    scales = [1.0] * (point_count * 3)
+    indices = [0] * point_count
+    points.vertices.foreach_get("co", locations)
+    points.attributes[Const.POINT_ATTR_ROTATION].data.foreach_get("vector", rotations)
+    points.attributes[Const.POINT_ATTR_SCALE].data.foreach_get("vector", scales)
+    points.attributes[Const.POINT_ATTR_INDEX].data.foreach_get("value", indices)
+    instancer_matrix = instancer.matrix_world
+    is_identity = instancer_matrix == Matrix.Identity(4)
+    for point_index, actor_index in enumerate(indices):
+        if not 0 <= actor_index < len(actor_infos):
+            continue
+        offset = point_index * 3
+        location = Vector(locations[offset:offset + 3])
+        rotation = Euler(rotations[offset:offset + 3], "XYZ")
+        scale = Vector(scales[offset:offset + 3])
+        if not is_identity:
+            world_matrix = instancer_matrix @ Matrix.LocRotScale(location, rotation, scale)
+            location, quaternion, scale = world_matrix.decompose()
+            rotation = quaternion.to_euler("XYZ")
+        yield PointInstanceRecord(actor_infos[actor_index], location, rotation, scale, instancer, actor_index)
+
+
+def get_level_actor_entries(objs) -> list:
+    """
+    展开对象列表中的点实例化对象，得到逐actor的条目（普通对象原样保留，原型对象被忽略）
+    参数：
+        objs (Iterable[bpy.types.Object]): Level Asset集合中的对象
+    返回：
+        list[bpy.types.Object or PointInstanceRecord]: actor条目
+    """
+    entries = []
+    for obj in objs:
+        if is_point_instancer(obj):
+            entries.extend(iter_point_instance_records(obj))
+        elif not obj.get(Const.POINT_PROTOTYPE, False):
+            entries.append(obj)
+    return entries
+
+
+def mark_point_instances_synced(synced_records) -> None:
+    """
+    导出后把点实例的当前transform记为新的同步值，并清除所属实例化对象的修改标记
+    参数：
+        synced_records (Iterable[tuple[PointInstanceRecord, list or None]]): 记录及已导出的展开transform，
+            transform为None表示该actor未改动
+    """
+    records_by_instancer = {}
+    for record, transform_values in synced_records:
+        if record.instancer is not None:
+            records_by_instancer.setdefault(record.instancer, []).append((record.actor_index, transform_values))
+    for instancer, updates in records_by_instancer.items():
+        if any(transform_values is not None for _index, transform_values in updates):
+            actor_infos = json.loads(instancer.get(Const.POINT_ACTORS, "[]"))
+            for actor_index, transform_values in updates:
+                if transform_values is not None and 0 <= actor_index < len(actor_infos):
+                    actor_infos[actor_index]["import_transform"] = transform_values
+            instancer[Const.POINT_ACTORS] = json.dumps(actor_infos, ensure_ascii=False)
+        if Const.DIRTY in instancer:
+            del instancer[Const.DIRTY]
+
+
+@profiled("point_instancing")
+def expand_point_instancer(instancer, level_asset_coll: bpy.types.Collection) -> list:
+    """
+    把实例化对象还原为逐actor的普通对象（共用原型的Mesh），并删除实例化对象与原型对象
+    参数：
+        instancer (bpy.types.Object): 实例化对象
+        level_asset_coll (bpy.types.Collection): 还原对象所在的集合
+    返回：
+        list[bpy.types.Object]: 还原的actor对象
+    """
+    modifier = instancer.modifiers.get(POINT_INSTANCER_MODIFIER)
+    prototype_obj = None
+    if modifier is not None and modifier.node_group is not None:
+        prototype_obj = modifier.get(_get_instance_socket_id(modifier.node_group), None)
+    if prototype_obj is None or prototype_obj.type != "MESH":
+        return []
+    mesh = prototype_obj.data
+    records = list(iter_point_instance_records(instancer))
+    color = tuple(instancer.color)
+    new_objs = []
+    for record in records:
+        obj = bpy.data.objects.new(record.name, mesh)
+        obj.location = record.location
+        obj.rotation_euler = record.rotation_euler
+        obj.scale = record.scale
+        for key in (Const.GUID, Const.FNAME, Const.ACTORTYPE, Const.ACTORCLASS, Const.IMPORT_TRANSFORM, Const.DIRTY):
+            if key in record:
+                obj[key] = record[key]
+        obj.color = color
+        level_asset_coll.objects.link(obj)
+        new_objs.append(obj)
+    points = instancer.data
+    bpy.data.batch_remove(ids=[instancer, prototype_obj])
+    if points.users == 0:
+        bpy.data.batch_remove(ids=[points])
+    return new_objs
+
+
+def has_point_instancers(coll: bpy.types.Collection) -> bool:
+    return coll is not None and any(is_point_instancer(obj) for obj in coll.objects)
@@ -0,0 +1,213 @@
+import bpy
+import os
+import time
+import cProfile
+import functools
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+# =====================
+# 导入/导出耗时统计
+# =====================
+# operator运行期间激活一个OperationProfile，底层函数通过profile_phase/profile_count记录分阶段耗时和数量；
+# 没有激活的profile时这些调用几乎没有开销。阶段耗时为包含子阶段的wall time。
+
+PROFILE_LOG_FILE = "ubio_profile.log"
+_active_profile = None
+
+
+def get_profile_dir() -> str:
+    """
+    获取profile日志与.prof文件的输出目录（不放在UBIO临时目录，避免退出Blender时被清理）
+    返回：
+        str: 输出目录
+    """
+    prefs = get_addon_preferences()
+    if prefs is not None and prefs.profile_dir:
+        profile_dir = bpy.path.abspath(prefs.profile_dir)
+    else:
+        try:
+            profile_dir = bpy.utils.extension_path_user(__package__, path="profiles", create=True)
+        except (AttributeError, ValueError):
+            profile_dir = os.path.join(tempfile.gettempdir(), "UBIO_Profiles")
+    os.makedirs(profile_dir, exist_ok=True)
+    return profile_dir
+
+
+def get_addon_preferences():
+    addon = bpy.context.preferences.addons.get(__package__) if bpy.context.preferences else None
+    return addon.preferences if addon is not None else None
+
+
+class OperationProfile:
+    """
+    单次operator运行的耗时记录；可选地同时用cProfile采样
+    用法：
+        profile = OperationProfile("import_scene")
+        with profile.activate():
+            ...
+        summary = profile.finish()
+    """
+
+    def __init__(self, name: str, enable_cprofile: bool = None):
+        """
+        参数：
+            name (str): 操作名称，用于日志和.prof文件名
+            enable_cprofile (bool or None): 是否记录cProfile；为None时读取插件设置
+        """
+        if enable_cprofile is None:
+            prefs = get_addon_preferences()
+            enable_cprofile = bool(prefs and prefs.enable_cprofile)
+        self.name = name
+        self.phase_times = {}
+        self.counts = {}
+        self.total_time = 0.0
+        self.profile_path = ""
+        self._profiler = cProfile.Profile() if enable_cprofile else None
+
+    @contextmanager
+    def activate(self):
+        """
+        在with块内把自身设为当前profile（modal operator可在每个tick重复激活，时间累加）
+        """
+        global _active_profile
+        previous_profile = _active_profile
+        _active_profile = self
+        if self._profiler is not None:
+            self._profiler.enable()
+        start_time = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_time += time.perf_counter() - start_time
+            if self._profiler is not None:
+                self._profiler.disable()
+            _active_profile = previous_profile
+
+    def add_phase_time(self, phase: str, seconds: float) -> None:
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+
+    def add_count(self, key: str, count: int) -> None:
+        self.counts[key] = self.counts.get(key, 0) + count
+
+    def get_summary(self) -> str:
+        """
+        返回：
+            str: 单行摘要，阶段按耗时从大到小排列
+        """
+        phases = sorted(self.phase_times.items(), key=lambda item: item[1], reverse=True)
+        parts = [f"{self.name} {self.total_time:.2f}s"]
+        parts.extend(f"{phase} {seconds:.2f}s" for phase, seconds in phases)
+        parts.extend(f"{key}={count}" for key, count in self.counts.items())
+        return " | ".join(parts)
+
+    def finish(self) -> str:
+        """
+        结束记录：摘要追加到日志文件，开启cProfile时写出.prof
+        返回：
+            str: 摘要
+        """
+        summary = self.get_summary()
+        try:
+            profile_dir = get_profile_dir()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if self._profiler is not None:
+                self.profile_path = os.path.join(profile_dir, f"{self.name}_{timestamp}.prof")
+                self._profiler.dump_stats(self.profile_path)
+                summary += f" | prof={self.profile_path}"
+            with open(os.path.join(profile_dir, PROFILE_LOG_FILE), "a", encoding="utf-8") as f:
+                f.write(f"{timestamp} {summary}\n")
+        except OSError as exc:
+            print(f"[UBIO] Failed to write profile: {exc}")
+        print(f"[UBIO] {summary}")
+        return summary
+
+
+@contextmanager
+def profile_phase(phase: str):
+    """
+    记录with块的耗时到当前profile的指定阶段；不能跨越generator的yield，否则会计入等待时间
+    参数：
+        phase (str): 阶段名称
+    """
+    profile = _active_profile
+    if profile is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_phase_time(phase, time.perf_counter() - start_time)
+
+
+def profile_count(key: str, count: int = 1) -> None:
+    """
+    在当前profile中累加计数（如actor、对象数量）
+    参数：
+        key (str): 计数名称
+        count (int): 增量
+    """
+    if _active_profile is not None:
+        _active_profile.add_count(key, count)
+
+
+def profile_iter(iterable, phase: str, count_key: str = ""):
+    """
+    包装迭代器，把每次取值的耗时计入指定阶段（用于流式读取JSON）
+    参数：
+        iterable (Iterable): 被包装的迭代器
+        phase (str): 阶段名称
+        count_key (str): 可选，按产出数量累加的计数名称
+    返回：
+        Iterator: 原样产出元素
+    """
+    iterator = iter(iterable)
+    while True:
+        start_time = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            if _active_profile is not None:
+                _active_profile.add_phase_time(phase, time.perf_counter() - start_time)
+        if count_key:
+            profile_count(count_key)
+        yield item
+
+
+def profiled(phase: str):
+    """
+    装饰器：把函数每次调用的耗时计入指定阶段
+    参数：
+        phase (str): 阶段名称
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def run_profiled_operator(operator, name: str, run, context):
+    """
+    在OperationProfile中运行operator逻辑；成功时把耗时摘要写入operator report
+    参数：
+        operator (bpy.types.Operator): 当前operator
+        name (str): 操作名称
+        run (Callable[[Context], set]): 实际的operator逻辑
+        context (bpy.types.Context): 当前context
+    返回：
+        set: run的返回值
+    """
+    profile = OperationProfile(name)
+    with profile.activate():
+        result = run(context)
+    summary = profile.finish()
+    if "FINISHED" in result:
+        operator.report({"INFO"}, summary)
+    return result
@@ -0,0 +1,334 @@
+import bpy
+import os
+import sys
+import mmap
+import json
+import math
+import struct
+from array import array
+from .util import open_atomic
+
+# =====================
+# 二进制列式场景交换格式（JSON的可选sidecar）
+# =====================
+# 文件布局（小端）：
+#   header : magic(8s) version(u32) actor_count(u32) section_count(u32) reserved(u32)
+#   目录   : section_count 个 (name(24s) offset(u64) size(u64))
+#   数据段 : 每段按8字节对齐
+# 数据段：
+#   meta               UTF-8 JSON，场景顶层字段（main_level / level_path 等）
+#   transform          float64 * actor_count * 9（location xyz, rotation xyz, scale xyz，UE空间）
+#   flags              uint8 * actor_count（Blender回传标记）
+#   bounds             可选，float64 * actor_count * 6（世界空间包围盒 origin xyz, extent xyz），缺失为NaN
+#   str.<列>.idx       uint32 * actor_count，指向该列字符串表
+#   str.<列>.off       uint32 * (字符串数 + 1)，字符串表偏移
+#   str.<列>.dat       UTF-8 字符串表
+#   extra              可选，UTF-8 JSON {actor序号: 其它字段}
+# UnrealAsset/Python/UnrealBlenderIO.py 中有同格式的读写实现，修改时需两边同步。
+
+SCENE_BINARY_EXT = ".ubioscene"
+SCENE_BINARY_MAGIC = b"UBIOSCN1"
+SCENE_BINARY_VERSION = 1
+SCENE_BINARY_STRING_COLUMNS = ("name", "fname", "fguid", "class", "actor_type")
+SCENE_BINARY_FLAGS = {"": 0, "NewActor": 1, "Removed": 2, "Modified": 3}
+SCENE_BINARY_FLAG_NAMES = {code: flag for flag, code in SCENE_BINARY_FLAGS.items()}
+_CORE_ACTOR_KEYS = set(SCENE_BINARY_STRING_COLUMNS) | {"transform", "bounds", "Blender"}
+_HEADER = struct.Struct("<8sIIII")
+_SECTION = struct.Struct("<24sQQ")
+_TRANSFORM_AXES = (("location", 0.0), ("rotation", 0.0), ("scale", 1.0))
+_BOUNDS_KEYS = ("origin", "extent")
+_NAN_BOUNDS = (math.nan,) * 6
+
+
+def get_scene_binary_path(json_path: str) -> str:
+    """
+    获取场景JSON对应的二进制sidecar路径
+    参数：
+        json_path (str): 场景JSON路径
+    返回：
+        str: sidecar路径
+    """
+    return os.path.splitext(json_path)[0] + SCENE_BINARY_EXT
+
+
+def is_scene_binary_current(json_path: str) -> bool:
+    """
+    判断二进制sidecar是否存在且不旧于JSON（否则应回退到JSON）
+    参数：
+        json_path (str): 场景JSON路径
+    返回：
+        bool: sidecar是否可用
+    """
+    binary_path = get_scene_binary_path(json_path)
+    try:
+        binary_mtime = os.stat(binary_path).st_mtime
+    except OSError:
+        return False
+    try:
+        return binary_mtime >= os.stat(json_path).st_mtime
+    except OSError:
+        return True
+
+
+class SceneBinaryWriter:
+    """
+    逐个接收actor记录并按列累积，最后一次性写出二进制场景文件
+    """
+
+    def __init__(self):
+        self.actor_count = 0
+        self._transforms = array("d")
+        self._bounds = array("d")
+        self._has_bounds = False
+        self._flags = array("B")
+        self._columns = {column: ({}, [], array("I")) for column in SCENE_BINARY_STRING_COLUMNS}
+        self._extras = {}
+
+    def add(self, actor: dict) -> None:
+        """
+        追加一个actor记录（UE JSON格式）
+        参数：
+            actor (dict): UE actor信息字典
+        """
+        for column in SCENE_BINARY_STRING_COLUMNS:
+            lookup, strings, indices = self._columns[column]
+            value = str(actor.get(column, ""))
+            idx = lookup.get(value)
+            if idx is None:
+                idx = len(strings)
+                lookup[value] = idx
+                strings.append(value)
+            indices.append(idx)
+
+        transform = actor.get("transform", {})
+        for key, default in _TRANSFORM_AXES:
+            part = transform.get(key, {})
+            self._transforms.extend(float(part.get(axis, default)) for axis in ("x", "y", "z"))
+
+        extra = {key: value for key, value in actor.items() if key not in _CORE_ACTOR_KEYS}
+        bounds = actor.get("bounds", None)
+        try:
+            bounds_values = [float(bounds[key][axis]) for key in _BOUNDS_KEYS for axis in ("x", "y", "z")]
+            self._has_bounds = True
+        except (KeyError, TypeError, ValueError):
+            bounds_values = _NAN_BOUNDS
+            if bounds is not None:
+                extra["bounds"] = bounds
+        self._bounds.extend(bounds_values)
+
+        flag = actor.get("Blender", "") or ""
+        if flag in SCENE_BINARY_FLAGS:
+            self._flags.append(SCENE_BINARY_FLAGS[flag])
+        else:
+            self._flags.append(0)
+            extra["Blender"] = flag
+        if extra:
+            self._extras[str(self.actor_count)] = extra
+        self.actor_count += 1
+
+    def write(self, file_path: str, header: dict) -> str:
+        """
+        写出二进制场景文件（写入临时文件后原子替换）
+        参数：
+            file_path (str): 输出路径
+            header (dict): 场景顶层字段（不含actors）
+        返回：
+            str: 输出路径
+        """
+        sections = [
+            ("meta", json.dumps(header, ensure_ascii=False).encode("utf-8")),
+            ("transform", _to_little_endian_bytes(self._transforms)),
+            ("flags", self._flags.tobytes()),
+        ]
+        if self._has_bounds:
+            sections.append(("bounds", _to_little_endian_bytes(self._bounds)))
+        for column in SCENE_BINARY_STRING_COLUMNS:
+            _lookup, strings, indices = self._columns[column]
+            blob = bytearray()
+            offsets = array("I", [0])
+            for value in strings:
+                blob += value.encode("utf-8")
+                offsets.append(len(blob))
+            sections.append((f"str.{column}.idx", _to_little_endian_bytes(indices)))
+            sections.append((f"str.{column}.off", _to_little_endian_bytes(offsets)))
+            sections.append((f"str.{column}.dat", bytes(blob)))
+        if self._extras:
+            sections.append(("extra", json.dumps(self._extras, ensure_ascii=False).encode("utf-8")))
+
+        data_offset = _align8(_HEADER.size + _SECTION.size * len(sections))
+        directory = []
+        for name, payload in sections:
+            directory.append((name, data_offset, len(payload)))
+            data_offset = _align8(data_offset + len(payload))
+
+        with open_atomic(file_path, "wb") as f:
+            f.write(_HEADER.pack(SCENE_BINARY_MAGIC, SCENE_BINARY_VERSION, self.actor_count, len(sections), 0))
+            for name, offset, size in directory:
+                f.write(_SECTION.pack(name.encode("ascii"), offset, size))
+            for (_name, payload), (_dir_name, offset, _size) in zip(sections, directory):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(payload)
+        return file_path
+
+
+class SceneBinaryReader:
+    """
+    通过mmap读取二进制场景文件；transform列直接映射为float64视图，无需解析
+    transforms/flags等视图只在reader关闭前有效
+    用法：
+        with SceneBinaryReader(path) as reader:
+            reader.get_transform(0)
+    """
+
+    def __init__(self, file_path: str):
+        """
+        参数：
+            file_path (str): 二进制场景文件路径
+        """
+        self._file = open(file_path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty scene binary file: {file_path}")
+        self._view = memoryview(self._mmap)
+        self._derived_views = []
+        magic, version, actor_count, section_count, _reserved = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SCENE_BINARY_MAGIC or version > SCENE_BINARY_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported scene binary file: {file_path}")
+        self.actor_count = actor_count
+        self._sections = {}
+        for idx in range(section_count):
+            name, offset, size = _SECTION.unpack_from(self._mmap, _HEADER.size + idx * _SECTION.size)
+            self._sections[name.rstrip(b"\0").decode("ascii")] = (offset, size)
+        self.header = json.loads(bytes(self._section_view("meta")).decode("utf-8"))
+        self.transforms = self._typed_view("transform", "d")
+        self.flags = self._section_view("flags")
+        self.bounds = self._typed_view("bounds", "d") if "bounds" in self._sections else None
+        self._columns = {
+            column: (
+                self._typed_view(f"str.{column}.idx", "I"),
+                self._typed_view(f"str.{column}.off", "I"),
+                self._section_view(f"str.{column}.dat"),
+            )
+            for column in SCENE_BINARY_STRING_COLUMNS
+        }
+        self._extras = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def close(self) -> None:
+        """
+        释放mmap与文件句柄（Windows下映射中的文件无法被替换）
+        """
+        self.transforms = None
+        self.bounds = None
+        self.flags = None
+        self._columns = {}
+        if self._view is not None:
+            # 先释放派生视图，否则mmap无法关闭
+            for view in reversed(self._derived_views):
+                view.release()
+            self._derived_views = []
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _section_view(self, name: str) -> memoryview:
+        offset, size = self._sections.get(name, (0, 0))
+        view = self._view[offset:offset + size]
+        self._derived_views.append(view)
+        return view
+
+    def _typed_view(self, name: str, typecode: str):
+        view = self._section_view(name)
+        if sys.byteorder == "little":
+            typed_view = view.cast(typecode)
+            self._derived_views.append(typed_view)
+            return typed_view
+        values = array(typecode, bytes(view))
+        values.byteswap()
+        return values
+
+    def get_string(self, column: str, actor_index: int) -> str:
+        """
+        读取某个actor在指定字符串列中的值
+        参数：
+            column (str): 列名（SCENE_BINARY_STRING_COLUMNS之一）
+            actor_index (int): actor序号
+        返回：
+            str: 字符串值
+        """
+        indices, offsets, blob = self._columns[column]
+        string_index = indices[actor_index]
+        return bytes(blob[offsets[string_index]:offsets[string_index + 1]]).decode("utf-8")
+
+    def get_transform(self, actor_index: int) -> list:
+        """
+        读取某个actor的9个transform分量（UE空间）
+        参数：
+            actor_index (int): actor序号
+        返回：
+            list[float]: location xyz + rotation xyz + scale xyz
+        """
+        start = actor_index * 9
+        return list(self.transforms[start:start + 9])
+
+    def get_actor(self, actor_index: int) -> dict:
+        """
+        把某个actor还原为UE JSON中的actor字典
+        参数：
+            actor_index (int): actor序号
+        返回：
+            dict: UE actor信息字典
+        """
+        if self._extras is None:
+            extra_view = self._section_view("extra")
+            self._extras = json.loads(bytes(extra_view).decode("utf-8")) if len(extra_view) else {}
+        values = self.get_transform(actor_index)
+        actor = {column: self.get_string(column, actor_index) for column in SCENE_BINARY_STRING_COLUMNS}
+        actor["transform"] = {
+            key: {"x": values[idx * 3], "y": values[idx * 3 + 1], "z": values[idx * 3 + 2]}
+            for idx, (key, _default) in enumerate(_TRANSFORM_AXES)
+        }
+        if self.bounds is not None:
+            bounds_values = self.bounds[actor_index * 6:actor_index * 6 + 6]
+            if not math.isnan(bounds_values[0]):
+                actor["bounds"] = {
+                    key: {"x": bounds_values[idx * 3], "y": bounds_values[idx * 3 + 1], "z": bounds_values[idx * 3 + 2]}
+                    for idx, key in enumerate(_BOUNDS_KEYS)
+                }
+        flag = SCENE_BINARY_FLAG_NAMES.get(self.flags[actor_index], "")
+        if flag:
+            actor["Blender"] = flag
+        actor.update(self._extras.get(str(actor_index), {}))
+        return actor
+
+    def iter_actors(self):
+        """
+        逐个产出还原后的actor字典
+        返回：
+            Iterator[dict]: UE actor信息字典
+        """
+        for actor_index in range(self.actor_count):
+            yield self.get_actor(actor_index)
+
+
+def _align8(value: int) -> int:
+    return (value + 7) & ~7
+
+
+def _to_little_endian_bytes(values: array) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -0,0 +1,382 @@
+import bpy
+import os
+import re
+import json
+from collections import OrderedDict
+from .scene_binary import (
+    SceneBinaryReader,
+    SceneBinaryWriter,
+    get_scene_binary_path,
+    is_scene_binary_current,
+)
+from .util import Const, open_atomic, round_json_floats
+
+# =====================
+# 场景JSON流式读写
+# =====================
+# UE导出的场景JSON在World Partition关卡上可达数百MB，
+# 这里按actor逐条解析/写出，避免一次性把整个文件读成dict列表。
+# 若同目录存在不旧于JSON的二进制sidecar（见scene_binary.py），优先读取sidecar。
+# 顶层字段按 (路径, mtime_ns, size) 缓存，invoke/execute/导入函数之间共享，文件未变时只解析一次；
+# actors每次都流式读取，不常驻内存。
+
+SCENE_READ_CHUNK_SIZE = 1 << 20
+SCENE_HEADER_KEYS = ("main_level", "level_path")
+SCENE_CACHE_SIZE = 8  # 只缓存顶层字段，条目很小
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_scene_cache = OrderedDict()
+
+
+class SceneDocument:
+    """
+    单个场景文件的解析缓存：只保存顶层字段（不含actors）
+    """
+
+    def __init__(self):
+        self.header = None
+        self.is_header_complete = False
+
+
+def _get_scene_cache_key(json_path: str):
+    stat = os.stat(json_path)
+    return (os.path.abspath(json_path), stat.st_mtime_ns, stat.st_size)
+
+
+def get_scene_document(json_path: str) -> SceneDocument:
+    """
+    获取场景文件的缓存文档，文件被修改（mtime或size变化）后自动失效，超过SCENE_CACHE_SIZE时淘汰最久未用的条目
+    参数：
+        json_path (str): 场景JSON路径
+    返回：
+        SceneDocument: 缓存文档
+    """
+    key = _get_scene_cache_key(json_path)
+    document = _scene_cache.get(key)
+    if document is None:
+        for cached_key in [k for k in _scene_cache if k[0] == key[0]]:
+            del _scene_cache[cached_key]
+        document = SceneDocument()
+        _scene_cache[key] = document
+        while len(_scene_cache) > SCENE_CACHE_SIZE:
+            _scene_cache.popitem(last=False)
+    else:
+        _scene_cache.move_to_end(key)
+    return document
+
+
+def clear_scene_cache(json_path: str = None) -> None:
+    """
+    清除场景解析缓存
+    参数：
+        json_path (str or None): 只清除该文件的缓存；为None时清除全部
+    """
+    if json_path is None:
+        _scene_cache.clear()
+        return
+    abs_path = os.path.abspath(json_path)
+    for cached_key in [k for k in _scene_cache if k[0] == abs_path]:
+        del _scene_cache[cached_key]
+
+
+class _JsonStreamReader:
+    """
+    基于分块读取的增量JSON解析器，只支持按顶层对象的key与数组元素逐个读取
+    """
+
+    def __init__(self, file_obj):
+        """
+        参数：
+            file_obj (TextIO): 以文本模式打开的JSON文件
+        """
+        self._file = file_obj
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """
+        读取下一块数据并丢弃已解析的部分
+        返回：
+            bool: 是否读到了新数据
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(SCENE_READ_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        跳过空白并返回下一个字符（不消费），文件结束时返回空字符串
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """
+        消费一个指定字符，不匹配时抛出ValueError
+        参数：
+            char (str): 期望的字符
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid scene JSON: expected '{char}', got '{found}'")
+        self._pos += 1
+
+    def read_value(self):
+        """
+        解析并返回下一个完整的JSON值，数据不足时自动继续读取
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 数字等标量可能恰好在块边界被截断，读到缓冲区末尾时需要补读确认
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_object_keys(self):
+        """
+        逐个产出当前对象的key；调用方必须在下一次迭代前消费对应的value
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Invalid scene JSON: unexpected '{separator}' in object")
+
+    def iter_array(self):
+        """
+        逐个产出当前数组中的元素
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Invalid scene JSON: unexpected '{separator}' in array")
+
+    def skip_value(self) -> None:
+        """
+        跳过下一个值；数组按元素逐个跳过，避免整体解析
+        """
+        if self.peek() == "[":
+            for _item in self.iter_array():
+                pass
+        else:
+            self.read_value()
+
+
+def read_scene_header(json_path: str, required_keys=SCENE_HEADER_KEYS) -> dict:
+    """
+    流式读取场景JSON中除actors以外的顶层字段
+    参数：
+        json_path (str): 场景JSON路径
+        required_keys (Iterable[str] or None): 遇到actors时若这些字段都已读到则提前结束；
+            为None时读取全部顶层字段（actors数组会被逐个跳过）
+    返回：
+        dict: 顶层字段（不包含actors）
+    """
+    document = get_scene_document(json_path)
+    if document.header is not None and (
+        document.is_header_complete or (required_keys is not None and all(k in document.header for k in required_keys))
+    ):
+        return dict(document.header)
+
+    if is_scene_binary_current(json_path):
+        with SceneBinaryReader(get_scene_binary_path(json_path)) as reader:
+            header = dict(reader.header)
+        is_complete = True
+    else:
+        header = {}
+        is_complete = True
+        with open(json_path, "r", encoding="utf-8") as f:
+            reader = _JsonStreamReader(f)
+            for key in reader.iter_object_keys():
+                if key == "actors":
+                    if required_keys is not None and all(k in header for k in required_keys):
+                        is_complete = False
+                        break
+                    reader.skip_value()
+                else:
+                    header[key] = reader.read_value()
+    document.header = header
+    document.is_header_complete = is_complete
+    return dict(header)
+
+
+def iter_scene_actors(json_path: str):
+    """
+    逐个流式产出场景JSON中的actor记录（不缓存，每次产出新的字典，调用方可以原地修改）
+    参数：
+        json_path (str): 场景JSON路径
+    返回：
+        Iterator[dict]: actor信息字典
+    """
+    if is_scene_binary_current(json_path):
+        with SceneBinaryReader(get_scene_binary_path(json_path)) as reader:
+            yield from reader.iter_actors()
+    else:
+        with open(json_path, "r", encoding="utf-8") as f:
+            reader = _JsonStreamReader(f)
+            for key in reader.iter_object_keys():
+                if key == "actors":
+                    yield from reader.iter_array()
+                    break
+                reader.skip_value()
+
+
+def rewrite_scene_json(
+    json_path: str,
+    update_actor,
+    extra_actors=(),
+    header_updates: dict = None,
+    precision: int = Const.JSON_FLOAT_PRECISION,
+) -> None:
+    """
+    流式改写场景JSON：顶层字段原样写回，actors逐个交给update_actor处理，
+    并在actors末尾追加extra_actors。输出为紧凑JSON（每行一个actor），先写入临时文件再原子替换原文件，
+    读写同一路径也安全，UE端也不会读到写了一半的文件。
+    若存在二进制sidecar，会同步写出新的sidecar，保证两种格式内容一致
+    参数：
+        json_path (str): 场景JSON路径
+        update_actor (Callable[[dict], dict or None]): 处理单个actor，返回None表示丢弃该actor
+        extra_actors (Iterable[dict]): 追加到actors末尾的新actor
+        header_updates (dict or None): 需要覆盖或新增的顶层字段（写在actors之前）
+        precision (int or None): actor中float保留的小数位数，None表示原样输出
+    返回：
+        无
+    """
+    header_updates = dict(header_updates or {})
+    binary_path = get_scene_binary_path(json_path)
+    binary_writer = SceneBinaryWriter() if os.path.exists(binary_path) else None
+
+    def write_actors(actors):
+        for actor in actors:
+            actor = update_actor(actor)
+            if actor is not None:
+                actor = round_json_floats(actor, precision)
+                if binary_writer is not None:
+                    binary_writer.add(actor)
+            yield actor
+
+    def write_extra_actors():
+        for actor in extra_actors:
+            actor = round_json_floats(actor, precision)
+            if binary_writer is not None:
+                binary_writer.add(actor)
+            yield actor
+
+    if is_scene_binary_current(json_path):
+        with SceneBinaryReader(binary_path) as reader:
+            header = dict(reader.header, **header_updates)
+            with open_atomic(json_path) as dst:
+                dst.write("{")
+                for key, value in header.items():
+                    dst.write(f"{_dump_compact(key)}:{_dump_compact(value)},")
+                dst.write('"actors":')
+                _write_actor_array(dst, write_actors(reader.iter_actors()), write_extra_actors())
+                dst.write("}\n")
+    else:
+        header = {}
+        # 先关闭源文件再替换，Windows上无法替换仍被打开的文件
+        with open_atomic(json_path) as dst, open(json_path, "r", encoding="utf-8") as src:
+            reader = _JsonStreamReader(src)
+            dst.write("{")
+            is_first_key = True
+            has_actors = False
+            pending_updates = dict(header_updates)
+
+            def write_key(key):
+                nonlocal is_first_key
+                if not is_first_key:
+                    dst.write(",")
+                is_first_key = False
+                dst.write(f"{_dump_compact(key)}:")
+
+            def write_pending_updates():
+                for key, value in pending_updates.items():
+                    write_key(key)
+                    header[key] = value
+                    dst.write(_dump_compact(value))
+                pending_updates.clear()
+
+            for key in reader.iter_object_keys():
+                if key == "actors":
+                    write_pending_updates()
+                    write_key(key)
+                    has_actors = True
+                    _write_actor_array(dst, write_actors(reader.iter_array()), write_extra_actors())
+                else:
+                    value = reader.read_value()
+                    if key in pending_updates:
+                        value = pending_updates.pop(key)
+                    header[key] = value
+                    write_key(key)
+                    dst.write(_dump_compact(value))
+            write_pending_updates()
+            if not has_actors:
+                write_key("actors")
+                _write_actor_array(dst, (), write_extra_actors())
+            dst.write("}\n")
+    clear_scene_cache(json_path)
+    if binary_writer is not None:
+        binary_writer.write(binary_path, header)
+
+
+def _dump_compact(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_actor_array(dst, actors, extra_actors) -> None:
+    """
+    以每行一个actor的紧凑格式写出actors数组
+    参数：
+        dst (TextIO): 输出文件
+        actors (Iterable[dict or None]): 已有actor，None会被跳过
+        extra_actors (Iterable[dict]): 追加的actor
+    """
+    dst.write("[")
+    is_first = True
+    for source in (actors, extra_actors):
+        for actor in source:
+            if actor is None:
+                continue
+            dst.write("\n" if is_first else ",\n")
+            is_first = False
+            dst.write(_dump_compact(actor))
+    dst.write("\n]" if not is_first else "]")
+
+
+def unregister():
+    clear_scene_cache()
@@ -0,0 +1,144 @@
+import bpy
+from bpy.app.handlers import persistent
+from .util import Const
+
+# =====================
+# StaticMesh会话注册表
+# =====================
+# session_id -> 会话集合与对象的引用，导出StaticMesh时不再遍历bpy.data.objects查找带会话ID的对象，
+# 重新导入会话时也从这里找到要复用的会话集合。
+# import_static_mesh_session导入后直接登记；depsgraph回调只检查本次更新的对象，把复制出来的会话对象补登记；
+# 撤销/重做/打开文件后旧引用可能失效，注册表整体作废，下次查询时用一次遍历重建。
+# 查询时逐个校验引用（已删除的对象访问时抛出ReferenceError），失效的引用直接丢弃。
+
+
+class StaticMeshSessionRegistry:
+    def __init__(self):
+        self._sessions = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._sessions is not None
+
+    def invalidate(self) -> None:
+        self._sessions = None
+
+    def rebuild(self) -> None:
+        """
+        遍历一次bpy.data.objects和bpy.data.collections重建所有会话的引用
+        """
+        self._sessions = {}
+        for obj in bpy.data.objects:
+            session_id = obj.get(Const.STATIC_MESH_PROP_SESSION_ID)
+            if session_id:
+                self._get_entry(session_id)["objects"].append(obj)
+        for coll in bpy.data.collections:
+            session_id = coll.get(Const.STATIC_MESH_PROP_SESSION_ID)
+            if session_id:
+                self._get_entry(session_id)["collection"] = coll
+
+    def _get_entry(self, session_id: str) -> dict:
+        return self._sessions.setdefault(session_id, {"objects": [], "collection": None})
+
+    def register_session(self, session_id: str, objs, collection=None) -> None:
+        """
+        登记一次会话导入的对象和集合（替换该会话之前的引用）
+        参数：
+            session_id (str): 会话ID
+            objs (Iterable[bpy.types.Object]): 导入的对象
+            collection (bpy.types.Collection or None): 会话集合
+        """
+        if not self.is_built:
+            return  # 下次查询时重建，会包含这些对象
+        self._sessions[session_id] = {"objects": list(objs), "collection": collection}
+
+    def add_object(self, obj) -> None:
+        session_id = obj.get(Const.STATIC_MESH_PROP_SESSION_ID)
+        if not session_id:
+            return
+        session_objs = self._get_entry(session_id)["objects"]
+        if obj not in session_objs:
+            session_objs.append(obj)
+
+    def get_objects(self, session_id: str) -> list:
+        """
+        返回：
+            list[bpy.types.Object]: 仍存在且仍属于该会话的对象
+        """
+        if not self.is_built:
+            self.rebuild()
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return []
+        valid_objs = []
+        for obj in entry["objects"]:
+            try:
+                if obj.get(Const.STATIC_MESH_PROP_SESSION_ID) == session_id:
+                    valid_objs.append(obj)
+            except ReferenceError:
+                continue
+        entry["objects"] = valid_objs
+        return list(valid_objs)
+
+    def get_collection(self, session_id: str):
+        if not self.is_built:
+            self.rebuild()
+        entry = self._sessions.get(session_id)
+        if entry is None or entry["collection"] is None:
+            return None
+        try:
+            if entry["collection"].get(Const.STATIC_MESH_PROP_SESSION_ID) == session_id:
+                return entry["collection"]
+        except ReferenceError:
+            pass
+        entry["collection"] = None
+        return None
+
+
+_registry = StaticMeshSessionRegistry()
+
+
+def get_static_mesh_session_registry() -> StaticMeshSessionRegistry:
+    return _registry
+
+
+def find_static_mesh_session_objects(session_id: str):
+    if not session_id:
+        return []
+    return _registry.get_objects(session_id)
+
+
+@persistent
+def _track_session_objects(_scene, depsgraph) -> None:
+    if not _registry.is_built:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            _registry.add_object(update.id.original)
+
+
+@persistent
+def _invalidate_session_registry(*_args) -> None:
+    _registry.invalidate()
+
+
+HANDLER_LISTS = ("load_post", "undo_post", "redo_post")
+
+
+def register():
+    if _track_session_objects not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_track_session_objects)
+    for handler_list_name in HANDLER_LISTS:
+        handler_list = getattr(bpy.app.handlers, handler_list_name)
+        if _invalidate_session_registry not in handler_list:
+            handler_list.append(_invalidate_session_registry)
+
+
+def unregister():
+    if _track_session_objects in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_track_session_objects)
+    for handler_list_name in HANDLER_LISTS:
+        handler_list = getattr(bpy.app.handlers, handler_list_name)
+        if _invalidate_session_registry in handler_list:
+            handler_list.remove(_invalidate_session_registry)
+    _registry.invalidate()
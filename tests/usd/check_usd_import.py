@@ -0,0 +1,117 @@
+"""
+USD关卡导入的无界面检查：导入 tests/usd 下的USD fixture，按同名JSON把prim映射回actor，
+检查actor映射、transform、实例化以及未匹配prim的处理。在Linux上也可以运行：
+    blender --background --factory-startup --python-exit-code 1 --python tests/usd/check_usd_import.py
+插件直接从仓库目录加载；检查失败时以非0退出码结束。本目录没有__init__.py，不会被插件加载。
+"""
+import bpy
+import math
+import os
+import re
+import sys
+
+CHECK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(CHECK_DIR))
+FIXTURE_NAME = "level_instancing"
+TOLERANCE = 1e-4
+
+# 期望的Blender空间transform（UE厘米/左手系 -> Blender米/右手系），与JSON中的transform对应
+EXPECTED_ACTORS = {
+    "SM_Rock_1": {"location": (1.0, -2.0, 3.0), "rotation": (0.0, 0.0, 0.0), "scale": (1.0, 1.0, 1.0)},
+    "Rock Two": {"location": (-4.0, 0.0, 0.0), "rotation": (0.0, 0.0, -math.pi / 2), "scale": (2.0, 2.0, 2.0)},
+    "BP_Lamp": {"location": (5.0, -5.0, 0.0), "rotation": (0.0, 0.0, 0.0), "scale": (1.0, 1.0, 1.0)},
+}
+INSTANCED_ACTORS = ("SM_Rock_1", "Rock Two")
+NESTED_ACTOR_CHILDREN = {"BP_Lamp": {"LampMesh", "LampShade"}}
+MISSING_ACTORS = ("PointLight_1",)
+REMOVED_WRAPPERS = ("Props", "EmptyFolder")
+KEPT_UNMATCHED = ("Unmatched_Mesh",)
+
+sys.path.insert(0, os.path.join(REPO_DIR, "benchmarks"))
+from run_benchmark import load_addon  # noqa: E402
+
+
+def get_base_name(name: str) -> str:
+    return re.sub(r"\.\d{3,}$", "", name)
+
+
+def is_close(values, expected) -> bool:
+    return all(abs(value - target) <= TOLERANCE for value, target in zip(values, expected))
+
+
+def check_usd_import(addon) -> list:
+    """
+    导入fixture并检查映射结果
+    参数：
+        addon (module): 已注册的插件包
+    返回：
+        list[str]: 检查失败的说明，全部通过时为空列表
+    """
+    json_path = os.path.join(CHECK_DIR, f"{FIXTURE_NAME}.json")
+    usd_path = addon.util.get_level_file_path(json_path, addon.util.Const.LEVEL_FORMAT_USD)
+    actors = list(addon.scene_io.iter_scene_actors(json_path))
+
+    target_collection = bpy.data.collections.new("UBIO_USD_Check")
+    bpy.context.scene.collection.children.link(target_collection)
+    imported_objs = addon.UnrealBlenderIO.import_usd_objects(usd_path, target_collection)
+    objs = addon.UnrealBlenderIO.map_usd_objs_to_actors(imported_objs, actors)
+    objs_by_name = {obj.name: obj for obj in objs}
+
+    failures = []
+    for actor_name, expected in EXPECTED_ACTORS.items():
+        obj = objs_by_name.get(actor_name)
+        if obj is None:
+            failures.append(f"actor not mapped: {actor_name} (objects: {sorted(objs_by_name)})")
+            continue
+        if obj.parent is not None:
+            failures.append(f"{actor_name}: still parented to {obj.parent.name}")
+        for attr, key in (("location", "location"), ("rotation_euler", "rotation"), ("scale", "scale")):
+            values = tuple(getattr(obj, attr))
+            if not is_close(values, expected[key]):
+                failures.append(f"{actor_name}.{attr} = {values}, expected {expected[key]}")
+
+    instance_collections = set()
+    for actor_name in INSTANCED_ACTORS:
+        obj = objs_by_name.get(actor_name)
+        if obj is None:
+            continue
+        if obj.instance_collection is not None:
+            instance_collections.add(obj.instance_collection.name)
+        elif not obj.children:
+            failures.append(f"{actor_name}: neither a collection instance nor carrying the prototype geometry")
+    if len(instance_collections) > 1:
+        failures.append(f"instanced actors do not share one prototype: {sorted(instance_collections)}")
+
+    for actor_name, expected_children in NESTED_ACTOR_CHILDREN.items():
+        obj = objs_by_name.get(actor_name)
+        if obj is None:
+            continue
+        child_names = {get_base_name(child.name) for child in obj.children}
+        if child_names != expected_children:
+            failures.append(f"{actor_name}: children {sorted(child_names)}, expected {sorted(expected_children)}")
+
+    for actor_name in MISSING_ACTORS:
+        if actor_name in objs_by_name:
+            failures.append(f"{actor_name}: has no prim but an object was mapped to it")
+    remaining_names = {get_base_name(obj.name) for obj in target_collection.all_objects}
+    for wrapper_name in REMOVED_WRAPPERS:
+        if wrapper_name in remaining_names:
+            failures.append(f"wrapper empty not removed: {wrapper_name}")
+    for prim_name in KEPT_UNMATCHED:
+        if prim_name not in remaining_names:
+            failures.append(f"unmatched prim was removed: {prim_name}")
+    return failures
+
+
+def main():
+    addon = load_addon()
+    failures = check_usd_import(addon)
+    for failure in failures:
+        print(f"[UBIO USD check] FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"[UBIO USD check] OK ({len(EXPECTED_ACTORS)} actors mapped)")
+
+
+if __name__ == "__main__":
+    main()
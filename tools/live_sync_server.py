@@ -0,0 +1,199 @@
+"""
+UBIO实时同步的UE替身服务端：实现与UE脚本 LiveSyncServer 相同的协议，不依赖unreal模块，
+可在Linux上配合后台Blender测试Blender端的实时同步。
+    python tools/live_sync_server.py --scene C:/Temp/UBIO/Level.json --log received.jsonl
+收到的消息逐行写入--log文件；actor状态保存在内存中，退出时可用--dump写出。
+本目录没有__init__.py，不会被插件加载。
+"""
+import argparse
+import json
+import selectors
+import socket
+import sys
+import time
+
+LIVE_SYNC_HOST = "127.0.0.1"
+LIVE_SYNC_PORT = 27941
+LIVE_SYNC_PROTOCOL = 1
+TICK_INTERVAL = 1.0 / 60.0  # 模拟编辑器tick
+
+
+class StandInLevel:
+    """
+    内存中的关卡：按(name, fname)保存actor，应用delta的方式与UE脚本 apply_blender_actors 一致
+    """
+
+    def __init__(self, scene_data=None):
+        scene_data = scene_data or {}
+        self.main_level = scene_data.get("main_level", "")
+        self.level_path = scene_data.get("level_path", "")
+        self.actors = {actor["name"]: dict(actor) for actor in scene_data.get("actors", [])}
+
+    def check_hello(self, message):
+        if message.get("protocol") != LIVE_SYNC_PROTOCOL:
+            return f"protocol {message.get('protocol')} != {LIVE_SYNC_PROTOCOL}"
+        if self.main_level and (message.get("main_level"), message.get("level_path")) != (self.main_level, self.level_path):
+            return f"UE opened level: {self.level_path}"
+        return ""
+
+    def apply_delta(self, message):
+        """
+        返回：
+            dict: 各类操作实际生效的数量
+        """
+        counts = {"added": 0, "removed": 0, "moved": 0, "missed": 0}
+        for actor_info in message.get("added", []):
+            self.actors[actor_info["name"]] = dict(actor_info)
+            counts["added"] += 1
+        for actor_info in message.get("removed", []):
+            actor = self.actors.get(actor_info["name"])
+            if actor is not None and actor.get("actor_type") == actor_info.get("actor_type"):
+                del self.actors[actor_info["name"]]
+                counts["removed"] += 1
+            else:
+                counts["missed"] += 1
+        for actor_info in message.get("updates", []):
+            actor = self.actors.get(actor_info["name"])
+            if actor is None and not self.main_level:
+                # 没有加载场景时接受任意actor
+                actor = self.actors.setdefault(actor_info["name"], dict(actor_info))
+            if actor is not None and actor.get("actor_type") == actor_info.get("actor_type"):
+                actor["transform"] = actor_info.get("transform", {})
+                counts["moved"] += 1
+            else:
+                counts["missed"] += 1
+        return counts
+
+
+class StandInServer:
+    def __init__(self, level, host=LIVE_SYNC_HOST, port=LIVE_SYNC_PORT, log_file=None):
+        self.level = level
+        self.host = host
+        self.port = port
+        self.log_file = log_file
+        self.selector = selectors.DefaultSelector()
+        self.buffers = {}
+        self.welcomed = set()
+        self.message_times = []
+        self.had_client = False
+
+    def start(self):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.host, self.port))
+        listener.listen(1)
+        listener.setblocking(False)
+        self.selector.register(listener, selectors.EVENT_READ, data=None)
+        print(f"[UBIO stand-in] listening on {self.host}:{self.port}", flush=True)
+
+    def send(self, client_sock, message):
+        client_sock.sendall((json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    def drop(self, client_sock):
+        self.selector.unregister(client_sock)
+        self.buffers.pop(client_sock, None)
+        self.welcomed.discard(client_sock)
+        client_sock.close()
+        print("[UBIO stand-in] client disconnected", flush=True)
+
+    def tick(self):
+        for key, _events in self.selector.select(timeout=TICK_INTERVAL):
+            if key.data is None:
+                client_sock, address = key.fileobj.accept()
+                client_sock.setblocking(False)
+                self.selector.register(client_sock, selectors.EVENT_READ, data="client")
+                self.buffers[client_sock] = bytearray()
+                self.had_client = True
+                print(f"[UBIO stand-in] client connected {address}", flush=True)
+                continue
+            client_sock = key.fileobj
+            try:
+                chunk = client_sock.recv(65536)
+            except OSError:
+                chunk = b""
+            if not chunk:
+                self.drop(client_sock)
+                continue
+            buffer = self.buffers[client_sock]
+            buffer += chunk
+            while client_sock in self.buffers and b"\n" in buffer:
+                line, _sep, rest = bytes(buffer).partition(b"\n")
+                buffer[:] = rest
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line.decode("utf-8"))
+                except (ValueError, UnicodeDecodeError) as exc:
+                    print(f"[UBIO stand-in] malformed message, dropping client: {exc}", flush=True)
+                    self.drop(client_sock)
+                    break
+                self.handle(client_sock, message)
+
+    def handle(self, client_sock, message):
+        now = time.monotonic()
+        if self.log_file is not None:
+            self.log_file.write(json.dumps(dict(message, received_at=now), ensure_ascii=False) + "\n")
+            self.log_file.flush()
+        message_type = message.get("type")
+        if message_type == "hello":
+            error = self.level.check_hello(message)
+            self.send(client_sock, {"type": "error", "message": error} if error else {"type": "welcome"})
+            print(f"[UBIO stand-in] hello {message.get('level_path')}: {error or 'welcome'}", flush=True)
+            if error:
+                self.drop(client_sock)
+            else:
+                self.welcomed.add(client_sock)
+        elif message_type == "delta" and client_sock in self.welcomed:
+            counts = self.level.apply_delta(message)
+            self.message_times.append(now)
+            recent = [t for t in self.message_times if now - t <= 1.0]
+            print(f"[UBIO stand-in] delta #{message.get('seq')} {counts} ({len(recent)} msg/s)", flush=True)
+            self.send(client_sock, {"type": "ack", "seq": message.get("seq", 0)})
+
+    def has_clients(self):
+        return bool(self.buffers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UBIO live sync stand-in server (mimics the UE side)")
+    parser.add_argument("--host", default=LIVE_SYNC_HOST)
+    parser.add_argument("--port", type=int, default=LIVE_SYNC_PORT)
+    parser.add_argument("--scene", default="", help="scene JSON exported by UE, used to validate hello and hold actors")
+    parser.add_argument("--log", default="", help="append every received message to this JSONL file")
+    parser.add_argument("--dump", default="", help="write the resulting actors to this JSON file on exit")
+    parser.add_argument("--once", action="store_true", help="exit after the first client disconnects")
+    parser.add_argument("--timeout", type=float, default=0.0, help="exit after this many seconds (0: run forever)")
+    args = parser.parse_args(argv)
+
+    scene_data = None
+    if args.scene:
+        with open(args.scene, "r", encoding="utf-8") as f:
+            scene_data = json.load(f)
+    log_file = open(args.log, "a", encoding="utf-8") if args.log else None
+    server = StandInServer(StandInLevel(scene_data), args.host, args.port, log_file)
+    server.start()
+    start_time = time.monotonic()
+    try:
+        while True:
+            server.tick()
+            if args.once and server.had_client and not server.has_clients():
+                break
+            if args.timeout and time.monotonic() - start_time > args.timeout:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log_file is not None:
+            log_file.close()
+        if args.dump:
+            with open(args.dump, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"main_level": server.level.main_level, "level_path": server.level.level_path,
+                     "actors": list(server.level.actors.values())},
+                    f, ensure_ascii=False,
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
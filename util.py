@@ -1,11 +1,17 @@
 import bpy
 from mathutils import Vector
-from math import radians
 from math import pi
+import numpy as np
 import shutil
 import os
+import re
 import json
+import time
+import hashlib
+from array import array
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from .profiling import profiled
 # import addon_utils
 
 # =====================
@@ -25,12 +31,74 @@ class Const:
     COLL_LEVEL = "Level"
     UECOLL_COLOR = "COLOR_06"
     COLLINST_TYPES = ["Blueprint"]
+    SYNC_ACTOR_TYPES = ("StaticMesh", "Blueprint", "LevelInstance")
     BL_FLAG = "Blender"
     BL_NEW = "NewActor"
     BL_DEL = "Removed"
+    BL_MOD = "Modified"
+    DELTA_KEY = "ubio_delta"
+    DIRTY = "ubio_dirty"
     PROXY_PIVOT = "UBIOProxyPivot"
     PROXY_PIVOT_OBJ = "Pivot"
     CUSTOM_VAR = "UBIO"
+    IMPORT_SNAPSHOT = "ubio_import_snapshot"
+    IMPORT_TRANSFORM = "ubio_import_transform"
+    # 实时同步：本地socket，换行分隔的紧凑JSON消息，协议与UE脚本中的LiveSyncServer一致
+    LIVE_SYNC_HOST = "127.0.0.1"
+    LIVE_SYNC_PORT = 27941
+    LIVE_SYNC_PROTOCOL = 1
+    LIVE_SYNC_INTERVAL = 0.25
+    LIVE_SYNC_CONNECT_TIMEOUT = 1.0
+    # 交换目录清单：两端写出场景或修改会话状态时追加一行记录，查找最新导出时只读文件尾部
+    MANIFEST_FILE = "ubio_manifest.jsonl"
+    MANIFEST_TYPE_SCENE = "scene"
+    MANIFEST_TYPE_SESSION = "static_mesh_session"
+    MANIFEST_TAIL_BYTES = 64 * 1024
+    MANIFEST_COMPACT_BYTES = 1024 * 1024
+    # 追加/合并清单时持有的锁文件；拿锁最多等待MANIFEST_LOCK_WAIT_SECONDS，锁超过STALE时间视为残留
+    MANIFEST_LOCK_FILE = "ubio_manifest.lock"
+    MANIFEST_LOCK_WAIT_SECONDS = 2.0
+    MANIFEST_LOCK_POLL_SECONDS = 0.05
+    MANIFEST_LOCK_STALE_SECONDS = 30.0
+    SCENE_STATUS_EXPORTED_FROM_BLENDER = "EXPORTED_FROM_BLENDER"
+    # 导出目录监视：检查间隔与文件稳定时间（秒）
+    WATCH_INTERVAL = 0.5
+    WATCH_SETTLE_SECONDS = 1.0
+    # 场景JSON中float保留的小数位数（厘米/角度），None表示不取整
+    JSON_FLOAT_PRECISION = 4
+    PROXY_ACTOR = "ubio_proxy_actor"
+    PROXY_MESH = "UBIO_ProxyBox"
+    IMPORT_MODE_FULL = "FULL"
+    IMPORT_MODE_PROXY = "PROXY"
+    IMPORT_MODE_POINTS = "POINTS"
+    REGION_MODE_NONE = "NONE"
+    REGION_MODE_BOX = "BOX"
+    REGION_MODE_GRID = "GRID"
+    IMPORT_CHUNK_SIZE = 200
+    IMPORT_TICK_BUDGET = 0.1
+    IMPORT_TIMER_INTERVAL = 0.01
+    # modal导入期间放行的事件（视图导航），其余事件被拦截
+    IMPORT_PASS_THROUGH_EVENTS = frozenset({
+        "MOUSEMOVE", "INBETWEEN_MOUSEMOVE", "MIDDLEMOUSE", "WHEELUPMOUSE", "WHEELDOWNMOUSE",
+        "WHEELINMOUSE", "WHEELOUTMOUSE", "TRACKPADPAN", "TRACKPADZOOM", "MOUSEROTATE", "MOUSESMARTZOOM",
+        "NDOF_MOTION", "WINDOW_DEACTIVATE",
+        "NUMPAD_0", "NUMPAD_1", "NUMPAD_2", "NUMPAD_3", "NUMPAD_4", "NUMPAD_5",
+        "NUMPAD_6", "NUMPAD_7", "NUMPAD_8", "NUMPAD_9", "NUMPAD_PERIOD",
+    })
+    OWNED_ID = "ubio_owned"
+    OWNED_ID_TYPES = ("meshes", "lights", "materials", "images", "collections")
+    LEVEL_FORMAT_FBX = "FBX"
+    LEVEL_FORMAT_USD = "USD"
+    USD_EXTENSIONS = (".usd", ".usdc", ".usda")
+    USD_PRIM_PREFIX = "ubio_usd_"
+    POINT_INSTANCER = "ubio_point_instancer"
+    POINT_PROTOTYPE = "ubio_point_prototype"
+    POINT_ACTORS = "ubio_point_actors"
+    POINT_NODE_GROUP = "UBIO_PointInstancer"
+    POINT_ATTR_ROTATION = "ubio_rotation"
+    POINT_ATTR_SCALE = "ubio_scale"
+    POINT_ATTR_INDEX = "ubio_actor_index"
+    POINT_INSTANCE_MIN_COUNT = 2
     # 其它常量
     ADDON_NAME = "Unreal Blender IO"
     DEFAULT_IO_TEMP_DIR = "C:\\Temp\\UBIO\\"
@@ -42,6 +110,7 @@ class Const:
     STATIC_MESH_SESSION_SCHEMA_VERSION = "1.0"
     STATIC_MESH_COLLECTION_PREFIX = "UBIO_StaticMesh"
     STATIC_MESH_PROP_SESSION_ID = "ubio_session_id"
+    STATIC_MESH_PROP_ASSET_INDEX = "ubio_session_asset_index"
     STATIC_MESH_PROP_SESSION_DIR = "ubio_session_dir"
     STATIC_MESH_PROP_SESSION_FILE = "ubio_session_file"
     STATIC_MESH_PROP_SOURCE_ASSET_PATH = "ubio_source_asset_path"
@@ -56,6 +125,42 @@ class Const:
     STATIC_MESH_STATUS_FAILED = "FAILED"
 
 
+def get_level_file_path(json_path: str, level_format: str = Const.LEVEL_FORMAT_FBX) -> str:
+    """
+    获取与场景JSON同名的关卡几何文件路径
+    参数：
+        json_path (str): 场景JSON路径
+        level_format (str): Const.LEVEL_FORMAT_FBX 或 Const.LEVEL_FORMAT_USD
+    返回：
+        str: 关卡文件路径；USD格式按Const.USD_EXTENSIONS顺序返回第一个存在的文件，都不存在时返回.usd路径
+    """
+    base_path = os.path.splitext(json_path)[0]
+    if level_format != Const.LEVEL_FORMAT_USD:
+        return base_path + ".fbx"
+    for extension in Const.USD_EXTENSIONS:
+        if os.path.exists(base_path + extension):
+            return base_path + extension
+    return base_path + Const.USD_EXTENSIONS[0]
+
+
+def is_usd_path(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() in Const.USD_EXTENSIONS
+
+
+def get_usd_prim_name(name: str) -> str:
+    """
+    按USD prim命名规则转换名称（非法字符替换为下划线、不能以数字开头），与UE/Blender导出USD时的处理一致
+    参数：
+        name (str): actor名称
+    返回：
+        str: prim名称
+    """
+    prim_name = re.sub(r"[^A-Za-z0-9_]", "_", name)
+    if not prim_name or prim_name[0].isdigit():
+        prim_name = "_" + prim_name
+    return prim_name
+
+
 def get_ubio_temp_dir() -> str:
     return os.path.abspath(os.path.normpath(Const.DEFAULT_IO_TEMP_DIR))
 
@@ -206,6 +311,204 @@ def get_all_children(obj):
     return children
 
 
+def find_layer_collection(layer_coll, collection: bpy.types.Collection):
+    """
+    在view layer的LayerCollection树中查找指定集合对应的LayerCollection
+    参数：
+        layer_coll (bpy.types.LayerCollection): 查找起点（通常为view_layer.layer_collection）
+        collection (bpy.types.Collection): 目标集合
+    返回：
+        bpy.types.LayerCollection or None: 未找到时返回None
+    """
+    if layer_coll.collection == collection:
+        return layer_coll
+    for child in layer_coll.children:
+        found = find_layer_collection(child, collection)
+        if found is not None:
+            return found
+    return None
+
+
+@contextmanager
+def use_active_collection(collection: bpy.types.Collection):
+    """
+    在with块内把指定集合设为当前view layer的活动集合，导入算子新建的对象会直接链接到该集合，
+    不需要事后逐个unlink/link；退出时恢复原来的活动集合
+    参数：
+        collection (bpy.types.Collection): 目标集合
+    返回：
+        bool: 是否切换成功（集合不在当前view layer中或被排除时为False，调用方需自行移动对象）
+    """
+    view_layer = bpy.context.view_layer
+    layer_coll = find_layer_collection(view_layer.layer_collection, collection) if view_layer else None
+    if layer_coll is None or layer_coll.exclude:
+        yield False
+        return
+    previous_layer_coll = view_layer.active_layer_collection
+    view_layer.active_layer_collection = layer_coll
+    try:
+        yield True
+    finally:
+        view_layer.active_layer_collection = previous_layer_coll
+
+
+def get_datablock_snapshot() -> dict:
+    """
+    记录当前文件中可能由UBIO导入创建的datablock，用于导入后找出新增部分
+    返回：
+        dict: bpy.data集合名 -> datablock集合
+    """
+    return {data_type: set(getattr(bpy.data, data_type)) for data_type in Const.OWNED_ID_TYPES}
+
+
+def tag_new_datablocks(snapshot: dict) -> int:
+    """
+    给快照之后新增的datablock打上UBIO所有权标记，清理场景时只删除带标记的数据
+    参数：
+        snapshot (dict): get_datablock_snapshot的返回值
+    返回：
+        int: 标记的datablock数量
+    """
+    tagged_count = 0
+    for data_type, existing_ids in snapshot.items():
+        for datablock in getattr(bpy.data, data_type):
+            if datablock not in existing_ids:
+                datablock[Const.OWNED_ID] = True
+                tagged_count += 1
+    return tagged_count
+
+
+def is_ubio_owned(datablock) -> bool:
+    return datablock is not None and datablock.get(Const.OWNED_ID, False)
+
+
+def get_mesh_geometry_hash(mesh: bpy.types.Mesh) -> str:
+    """
+    通过foreach_get批量读取Mesh的vertex/loop/polygon缓冲区并计算哈希，用于判断几何体是否一致
+    参数：
+        mesh (bpy.types.Mesh): 目标Mesh
+    返回：
+        str: 几何体哈希值
+    """
+    vertex_co = array("f", [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", vertex_co)
+    loop_vertex_index = array("i", [0]) * len(mesh.loops)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_index)
+    polygon_loop_total = array("i", [0]) * len(mesh.polygons)
+    mesh.polygons.foreach_get("loop_total", polygon_loop_total)
+
+    hasher = hashlib.sha1()
+    hasher.update(array("i", [len(vertex_co), len(loop_vertex_index), len(polygon_loop_total)]).tobytes())
+    for buffer in (vertex_co, loop_vertex_index, polygon_loop_total):
+        hasher.update(buffer.tobytes())
+    return hasher.hexdigest()
+
+
+def get_mesh_dedup_hash(mesh: bpy.types.Mesh) -> str:
+    """
+    在get_mesh_geometry_hash基础上加入UV、自定义法线、材质及面材质索引，
+    哈希相同的Mesh可以安全地共用同一个datablock
+    参数：
+        mesh (bpy.types.Mesh): 目标Mesh
+    返回：
+        str: Mesh哈希值
+    """
+    hasher = hashlib.sha1(get_mesh_geometry_hash(mesh).encode("ascii"))
+    loop_count = len(mesh.loops)
+    for uv_layer in mesh.uv_layers:
+        uv_values = array("f", [0.0]) * (loop_count * 2)
+        uv_layer.data.foreach_get("uv", uv_values)
+        hasher.update(uv_layer.name.encode("utf-8"))
+        hasher.update(uv_values.tobytes())
+    if mesh.has_custom_normals:
+        normal_values = array("f", [0.0]) * (loop_count * 3)
+        if hasattr(mesh, "corner_normals"):
+            mesh.corner_normals.foreach_get("vector", normal_values)
+        else:
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get("normal", normal_values)
+        hasher.update(normal_values.tobytes())
+    material_index = array("i", [0]) * len(mesh.polygons)
+    mesh.polygons.foreach_get("material_index", material_index)
+    hasher.update(material_index.tobytes())
+    for material in mesh.materials:
+        hasher.update((material.name if material else "").encode("utf-8") + b"\0")
+    return hasher.hexdigest()
+
+
+@profiled("mesh_dedup")
+def dedup_object_meshes(objs) -> int:
+    """
+    对象之间几何完全一致的Mesh合并为同一个datablock：所有用户重定向到保留的Mesh后删除重复项
+    参数：
+        objs (Iterable[bpy.types.Object]): 需要检查的对象（通常是本次FBX导入的对象）
+    返回：
+        int: 删除的重复Mesh数量
+    """
+    meshes_by_hash = {}
+    kept_meshes = set()
+    duplicate_meshes = {}
+    for obj in objs:
+        if obj.type != "MESH" or obj.data is None:
+            continue
+        mesh = obj.data
+        if mesh in kept_meshes or mesh in duplicate_meshes:
+            continue
+        kept_mesh = meshes_by_hash.setdefault(get_mesh_dedup_hash(mesh), mesh)
+        if kept_mesh is mesh:
+            kept_meshes.add(mesh)
+        else:
+            duplicate_meshes[mesh] = kept_mesh
+    for mesh, kept_mesh in duplicate_meshes.items():
+        mesh.user_remap(kept_mesh)
+    if duplicate_meshes:
+        bpy.data.batch_remove(ids=list(duplicate_meshes))
+    return len(duplicate_meshes)
+
+
+def get_actor_geometry_signature(actor_obj: bpy.types.Object, child_objs) -> tuple:
+    """
+    计算Actor子对象的几何签名：子对象类型、Mesh的get_mesh_dedup_hash（含UV、法线、材质）、
+    对象级材质槽以及相对Actor的局部矩阵；材质覆盖或UV不同的Actor不会共用实例
+    参数：
+        actor_obj (bpy.types.Object): Actor根对象（FBX导入的empty）
+        child_objs (list[bpy.types.Object]): Actor的所有子对象
+    返回：
+        tuple: 可哈希的几何签名，签名相同的Actor可以共用同一个Collection Instance
+    """
+    actor_matrix_inv = actor_obj.matrix_world.inverted()
+    items = []
+    for child in child_objs:
+        local_matrix = actor_matrix_inv @ child.matrix_world
+        matrix_key = tuple(round(value, 4) for row in local_matrix for value in row)
+        mesh_key = get_mesh_dedup_hash(child.data) if child.type == "MESH" else ""
+        slots_key = tuple(
+            (slot.link, slot.material.name if slot.material is not None else "") for slot in child.material_slots
+        )
+        items.append((child.type, mesh_key, slots_key, matrix_key))
+    items.sort()
+    return tuple(items)
+
+
+def get_static_mesh_objects_fingerprint(objs, depsgraph) -> str:
+    """
+    计算一组对象导出为FBX后的几何指纹：求值后Mesh的get_mesh_dedup_hash（顶点、拓扑、UV、法线、材质）
+    加上世界矩阵，与对象名无关
+    参数：
+        objs (Iterable[bpy.types.Object]): StaticMesh会话中同一资产的对象
+        depsgraph (bpy.types.Depsgraph): 用于取得应用修改器后的Mesh
+    返回：
+        str: 指纹，相同表示导出的几何体没有变化
+    """
+    items = []
+    for obj in objs:
+        matrix_key = tuple(round(value, 4) + 0.0 for row in obj.matrix_world for value in row)  # +0.0去掉-0.0
+        mesh_key = get_mesh_dedup_hash(obj.evaluated_get(depsgraph).data) if obj.type == "MESH" else ""
+        items.append((obj.type, mesh_key, matrix_key))
+    items.sort()
+    return hashlib.sha1(repr(items).encode("utf-8")).hexdigest()
+
+
 def find_level_asset_coll(uecoll: str, coll_level: str):
     """
     查找Level Asset Collection
@@ -243,6 +546,145 @@ def set_proxy_pivot_properties(pivot):
     pivot[Const.CUSTOM_VAR] = Const.PROXY_PIVOT
 
 
+# =====================
+# UE/Blender transform批量转换
+# =====================
+# 每行9个float：location xyz + rotation xyz + scale xyz。
+# UE：厘米、角度（0~360）、Y轴与Y/Z旋转取反；Blender：米、弧度。
+# 单个对象的接口也走同一套数组运算，批量场景（导出、增量导入、镜像）直接使用数组接口。
+UE_TRANSFORM_AXIS_SIGNS = np.array((1.0, -1.0, 1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0))
+UE_TRANSFORM_UNIT_SCALES = np.array((100.0,) * 3 + (180.0 / pi,) * 3 + (1.0,) * 3)
+
+
+def read_obj_transform_array(objs) -> np.ndarray:
+    """
+    批量读取对象的location/rotation_euler/scale（Blender空间）
+    参数：
+        objs (bpy_prop_collection or Iterable): 对象集合（如Collection.all_objects）或对象列表；
+            列表中也可以是提供location/rotation_euler/scale的actor记录
+    返回：
+        np.ndarray: (N, 9) 数组
+    """
+    if isinstance(objs, bpy.types.bpy_prop_collection):
+        count = len(objs)
+        values = np.empty((count, 9), dtype=np.float64)
+        buffer = np.empty(count * 3, dtype=np.float32)
+        for offset, attr in ((0, "location"), (3, "rotation_euler"), (6, "scale")):
+            objs.foreach_get(attr, buffer)
+            values[:, offset:offset + 3] = buffer.reshape(count, 3)
+        return values
+    return np.array(
+        [(*obj.location, *obj.rotation_euler, *obj.scale) for obj in objs],
+        dtype=np.float64,
+    ).reshape(-1, 9)
+
+
+def write_obj_transform_array(objs, values: np.ndarray) -> None:
+    """
+    批量写入对象的location/rotation_euler/scale（Blender空间）
+    参数：
+        objs (bpy_prop_collection or Sequence[bpy.types.Object]): 对象集合或对象列表
+        values (np.ndarray): (N, 9) 数组，与objs一一对应
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(-1, 9)
+    if isinstance(objs, bpy.types.bpy_prop_collection):
+        for offset, attr in ((0, "location"), (3, "rotation_euler"), (6, "scale")):
+            objs.foreach_set(attr, values[:, offset:offset + 3].astype(np.float32).ravel())
+        return
+    for obj, row in zip(objs, values.tolist()):
+        obj.location = row[0:3]
+        obj.rotation_euler = row[3:6]
+        obj.scale = row[6:9]
+
+
+def blender_to_ue_transform_array(values: np.ndarray) -> np.ndarray:
+    """
+    Blender空间transform数组转换为UE空间（与flatten_ue_transform的展开顺序一致）
+    参数：
+        values (np.ndarray): (N, 9) Blender空间数组
+    返回：
+        np.ndarray: (N, 9) UE空间数组，旋转取模到0~360后再按轴取反
+    """
+    ue_values = np.asarray(values, dtype=np.float64).reshape(-1, 9) * UE_TRANSFORM_UNIT_SCALES
+    ue_values[:, 3:6] %= 360.0
+    ue_values *= UE_TRANSFORM_AXIS_SIGNS
+    return ue_values
+
+
+def ue_to_blender_transform_array(ue_values: np.ndarray) -> np.ndarray:
+    """
+    UE空间transform数组转换为Blender空间
+    参数：
+        ue_values (np.ndarray): (N, 9) UE空间数组
+    返回：
+        np.ndarray: (N, 9) Blender空间数组
+    """
+    return np.asarray(ue_values, dtype=np.float64).reshape(-1, 9) * UE_TRANSFORM_AXIS_SIGNS / UE_TRANSFORM_UNIT_SCALES
+
+
+def ue_transform_array_to_dicts(ue_values: np.ndarray) -> list:
+    """
+    UE空间transform数组转换为JSON中的transform字典列表
+    参数：
+        ue_values (np.ndarray): (N, 9) UE空间数组
+    返回：
+        list[dict]: 包含location/rotation/scale的transform字典
+    """
+    return [
+        {
+            "location": {"x": row[0], "y": row[1], "z": row[2]},
+            "rotation": {"x": row[3], "y": row[4], "z": row[5]},
+            "scale": {"x": row[6], "y": row[7], "z": row[8]},
+        }
+        for row in np.asarray(ue_values).reshape(-1, 9).tolist()
+    ]
+
+
+def ue_transform_dicts_to_array(transforms) -> np.ndarray:
+    """
+    JSON中的transform字典批量展开为UE空间数组
+    参数：
+        transforms (Iterable[dict]): UE风格transform字典
+    返回：
+        np.ndarray: (N, 9) UE空间数组
+    """
+    return np.array([flatten_ue_transform(transform) for transform in transforms], dtype=np.float64).reshape(-1, 9)
+
+
+def get_ue_transform_array(objs) -> np.ndarray:
+    """
+    批量获取对象的UE空间transform数组
+    参数：
+        objs (bpy_prop_collection or Iterable): 同read_obj_transform_array
+    返回：
+        np.ndarray: (N, 9) UE空间数组
+    """
+    return blender_to_ue_transform_array(read_obj_transform_array(objs))
+
+
+def get_transforms_from_objs(objs) -> list:
+    """
+    批量获取对象的UE风格transform字典
+    参数：
+        objs (bpy_prop_collection or Iterable): 同read_obj_transform_array
+    返回：
+        list[dict]: 与objs一一对应的transform字典
+    """
+    return ue_transform_array_to_dicts(get_ue_transform_array(objs))
+
+
+def set_actor_transforms(objs, transforms) -> None:
+    """
+    批量设置对象transform，自动处理UE/Blender坐标系转换
+    参数：
+        objs (bpy_prop_collection or Sequence[bpy.types.Object]): 目标对象
+        transforms (Iterable[dict] or np.ndarray): UE风格transform字典，或(N, 9) UE空间数组
+    """
+    if not isinstance(transforms, np.ndarray):
+        transforms = ue_transform_dicts_to_array(transforms)
+    write_obj_transform_array(objs, ue_to_blender_transform_array(transforms))
+
+
 def get_transform_from_obj(obj):
     """
     从Blender对象获取UE风格的transform字典（自动处理坐标/角度/缩放转换）
@@ -251,27 +693,19 @@ def get_transform_from_obj(obj):
     返回：
         dict: 包含location/rotation/scale的UE风格transform字典
     """
-    loc = obj.location * 100
-    rot = obj.rotation_euler
-    rot_deg = [((r * 180.0 / pi) % 360) for r in rot]
-    scale = obj.scale
-    return {
-        "location": {
-            "x": loc.x,
-            "y": -loc.y,
-            "z": loc.z
-        },
-        "rotation": {
-            "x": rot_deg[0],
-            "y": -rot_deg[1],
-            "z": -rot_deg[2]
-        },
-        "scale": {
-            "x": scale.x,
-            "y": scale.y,
-            "z": scale.z
-        }
-    }
+    return get_transforms_from_objs((obj,))[0]
+
+
+def get_blender_transform_from_ue(transform):
+    """
+    把UE风格transform字典转换为Blender空间的location/rotation/scale
+    参数：
+        transform (dict): UE风格transform字典（包含location/rotation/scale）
+    返回：
+        (Vector, tuple, Vector): location（米）、rotation_euler（弧度）、scale
+    """
+    row = ue_to_blender_transform_array(flatten_ue_transform(transform))[0].tolist()
+    return Vector(row[0:3]), tuple(row[3:6]), Vector(row[6:9])
 
 
 def set_actor_transform(obj, transform):
@@ -283,17 +717,7 @@ def set_actor_transform(obj, transform):
     返回：
         无
     """
-
-    loc = transform["location"]
-    rot = transform["rotation"]
-    scale = transform["scale"]
-    obj.location = Vector((loc["x"]/100, -loc["y"]/100, loc["z"]/100))
-    obj.rotation_euler = (
-        radians(rot["x"]),
-        -radians(rot["y"]),
-        -radians(rot["z"])
-    )
-    obj.scale = Vector((scale["x"], scale["y"], scale["z"]))
+    set_actor_transforms((obj,), (transform,))
 
 
 def is_obj_transform_equal(obj, transform, tol=0.01):
@@ -316,6 +740,221 @@ def is_obj_transform_equal(obj, transform, tol=0.01):
     return True
 
 
+def get_actor_key_from_obj(obj) -> tuple:
+    """
+    生成Blender对象对应的Actor匹配键
+    参数：
+        obj (bpy.types.Object): 目标对象
+    返回：
+        tuple: (name, actor_type, fname, guid) 四元组
+    """
+    return (
+        obj.name,
+        str(obj.get(Const.ACTORTYPE, "")),
+        str(obj.get(Const.FNAME, "")),
+        str(obj.get(Const.GUID, "")),
+    )
+
+
+def get_actor_key_from_dict(actor: dict) -> tuple:
+    """
+    生成UE JSON中actor记录对应的匹配键，与get_actor_key_from_obj一一对应
+    参数：
+        actor (dict): UE actor信息字典
+    返回：
+        tuple: (name, actor_type, fname, guid) 四元组
+    """
+    return (
+        str(actor.get("name")),
+        str(actor.get("actor_type")),
+        str(actor.get("fname")),
+        str(actor.get("fguid")),
+    )
+
+
+def is_syncable_actor_obj(obj) -> bool:
+    """
+    判断对象是否是可以同步回UE的actor（有fname且类型受支持）
+    """
+    return bool(obj.get(Const.FNAME, None)) and obj.get(Const.ACTORTYPE, "") in Const.SYNC_ACTOR_TYPES
+
+
+def build_actor_record(obj, transform: dict) -> dict:
+    """
+    生成与UE场景JSON一致的actor记录（导出JSON与实时同步共用）
+    参数：
+        obj (bpy.types.Object or PointInstanceRecord): actor对象
+        transform (dict): UE风格transform字典
+    返回：
+        dict: actor记录
+    """
+    return {
+        "name": obj.name,
+        "actor_type": obj.get(Const.ACTORTYPE, ""),
+        "fname": obj.get(Const.FNAME, ""),
+        "fguid": str(obj.get(Const.GUID, "")),
+        "class": obj.get(Const.ACTORCLASS, ""),
+        "transform": transform,
+    }
+
+
+def build_actor_obj_index(objs) -> dict:
+    """
+    单次遍历建立Actor匹配键到Blender对象的索引，键冲突时保留第一个对象
+    参数：
+        objs (Iterable[bpy.types.Object]): 需要建立索引的对象
+    返回：
+        dict: 匹配键 -> bpy.types.Object
+    """
+    index = {}
+    for obj in objs:
+        index.setdefault(get_actor_key_from_obj(obj), obj)
+    return index
+
+
+class UniqueNameAllocator:
+    """
+    Blender对象名称分配器：缓存已占用名称与每个基础名的下一个后缀，
+    避免每个候选后缀都去探测一次bpy.data.objects
+    """
+
+    def __init__(self, existing_names):
+        """
+        参数：
+            existing_names (Iterable[str]): 当前已占用的名称
+        """
+        self._used_names = set(existing_names)
+        self._next_suffix = {}
+
+    def allocate(self, base_name: str) -> str:
+        """
+        分配一个未被占用的名称，规则与原先的 `{base_name}_{idx}` 探测一致
+        参数：
+            base_name (str): 期望使用的名称
+        返回：
+            str: 可用名称（已登记为占用）
+        """
+        if base_name not in self._used_names:
+            self._used_names.add(base_name)
+            return base_name
+        idx = self._next_suffix.get(base_name, 1)
+        new_name = f"{base_name}_{idx}"
+        while new_name in self._used_names:
+            idx += 1
+            new_name = f"{base_name}_{idx}"
+        self._next_suffix[base_name] = idx + 1
+        self._used_names.add(new_name)
+        return new_name
+
+    def register(self, name: str) -> None:
+        """
+        登记一个额外被占用的名称（例如Blender实际赋予的名称）
+        参数：
+            name (str): 已占用名称
+        """
+        self._used_names.add(name)
+
+
+def get_actor_region_bounds(actor: dict) -> tuple:
+    """
+    获取actor在Blender空间（米）中的轴对齐包围盒；没有bounds时退化为actor位置
+    参数：
+        actor (dict): UE actor信息
+    返回：
+        (tuple, tuple): 包围盒最小点与最大点
+    """
+    bounds = actor.get("bounds", None)
+    if bounds:
+        origin = bounds["origin"]
+        extent = bounds["extent"]
+        center = (origin["x"] / 100, -origin["y"] / 100, origin["z"] / 100)
+        half_size = (abs(extent["x"]) / 100, abs(extent["y"]) / 100, abs(extent["z"]) / 100)
+    else:
+        location = actor.get("transform", {}).get("location", {})
+        center = (location.get("x", 0.0) / 100, -location.get("y", 0.0) / 100, location.get("z", 0.0) / 100)
+        half_size = (0.0, 0.0, 0.0)
+    return (
+        tuple(c - h for c, h in zip(center, half_size)),
+        tuple(c + h for c, h in zip(center, half_size)),
+    )
+
+
+def is_actor_in_region(actor: dict, region_min, region_max) -> bool:
+    """
+    判断actor的包围盒（或位置）是否与区域相交
+    参数：
+        actor (dict): UE actor信息
+        region_min (Sequence[float]): 区域最小点（Blender空间，米）
+        region_max (Sequence[float]): 区域最大点（Blender空间，米）
+    返回：
+        bool: 是否在区域内
+    """
+    actor_min, actor_max = get_actor_region_bounds(actor)
+    return all(actor_min[i] <= region_max[i] and actor_max[i] >= region_min[i] for i in range(3))
+
+
+def flatten_ue_transform(transform: dict) -> list:
+    """
+    把UE风格transform字典展开为9个float，便于作为ID属性保存和比较
+    参数：
+        transform (dict): UE风格transform字典（包含location/rotation/scale）
+    返回：
+        list[float]: location xyz + rotation xyz + scale xyz
+    """
+    values = []
+    for key, default in (("location", 0.0), ("rotation", 0.0), ("scale", 1.0)):
+        part = transform.get(key, {})
+        values.extend(float(part.get(axis, default)) for axis in ("x", "y", "z"))
+    return values
+
+
+def are_flat_transforms_close(values_a, values_b, tol=0.01) -> np.ndarray:
+    """
+    逐行判断两组展开后的UE transform是否近似相等，旋转按360度取模比较
+    参数：
+        values_a (np.ndarray): (N, 9) UE空间数组，无同步记录的行可填NaN（视为不相等）
+        values_b (np.ndarray): (N, 9) UE空间数组
+        tol (float): 容差，默认0.01
+    返回：
+        np.ndarray: (N,) bool数组
+    """
+    diff = np.abs(np.asarray(values_a, dtype=np.float64) - np.asarray(values_b, dtype=np.float64)).reshape(-1, 9)
+    rotation_diff = diff[:, 3:6] % 360.0
+    diff[:, 3:6] = np.minimum(rotation_diff, 360.0 - rotation_diff)
+    return np.all(diff < tol, axis=1)
+
+
+def get_actor_id(actor: dict) -> str:
+    """
+    获取actor在多次导出之间稳定的ID：优先使用fguid，无效时退回fname
+    参数：
+        actor (dict): UE actor信息字典
+    返回：
+        str: actor ID
+    """
+    return _build_actor_id(actor.get("fguid", ""), actor.get("fname", ""))
+
+
+def get_actor_id_from_obj(obj) -> str:
+    """
+    获取Blender对象对应的actor ID，规则与get_actor_id一致
+    参数：
+        obj (bpy.types.Object): 目标对象
+    返回：
+        str: actor ID，非UBIO actor返回空字符串
+    """
+    if Const.FNAME not in obj:
+        return ""
+    return _build_actor_id(obj.get(Const.GUID, ""), obj.get(Const.FNAME, ""))
+
+
+def _build_actor_id(guid, fname) -> str:
+    guid = str(guid or "")
+    if guid.strip("0-") and guid != "None":
+        return guid
+    return f"fname:{fname}"
+
+
 def copy_unreal_assets(source_dir: str, target_dir: str):
     """将UnrealAsset目录下的内容复制到UE工程目录下。
     参数：
@@ -361,7 +1000,253 @@ def get_static_mesh_edited_fbx(session_dir: str) -> str:
     return os.path.join(session_dir, Const.STATIC_MESH_EDITED_FBX)
 
 
+# =====================
+# 交换目录清单（与UE脚本一致）
+# =====================
+# 清单是交换目录根下的JSONL文件，只追加：每行一条 {id, type, status, source, timestamp, paths, timestamps}，
+# 同一id的后续记录覆盖之前的字段。查找最新导出时倒序读取文件尾部，会话列表只需读取这一个小文件，
+# 不再遍历会话目录；清单不存在时退回目录扫描。文件超过Const.MANIFEST_COMPACT_BYTES时合并重写：
+# 两端追加（以及必要时合并）前都先创建锁文件，合并替换清单时不会有另一端正往旧文件追加；
+# 替换前还会把读取之后追加的行接在合并结果后面，兜底等锁超时后仍直接追加的一端。
+MANIFEST_PRIMARY_PATH_KEYS = {Const.MANIFEST_TYPE_SCENE: "json", Const.MANIFEST_TYPE_SESSION: "session_file"}
+
+
+def get_manifest_path(exchange_dir: str = Const.DEFAULT_IO_TEMP_DIR) -> str:
+    return os.path.join(exchange_dir, Const.MANIFEST_FILE)
+
+
+def get_manifest_lock_path(manifest_path: str) -> str:
+    return os.path.join(os.path.dirname(manifest_path), Const.MANIFEST_LOCK_FILE)
+
+
+def get_manifest_primary_path(record: dict) -> str:
+    return record.get("paths", {}).get(MANIFEST_PRIMARY_PATH_KEYS.get(record.get("type"), ""), "")
+
+
+def parse_manifest_lines(data: bytes, skip_first_line: bool = False) -> list:
+    """
+    把清单内容解析为记录
+    参数：
+        data (bytes): 清单内容
+        skip_first_line (bool): 从文件中间开始读取时第一行可能不完整，需要丢弃
+    返回：
+        list[dict]: 记录（按追加顺序）
+    """
+    lines = data.split(b"\n")
+    if skip_first_line:
+        lines = lines[1:]
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line.decode("utf-8")))
+        except ValueError:
+            continue  # 另一端正在写入的行
+    return records
+
+
+def read_manifest_records(manifest_path: str = None, tail_bytes: int = None) -> list:
+    """
+    读取清单记录（按追加顺序）
+    参数：
+        manifest_path (str or None): 清单路径，默认为交换目录下的清单
+        tail_bytes (int or None): 只读取文件末尾的字节数，None表示读取整个文件
+    返回：
+        list[dict]: 记录；清单不存在时返回空列表
+    """
+    manifest_path = manifest_path or get_manifest_path()
+    try:
+        with open(manifest_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - tail_bytes) if tail_bytes else 0
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return []
+    return parse_manifest_lines(data, start > 0)
+
+
+def fold_manifest_records(records) -> dict:
+    """
+    按id合并记录，后写入的字段覆盖之前的字段（paths/timestamps逐项合并）
+    参数：
+        records (Iterable[dict]): 按追加顺序的记录
+    返回：
+        dict: id -> 合并后的记录，按最后一次写入的顺序排列
+    """
+    folded = {}
+    for record in records:
+        record_id = record.get("id")
+        if not record_id:
+            continue
+        merged = folded.pop(record_id, {})
+        for key in ("paths", "timestamps"):
+            if key in merged:
+                record = dict(record, **{key: dict(merged[key], **record.get(key, {}))})
+        merged.update(record)
+        folded[record_id] = merged
+    return folded
+
+
+def append_manifest_record(
+    record_type: str,
+    record_id: str,
+    status: str,
+    paths: dict,
+    timestamps: dict = None,
+    manifest_path: str = None,
+) -> None:
+    """
+    向清单追加一条记录；单次write写入整行，另一端读取时不会看到半行
+    参数：
+        record_type (str): Const.MANIFEST_TYPE_SCENE 或 Const.MANIFEST_TYPE_SESSION
+        record_id (str): 场景文件名或会话ID
+        status (str): 状态
+        paths (dict): 相关文件路径（场景为json/level，会话为session_file/source_fbx/edited_fbx）
+        timestamps (dict or None): 会话时间戳
+        manifest_path (str or None): 清单路径
+    """
+    manifest_path = manifest_path or get_manifest_path()
+    record = {
+        "id": record_id,
+        "type": record_type,
+        "status": status,
+        "source": "Blender",
+        "timestamp": get_iso_timestamp(),
+        "paths": paths,
+    }
+    if timestamps:
+        record["timestamps"] = timestamps
+    ensure_directory(os.path.dirname(manifest_path))
+    # 追加与合并都在锁内进行：合并替换清单时不会有另一端正往旧文件追加。
+    # 等待超时（另一端卡住但锁还未过期）时不合并，仍然追加这一行
+    is_locked = acquire_manifest_lock(manifest_path, Const.MANIFEST_LOCK_WAIT_SECONDS)
+    try:
+        if is_locked:
+            try:
+                if os.path.getsize(manifest_path) > Const.MANIFEST_COMPACT_BYTES:
+                    compact_manifest(manifest_path)
+            except OSError:
+                pass
+        with open(manifest_path, "a", encoding="utf-8") as f:
+            f.write(dump_json_compact(record) + "\n")
+    finally:
+        if is_locked:
+            release_manifest_lock(manifest_path)
+
+
+def acquire_manifest_lock(manifest_path: str, wait_seconds: float = 0.0) -> bool:
+    """
+    创建清单锁文件（O_EXCL，两端只有一方能创建成功）；锁被占用时每Const.MANIFEST_LOCK_POLL_SECONDS重试，
+    超过Const.MANIFEST_LOCK_STALE_SECONDS的锁视为残留并接管
+    参数：
+        manifest_path (str): 清单路径
+        wait_seconds (float): 最多等待的秒数
+    返回：
+        bool: 是否拿到锁
+    """
+    lock_path = get_manifest_lock_path(manifest_path)
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) >= Const.MANIFEST_LOCK_STALE_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                pass  # 锁刚被另一端释放，下一轮重试
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(Const.MANIFEST_LOCK_POLL_SECONDS)
+
+
+def release_manifest_lock(manifest_path: str) -> None:
+    try:
+        os.remove(get_manifest_lock_path(manifest_path))
+    except OSError:
+        pass
+
+
+def compact_manifest(manifest_path: str = None) -> None:
+    """
+    合并同一id的记录并去掉文件已不存在的记录，原子替换清单；调用方需持有清单锁。
+    替换前把读取之后追加的完整行（等锁超时的追加方写入的）接在合并结果后面
+    """
+    manifest_path = manifest_path or get_manifest_path()
+    with open(manifest_path, "rb") as f:
+        data = f.read()
+    data = data[: data.rfind(b"\n") + 1]  # 最后一行可能还没写完，留给下面的尾部合并
+    folded = fold_manifest_records(parse_manifest_lines(data))
+    with open_atomic(manifest_path) as f:
+        for record in folded.values():
+            if os.path.exists(get_manifest_primary_path(record)):
+                f.write(dump_json_compact(record) + "\n")
+        with open(manifest_path, "rb") as src:
+            src.seek(len(data))
+            tail = src.read()
+        f.write(tail[: tail.rfind(b"\n") + 1].decode("utf-8"))
+
+
+def find_latest_manifest_path(record_type: str, manifest_path: str = None):
+    """
+    从清单中找出某类最新的、文件仍存在的导出；先只读文件尾部，找不到再读整个文件
+    参数：
+        record_type (str): Const.MANIFEST_TYPE_SCENE 或 Const.MANIFEST_TYPE_SESSION
+        manifest_path (str or None): 清单路径
+    返回：
+        str or None: 记录的主文件路径
+    """
+    for tail_bytes in (Const.MANIFEST_TAIL_BYTES, None):
+        for record in reversed(read_manifest_records(manifest_path, tail_bytes)):
+            if record.get("type") != record_type:
+                continue
+            primary_path = get_manifest_primary_path(record)
+            if primary_path and os.path.isfile(primary_path):
+                return primary_path
+    return None
+
+
+def find_latest_scene_json(directory: str):
+    """
+    找出交换目录中最新的场景JSON：优先查清单，清单不存在时用一次os.scandir
+    （stat信息来自目录项，不逐个调用getmtime）
+    参数：
+        directory (str): 交换目录
+    返回：
+        str or None: 最新JSON的路径，没有JSON时返回None
+    """
+    manifest_path = get_manifest_path(directory)
+    if os.path.exists(manifest_path):
+        latest_json = find_latest_manifest_path(Const.MANIFEST_TYPE_SCENE, manifest_path)
+        if latest_json is not None:
+            return latest_json
+    latest = None
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.lower().endswith(".json") and entry.is_file():
+                mtime_ns = entry.stat().st_mtime_ns
+                if latest is None or mtime_ns > latest[0]:
+                    latest = (mtime_ns, entry.path)
+    return latest[1] if latest is not None else None
+
+
 def list_static_mesh_session_files():
+    manifest_path = get_manifest_path()
+    if os.path.exists(manifest_path):
+        folded = fold_manifest_records(read_manifest_records(manifest_path))
+        session_files = [
+            get_manifest_primary_path(record)
+            for record in reversed(list(folded.values()))
+            if record.get("type") == Const.MANIFEST_TYPE_SESSION
+        ]
+        session_files = [session_file for session_file in session_files if session_file and os.path.isfile(session_file)]
+        if session_files:
+            return session_files
+
     session_root = Const.STATIC_MESH_SESSION_DIR
     if not os.path.isdir(session_root):
         return []
@@ -379,6 +1264,9 @@ def list_static_mesh_session_files():
 
 
 def find_latest_static_mesh_session_file():
+    latest_session_file = find_latest_manifest_path(Const.MANIFEST_TYPE_SESSION)
+    if latest_session_file is not None:
+        return latest_session_file
     session_files = list_static_mesh_session_files()
     if not session_files:
         return None
@@ -390,9 +1278,70 @@ def load_json_file(file_path: str):
         return json.load(f)
 
 
-def save_json_file(file_path: str, data: dict) -> None:
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+@contextmanager
+def open_atomic(file_path: str, mode: str = "w"):
+    """
+    原子写文件：内容先写入同目录的临时文件，成功后用os.replace替换目标文件，
+    轮询共享目录的另一端不会读到写了一半的文件；写入失败时删除临时文件并保留原文件
+    参数：
+        file_path (str): 目标文件路径
+        mode (str): "w"（UTF-8文本）或"wb"
+    返回：
+        ContextManager[IO]: 临时文件对象
+    """
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    encoding = None if "b" in mode else "utf-8"
+    try:
+        with open(temp_path, mode, encoding=encoding) as f:
+            yield f
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def round_json_floats(value, precision: int = None):
+    """
+    递归地把JSON数据中的float按精度取整，减小文件体积
+    参数：
+        value: JSON数据（dict/list/标量）
+        precision (int or None): 保留的小数位数，None表示不处理
+    返回：
+        取整后的数据（dict/list会生成新对象）
+    """
+    if precision is None:
+        return value
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, dict):
+        return {key: round_json_floats(item, precision) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_json_floats(item, precision) for item in value]
+    return value
+
+
+def dump_json_compact(data, precision: int = None) -> str:
+    """
+    序列化为紧凑JSON（无缩进、无多余空格）
+    参数：
+        data: JSON数据
+        precision (int or None): float保留的小数位数，None表示原样输出
+    返回：
+        str: JSON文本
+    """
+    return json.dumps(round_json_floats(data, precision), ensure_ascii=False, separators=(",", ":"))
+
+
+def save_json_file(file_path: str, data: dict, precision: int = None) -> None:
+    """
+    以紧凑格式原子写入JSON文件
+    参数：
+        file_path (str): 目标文件路径
+        data (dict): JSON数据
+        precision (int or None): float保留的小数位数，None表示原样输出
+    """
+    with open_atomic(file_path) as f:
+        f.write(dump_json_compact(data, precision))
 
 
 def load_static_mesh_session(session_file: str):
@@ -404,9 +1353,34 @@ def load_static_mesh_session(session_file: str):
     session_data["paths"].setdefault("source_fbx", get_static_mesh_source_fbx(session_dir))
     session_data["paths"].setdefault("edited_fbx", get_static_mesh_edited_fbx(session_dir))
     session_data.setdefault("timestamps", {})
+    session_data["assets"] = get_static_mesh_session_assets(session_data)
     return session_data
 
 
+def get_static_mesh_session_assets(session_data: dict) -> list:
+    """
+    返回会话中的资产列表（与UE脚本一致）
+    参数：
+        session_data (dict): 会话数据
+    返回：
+        list[dict]: 每个资产的asset_name/asset_path/source_actor/source_fbx/edited_fbx；
+            没有assets的旧会话视为单资产会话
+    """
+    assets = session_data.get("assets")
+    if assets:
+        return assets
+    paths = session_data.get("paths", {})
+    source_asset = session_data.get("source_asset", {})
+    return [{
+        "asset_name": source_asset.get("asset_name", ""),
+        "asset_path": source_asset.get("asset_path", ""),
+        "selection_source": session_data.get("selection_source", ""),
+        "source_actor": dict(session_data.get("source_actor", {})),
+        "source_fbx": paths.get("source_fbx", ""),
+        "edited_fbx": paths.get("edited_fbx", ""),
+    }]
+
+
 def save_static_mesh_session(session_file: str, session_data: dict) -> None:
     session_dir = os.path.dirname(session_file)
     session_data.setdefault("paths", {})
@@ -417,6 +1391,13 @@ def save_static_mesh_session(session_file: str, session_data: dict) -> None:
         "edited_fbx", get_static_mesh_edited_fbx(session_dir)
     )
     save_json_file(session_file, session_data)
+    append_manifest_record(
+        Const.MANIFEST_TYPE_SESSION,
+        str(session_data.get("session_id") or os.path.basename(session_dir)),
+        session_data.get("status", ""),
+        dict(session_data["paths"], session_file=session_file),
+        session_data.get("timestamps", {}),
+    )
 
 
 def update_static_mesh_session_status(
@@ -435,26 +1416,44 @@ def build_static_mesh_collection_name(session_data: dict) -> str:
         or session_data.get("session_id")
         or "StaticMesh"
     )
+    asset_count = len(session_data.get("assets") or ())
+    if asset_count > 1:
+        asset_name = f"Batch{asset_count}_{asset_name}"
     session_suffix = str(session_data.get("session_id", "session"))[-8:]
     return f"{Const.STATIC_MESH_COLLECTION_PREFIX}_{asset_name}_{session_suffix}"
 
 
+def build_static_mesh_asset_collection_name(session_data: dict, asset_index: int) -> str:
+    asset = get_static_mesh_session_assets(session_data)[asset_index]
+    asset_name = asset.get("asset_name") or f"Asset{asset_index}"
+    session_suffix = str(session_data.get("session_id", "session"))[-8:]
+    return f"{Const.STATIC_MESH_COLLECTION_PREFIX}_{asset_index:02d}_{asset_name}_{session_suffix}"
+
+
 def apply_static_mesh_session_metadata(
     target,
     session_file: str,
     session_data: dict,
     collection_name: str = "",
+    asset_index: int = None,
 ) -> None:
     session_dir = os.path.dirname(session_file)
     target[Const.STATIC_MESH_PROP_SESSION_ID] = session_data.get("session_id", "")
     target[Const.STATIC_MESH_PROP_SESSION_DIR] = session_dir
     target[Const.STATIC_MESH_PROP_SESSION_FILE] = session_file
-    target[Const.STATIC_MESH_PROP_SOURCE_ASSET_PATH] = session_data.get(
-        "source_asset", {}
-    ).get("asset_path", "")
-    target[Const.STATIC_MESH_PROP_SOURCE_ACTOR_GUID] = session_data.get(
-        "source_actor", {}
-    ).get("guid", "")
+    if asset_index is not None:
+        # 批量会话中的对象记录自己来自哪个资产
+        asset = get_static_mesh_session_assets(session_data)[asset_index]
+        target[Const.STATIC_MESH_PROP_ASSET_INDEX] = asset_index
+        target[Const.STATIC_MESH_PROP_SOURCE_ASSET_PATH] = asset.get("asset_path", "")
+        target[Const.STATIC_MESH_PROP_SOURCE_ACTOR_GUID] = asset.get("source_actor", {}).get("guid", "")
+    else:
+        target[Const.STATIC_MESH_PROP_SOURCE_ASSET_PATH] = session_data.get(
+            "source_asset", {}
+        ).get("asset_path", "")
+        target[Const.STATIC_MESH_PROP_SOURCE_ACTOR_GUID] = session_data.get(
+            "source_actor", {}
+        ).get("guid", "")
     target[Const.STATIC_MESH_PROP_ROUNDTRIP_TYPE] = Const.STATIC_MESH_ROUNDTRIP_TYPE
     if collection_name:
         target[Const.STATIC_MESH_PROP_COLLECTION] = collection_name
@@ -465,12 +1464,3 @@ def get_static_mesh_session_file_from_object(obj: bpy.types.Object):
         return None
     return obj.get(Const.STATIC_MESH_PROP_SESSION_FILE)
 
-
-def find_static_mesh_session_objects(session_id: str):
-    if not session_id:
-        return []
-    matched = []
-    for obj in bpy.data.objects:
-        if obj.get(Const.STATIC_MESH_PROP_SESSION_ID) == session_id:
-            matched.append(obj)
-    return matched